@@ -0,0 +1,114 @@
+"""
+Construction throughput of validators decoded from the getStateValidators response.
+
+Compares the current response dataclasses with the previous implementation, that looked up dataclass fields
+for every object and kept instance __dict__.
+
+Run from the repository root:
+    python -m benchmarks.dataclasses_construction --count 1000000
+"""
+import argparse
+import sys
+import time
+from dataclasses import dataclass, fields, is_dataclass
+from types import GenericAlias
+from typing import Callable, Self
+
+from src.providers.consensus.typings import Validator
+
+
+@dataclass
+class LegacyNested:
+    def __post_init__(self):
+        for field in fields(self):
+            if isinstance(field.type, GenericAlias):
+                field_type = field.type.__args__[0]
+                if is_dataclass(field_type):
+                    factory = self.get_dataclass_factory(field_type)
+                    setattr(self, field.name,
+                            field.type.__origin__(map(
+                                lambda x: factory(**x) if not is_dataclass(x) else x,
+                                getattr(self, field.name))))
+            elif is_dataclass(field.type) and not is_dataclass(getattr(self, field.name)):
+                factory = self.get_dataclass_factory(field.type)
+                setattr(self, field.name, factory(**getattr(self, field.name)))
+
+    @staticmethod
+    def get_dataclass_factory(field_type):
+        if issubclass(field_type, LegacyFromResponse):
+            return field_type.from_response
+        return field_type
+
+
+@dataclass
+class LegacyFromResponse:
+    @classmethod
+    def from_response(cls, **kwargs) -> Self:
+        class_field_names = [field.name for field in fields(cls)]
+        return cls(**{k: v for k, v in kwargs.items() if k in class_field_names})
+
+
+@dataclass
+class LegacyValidatorState(LegacyFromResponse):
+    pubkey: str
+    withdrawal_credentials: str
+    effective_balance: str
+    slashed: bool
+    activation_eligibility_epoch: str
+    activation_epoch: str
+    exit_epoch: str
+    withdrawable_epoch: str
+
+
+@dataclass
+class LegacyValidator(LegacyNested, LegacyFromResponse):
+    index: str
+    balance: str
+    status: str
+    validator: LegacyValidatorState
+
+
+def build_response(index: int) -> dict:
+    return {
+        'index': str(index),
+        'balance': '32000000000',
+        'status': 'active_ongoing',
+        'validator': {
+            'pubkey': '0x' + f'{index:096x}',
+            'withdrawal_credentials': '0x01' + '00' * 31,
+            'effective_balance': '32000000000',
+            'slashed': False,
+            'activation_eligibility_epoch': '0',
+            'activation_epoch': '0',
+            'exit_epoch': '18446744073709551615',
+            'withdrawable_epoch': '18446744073709551615',
+        },
+    }
+
+
+def get_size(record) -> int:
+    return sys.getsizeof(record) + (sys.getsizeof(record.__dict__) if hasattr(record, '__dict__') else 0)
+
+
+def measure(name: str, factory: Callable, responses: list[dict]) -> None:
+    start = time.perf_counter()
+    records = [factory(**response) for response in responses]
+    duration = time.perf_counter() - start
+
+    record_size = get_size(records[0]) + get_size(records[0].validator)
+    print(f'{name:<8} {len(records) / duration:>12,.0f} records/s {duration:>8.2f} s {record_size:>6} bytes/record')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    responses = [build_response(index) for index in range(args.count)]
+
+    measure('legacy', LegacyValidator.from_response, responses)
+    measure('current', Validator.from_response, responses)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Duration of ExitOrderIterator for the large queue of exitable validators.
+
+Compares the heap based iterator with the previous implementation, that sorted the whole queue
+and popped the first validator on every iteration. Both iterators must give the same validators in the same order.
+
+Run from the repository root:
+    python -m benchmarks.exit_order_iterator --validators 300000 --operators 600 --max-validators-to-exit 1000
+"""
+import argparse
+import copy
+import random
+import time
+
+from src.providers.consensus.typings import ValidatorState
+from src.providers.keys.typings import CatalistKey
+from src.services.exit_order_iterator import ExitOrderIterator
+from src.services.exit_order_iterator_state import NodeOperatorPredictableState
+from src.typings import EpochNumber
+from src.web3py.extensions.catalist_validators import CatalistValidator, NodeOperatorId, StakingModuleId
+
+MODULES_COUNT = 3
+REF_EPOCH = EpochNumber(200_000)
+
+
+class LegacyExitOrderIterator(ExitOrderIterator):
+    def __next__(self):
+        if self.left_queue_count >= self.max_validators_to_exit:
+            raise StopIteration
+
+        if not self.exitable_catalist_validators:
+            raise StopIteration
+
+        self.exitable_catalist_validators.sort(key=self._predicates)
+        to_exit = self.exitable_catalist_validators.pop(0)
+        global_index = self._decrease_node_operator_stats(to_exit)
+        self.left_queue_count += 1
+        return global_index, to_exit
+
+
+class _BlockStamp:
+    ref_epoch = REF_EPOCH
+
+
+def build_validator(module_address: str, operator: int, index: int) -> CatalistValidator:
+    validator = object.__new__(CatalistValidator)
+    validator.catalist_id = object.__new__(CatalistKey)
+    validator.validator = object.__new__(ValidatorState)
+    validator.catalist_id.moduleAddress = module_address
+    validator.catalist_id.operatorIndex = operator
+    validator.index = str(index)
+    validator.validator.activation_epoch = str(random.randint(0, REF_EPOCH))
+    return validator
+
+
+def build_iterator(
+    iterator_class: type[ExitOrderIterator],
+    validators_count: int,
+    operators_count: int,
+    max_validators_to_exit: int,
+    seed: int,
+) -> ExitOrderIterator:
+    random.seed(seed)
+
+    operators = [(module, operator) for module in range(MODULES_COUNT) for operator in range(operators_count // MODULES_COUNT)]
+    # A few large operators and a long tail of small ones
+    weights = [random.paretovariate(1.2) for _ in operators]
+
+    indexes = random.sample(range(validators_count * 4), validators_count)
+    validators = []
+    for index, (module, operator) in zip(indexes, random.choices(operators, weights, k=validators_count)):
+        validators.append(build_validator(f'0x{module}', operator, index))
+
+    stats = {}
+    for validator in validators:
+        global_index = (StakingModuleId(int(validator.catalist_id.moduleAddress[2:])), NodeOperatorId(validator.catalist_id.operatorIndex))
+        state = stats.setdefault(global_index, NodeOperatorPredictableState(0, 0, random.random() < 0.1, random.randint(0, 100), 0))
+        state.predictable_validators_count += 1
+        state.predictable_validators_total_age += REF_EPOCH - int(validator.validator.activation_epoch)
+
+    for state in stats.values():
+        state.delayed_validators_count = int(random.random() < 0.05)
+
+    iterator = object.__new__(iterator_class)
+    iterator.blockstamp = _BlockStamp()
+    iterator.left_queue_count = 0
+    iterator.max_validators_to_exit = max_validators_to_exit
+    iterator.operator_network_penetration_threshold = 0.01
+    iterator.staking_module_id = {f'0x{module}': StakingModuleId(module) for module in range(MODULES_COUNT)}
+    iterator.exitable_catalist_validators = validators
+    iterator.catalist_node_operator_stats = stats
+    iterator.total_predictable_validators_count = sum(state.predictable_validators_count for state in stats.values())
+    return iterator
+
+
+def measure(name: str, iterator: ExitOrderIterator) -> list[tuple]:
+    result = []
+
+    start = time.perf_counter()
+    # Queue is already prepared, so __iter__ that fetches the state from the nodes is skipped
+    while True:
+        try:
+            global_index, validator = next(iterator)
+        except StopIteration:
+            break
+        result.append((global_index, validator.index))
+    duration = time.perf_counter() - start
+
+    print(f'{name:<8} {duration:>10.2f} s {len(result):>8} validators {duration / max(len(result), 1) * 1000:>10.3f} ms/validator')
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--validators', type=int, default=300_000)
+    parser.add_argument('--operators', type=int, default=600)
+    parser.add_argument('--max-validators-to-exit', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args()
+
+    iterator = build_iterator(ExitOrderIterator, args.validators, args.operators, args.max_validators_to_exit, args.seed)
+    legacy_iterator = None if args.skip_legacy else copy.deepcopy(iterator)
+
+    current = measure('current', iterator)
+
+    if legacy_iterator is not None:
+        legacy_iterator.__class__ = LegacyExitOrderIterator
+        legacy = measure('legacy', legacy_iterator)
+        assert legacy == current, 'Exit order differs from the legacy implementation'
+        print('Exit order is the same')
+
+
+if __name__ == '__main__':
+    main()
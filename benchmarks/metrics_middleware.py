@@ -0,0 +1,77 @@
+"""
+Overhead of the metrics_collector middleware per EL request.
+
+Compares labelling eth_call requests with the selector table with the previous implementation, that tried
+get_function_by_selector of every known contract until one matched.
+
+Run from the repository root:
+    python -m benchmarks.metrics_middleware --count 10000
+"""
+import argparse
+import random
+import time
+from typing import Any, Callable
+
+from web3 import Web3
+
+from src.utils.abi import get_abi_names, load_abi
+from src.web3py.middleware import get_call_labels, get_function_selectors, metrics_collector
+
+
+ADDRESS = '0x' + '11' * 20
+
+
+def legacy_call_labels(contracts: list, method: str, params: Any) -> tuple[str, str]:
+    call_method = ''
+    call_to = ''
+    if method == 'eth_call':
+        args = params[0]
+        call_to = args['to']
+        for contract in contracts:
+            try:
+                call_method = contract.get_function_by_selector(args['data']).fn_name
+            except ValueError:
+                pass
+            if call_method:
+                break
+    return call_method, call_to
+
+
+def build_requests(count: int) -> list[tuple[str, Any]]:
+    selectors = list(get_function_selectors())
+    return [
+        ('eth_call', [{'to': ADDRESS, 'data': random.choice(selectors) + '00' * 32}, 'latest'])
+        for _ in range(count)
+    ]
+
+
+def measure(name: str, label: Callable[[str, Any], Any], requests: list[tuple[str, Any]]) -> None:
+    start = time.perf_counter()
+    for method, params in requests:
+        label(method, params)
+    duration = time.perf_counter() - start
+
+    print(f'{name:<24} {duration / len(requests) * 10**6:>10.2f} us/request')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=10_000)
+    args = parser.parse_args()
+
+    w3 = Web3()
+    requests = build_requests(args.count)
+
+    contracts = [w3.eth.contract(abi=load_abi(abi_name)) for abi_name in get_abi_names()]
+    selectors = get_function_selectors()
+
+    measure('legacy labels', lambda method, params: legacy_call_labels(contracts, method, params), requests)
+    measure('selector table labels', lambda method, params: get_call_labels(selectors, method, params), requests)
+
+    response = {'jsonrpc': '2.0', 'id': 1, 'result': '0x'}
+    middleware = metrics_collector(lambda method, params: response, w3)
+    measure('metrics_collector', middleware, requests)
+
+
+if __name__ == '__main__':
+    main()
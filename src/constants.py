@@ -5,7 +5,9 @@ MIN_VALIDATOR_WITHDRAWABILITY_DELAY = 2**8
 SHARD_COMMITTEE_PERIOD = 256
 MAX_SEED_LOOKAHEAD = 4
 # https://github.com/ethereum/consensus-specs/blob/dev/specs/phase0/beacon-chain.md#state-list-lengths
+EPOCHS_PER_HISTORICAL_VECTOR = 2**16
 EPOCHS_PER_SLASHINGS_VECTOR = 2**13
+SLOTS_PER_HISTORICAL_ROOT = 2**13
 # https://github.com/ethereum/consensus-specs/blob/dev/specs/phase0/beacon-chain.md#rewards-and-penalties
 PROPORTIONAL_SLASHING_MULTIPLIER_BELLATRIX = 3
 # https://github.com/ethereum/consensus-specs/blob/dev/specs/phase0/beacon-chain.md#gwei-values
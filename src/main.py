@@ -21,7 +21,8 @@ from src.web3py.extensions import (
     CatalistValidatorsProvider,
     FallbackProviderModule
 )
-from src.web3py.middleware import metrics_collector
+from src.web3py.call_store import CallResultsStore
+from src.web3py.middleware import construct_call_store_middleware, metrics_collector
 from src.web3py.typings import Web3
 
 from src.web3py.contract_tweak import tweak_w3_contracts
@@ -86,6 +87,11 @@ def main(module_name: OracleModule):
     web3.middleware_onion.add(metrics_collector)
     web3.middleware_onion.add(simple_cache_middleware)
 
+    if variables.EL_CALL_STORE_PATH:
+        logger.info({'msg': 'Add store middleware for EL requests by block hash.', 'path': variables.EL_CALL_STORE_PATH})
+        call_store = CallResultsStore(variables.EL_CALL_STORE_PATH, variables.EL_CALL_STORE_MAX_SIZE_MB * 2**20)
+        web3.middleware_onion.add(construct_call_store_middleware(call_store))
+
     logger.info({'msg': 'Sanity checks.'})
 
     if module_name == OracleModule.ACCOUNTING:
@@ -68,6 +68,26 @@ EL_REQUESTS_DURATION = Histogram(
     buckets=requests_buckets,
 )
 
+EL_CALL_STORE_REQUESTS = Counter(
+    'el_call_store_requests',
+    'EL requests pinned to the block hash',
+    ['endpoint', 'result'],  # "hit" or "miss"
+    namespace=PROMETHEUS_PREFIX,
+)
+
+EL_CALL_STORE_SIZE = Gauge(
+    'el_call_store_size_bytes',
+    'Total size of stored EL responses',
+    namespace=PROMETHEUS_PREFIX,
+)
+
+MULTICALL_CALLS = Counter(
+    'multicall_calls',
+    'Contract calls read with multicall',
+    ['result'],  # "batched" or "fallback"
+    namespace=PROMETHEUS_PREFIX,
+)
+
 CL_REQUESTS_DURATION = Histogram(
     'cl_requests_duration',
     'Duration of requests to CL API',
@@ -76,6 +96,42 @@ CL_REQUESTS_DURATION = Histogram(
     buckets=requests_buckets,
 )
 
+HTTP_REQUEST_STAGE_DURATION = Histogram(
+    'http_request_stage_duration',
+    'Duration of CL and KeysAPI request stages',
+    ['provider', 'endpoint', 'stage'],  # stage: "ttfb", "transfer", "decode" or "materialize"
+    namespace=PROMETHEUS_PREFIX,
+    buckets=requests_buckets,
+)
+
+HTTP_RESPONSE_SIZE = Histogram(
+    'http_response_size_bytes',
+    'Size of CL and KeysAPI response bodies',
+    ['provider', 'endpoint'],
+    namespace=PROMETHEUS_PREFIX,
+    buckets=(2**10, 2**13, 2**16, 2**19, 2**22, 2**25, 2**28, 2**30, 2**32, INF),
+)
+
+CL_BLOCKSTAMP_REQUESTS = Counter(
+    'cl_blockstamp_requests',
+    'Blocks requested to build blockstamp',
+    ['source'],  # "cache", "blinded_block" or "full_block"
+    namespace=PROMETHEUS_PREFIX,
+)
+
+CL_BLOCKSTAMP_BYTES = Counter(
+    'cl_blockstamp_bytes',
+    'Bytes downloaded to build blockstamp',
+    ['source'],
+    namespace=PROMETHEUS_PREFIX,
+)
+
+CL_BLOCKSTAMP_BYTES_SAVED = Counter(
+    'cl_blockstamp_bytes_saved',
+    'Bytes not downloaded again because blocks for blockstamp are cached',
+    namespace=PROMETHEUS_PREFIX,
+)
+
 KEYS_API_REQUESTS_DURATION = Histogram(
     'keys_api_requests_duration',
     'Duration of requests to Keys API',
@@ -84,12 +140,68 @@ KEYS_API_REQUESTS_DURATION = Histogram(
     buckets=requests_buckets,
 )
 
+HTTP_HOST_LATENCY = Gauge(
+    'http_host_latency_seconds',
+    'Moving average of successful requests duration to the host',
+    ['provider', 'domain'],
+    namespace=PROMETHEUS_PREFIX,
+)
+
+HTTP_HOST_ERROR_RATE = Gauge(
+    'http_host_error_rate',
+    'Moving average of failed requests share of the host',
+    ['provider', 'domain'],
+    namespace=PROMETHEUS_PREFIX,
+)
+
+HTTP_HOST_CIRCUIT_STATE = Gauge(
+    'http_host_circuit_state',
+    'Circuit breaker state of the host',
+    ['provider', 'domain'],  # 0 - closed, 1 - half-open, 2 - open
+    namespace=PROMETHEUS_PREFIX,
+)
+
 KEYS_API_LATEST_BLOCKNUMBER = Gauge(
     'keys_api_latest_blocknumber',
     'Latest blocknumber from Keys API metadata',
     namespace=PROMETHEUS_PREFIX,
 )
 
+KEYS_STORE_MODULES = Counter(
+    'keys_store_modules',
+    'Staking modules which keys were taken from the store or fetched from Keys API',
+    ['result'],  # "reused" or "fetched"
+    namespace=PROMETHEUS_PREFIX,
+)
+
+CACHE_REQUESTS = Counter(
+    'cache_requests',
+    'Calls of cached functions',
+    ['function', 'result'],  # "hit" or "miss"
+    namespace=PROMETHEUS_PREFIX,
+)
+
+CACHE_EVICTIONS = Counter(
+    'cache_evictions',
+    'Removed entries of cached functions',
+    ['function', 'reason'],  # "maxsize", "size" or "cycle"
+    namespace=PROMETHEUS_PREFIX,
+)
+
+CACHE_ENTRIES = Gauge(
+    'cache_entries',
+    'Entries count of cached functions',
+    ['function'],
+    namespace=PROMETHEUS_PREFIX,
+)
+
+CACHE_SIZE = Gauge(
+    'cache_size_bytes',
+    'Estimated size of cached functions results',
+    ['function'],
+    namespace=PROMETHEUS_PREFIX,
+)
+
 TRANSACTIONS_COUNT = Counter(
     'transactions_count',
     'Total count of transactions. Success or failure',
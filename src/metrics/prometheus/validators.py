@@ -1,4 +1,4 @@
-from prometheus_client import Gauge
+from prometheus_client import Counter, Gauge
 
 from src.variables import PROMETHEUS_PREFIX
 
@@ -26,3 +26,23 @@ CATALIST_SLASHED_VALIDATORS = Gauge(
     "Catalist slashed validators",
     namespace=PROMETHEUS_PREFIX,
 )
+
+VALIDATORS_SNAPSHOT_REQUESTS = Counter(
+    "validators_snapshot_requests",
+    "Lookups of validators snapshots on disk",
+    ["result"],  # "hit" or "miss"
+    namespace=PROMETHEUS_PREFIX,
+)
+
+VALIDATORS_SNAPSHOT_BYTES = Counter(
+    "validators_snapshot_bytes",
+    "Bytes read from or written to validators snapshots on disk",
+    ["operation"],  # "read" or "write"
+    namespace=PROMETHEUS_PREFIX,
+)
+
+VALIDATORS_SNAPSHOT_SIZE = Gauge(
+    "validators_snapshot_size_bytes",
+    "Total size of validators snapshots on disk",
+    namespace=PROMETHEUS_PREFIX,
+)
@@ -101,7 +101,7 @@ class Accounting(BaseModule, ConsensusModule):
 
         self.w3.transaction.check_and_send_transaction(tx, variables.ACCOUNT)
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     @duration_meter()
     def build_report(self, blockstamp: ReferenceBlockStamp) -> tuple:
         report_data = self._calculate_report(blockstamp)
@@ -134,7 +134,7 @@ class Accounting(BaseModule, ConsensusModule):
         logger.warning({'msg': '!' * 50})
         return ALLOW_REPORTING_IN_BUNKER_MODE
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def _get_processing_state(self, blockstamp: BlockStamp) -> AccountingProcessingState:
         ps = named_tuple_to_dataclass(
             self.report_contract.functions.getProcessingState().call(block_identifier=blockstamp.block_hash),
@@ -207,7 +207,7 @@ class Accounting(BaseModule, ConsensusModule):
 
         return list(module_stats.keys()), list(module_stats.values())
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def _get_consensus_catalist_state(self, blockstamp: ReferenceBlockStamp) -> tuple[int, Gwei]:
         catalist_validators = self.w3.catalist_validators.get_catalist_validators(blockstamp)
 
@@ -238,7 +238,7 @@ class Accounting(BaseModule, ConsensusModule):
 
         return share_rate, batches
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def simulate_cl_rebase(self, blockstamp: ReferenceBlockStamp) -> CatalistReportRebase:
         """
         Simulate rebase excluding any execution rewards.
@@ -300,7 +300,7 @@ class Accounting(BaseModule, ConsensusModule):
 
         return CatalistReportRebase(*result)
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_shares_to_burn(self, blockstamp: BlockStamp) -> int:
         shares_data = named_tuple_to_dataclass(
             self.w3.catalist_contracts.burner.functions.getSharesRequestedToBurn().call(
@@ -324,7 +324,7 @@ class Accounting(BaseModule, ConsensusModule):
 
         return slots_elapsed
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def _is_bunker(self, blockstamp: ReferenceBlockStamp) -> bool:
         frame_config = self.get_frame_config(blockstamp)
         chain_config = self.get_chain_config(blockstamp)
@@ -1,5 +1,4 @@
 import logging
-from functools import reduce
 
 from web3.types import Wei
 
@@ -31,9 +30,9 @@ from src.typings import BlockStamp, EpochNumber, ReferenceBlockStamp
 from src.utils.abi import named_tuple_to_dataclass
 from src.utils.cache import global_lru_cache as lru_cache
 from src.utils.validator_state import (
-    is_active_validator,
+    ValidatorSetStats,
+    WithdrawableBalances,
     is_fully_withdrawable_validator,
-    is_partially_withdrawable_validator,
 )
 from src.web3py.extensions.catalist_validators import CatalistValidator, NodeOperatorGlobalIndex
 from src.web3py.typings import Web3
@@ -82,7 +81,7 @@ class Ejector(BaseModule, ConsensusModule):
         self.process_report(report_blockstamp)
         return ModuleExecuteDelay.NEXT_SLOT
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     @duration_meter()
     def build_report(self, blockstamp: ReferenceBlockStamp) -> tuple:
         last_report_ref_slot = self.w3.catalist_contracts.get_ejector_last_processing_ref_slot(blockstamp)
@@ -143,11 +142,21 @@ class Ejector(BaseModule, ConsensusModule):
             chain_config=chain_config
         )
 
+        # Predicted withdrawal epoch grows by one every churn limit validators,
+        # so epoch dependent parts of the expected balance are recalculated only when the epoch changes.
+        evaluated_withdrawal_epoch = None
+        future_rewards = 0
+        future_withdrawals = 0
+
         for validator_container in validators_iterator:
-            withdrawal_epoch = self._get_predicted_withdrawable_epoch(blockstamp, len(validators_to_eject) + len(validators_going_to_exit) + 1)
-            future_rewards = (withdrawal_epoch + epochs_to_sweep - blockstamp.ref_epoch) * rewards_speed_per_epoch
+            withdrawal_epoch = self._get_predicted_withdrawable_epoch(
+                blockstamp, len(validators_to_eject) + len(validators_going_to_exit) + 1,
+            )
 
-            future_withdrawals = self._get_withdrawable_catalist_validators_balance(blockstamp, withdrawal_epoch)
+            if withdrawal_epoch != evaluated_withdrawal_epoch:
+                evaluated_withdrawal_epoch = withdrawal_epoch
+                future_rewards = (withdrawal_epoch + epochs_to_sweep - blockstamp.ref_epoch) * rewards_speed_per_epoch
+                future_withdrawals = self._get_withdrawable_catalist_validators_balance(blockstamp, withdrawal_epoch)
 
             expected_balance = (
                 future_withdrawals +  # Validators that have withdrawal_epoch
@@ -191,26 +200,27 @@ class Ejector(BaseModule, ConsensusModule):
         logger.info({'msg': 'Fetch isPaused from ejector bus contract.', 'value': on_pause})
         return not on_pause
 
-    @lru_cache(maxsize=1)
     def _get_withdrawable_catalist_validators_balance(self, blockstamp: BlockStamp, on_epoch: EpochNumber) -> Wei:
-        catalist_validators = self.w3.catalist_validators.get_catalist_validators(blockstamp=blockstamp)
+        return Wei(self._get_catalist_withdrawable_balances(blockstamp).get_balance(on_epoch))
 
-        def get_total_withdrawable_balance(balance: Wei, validator: Validator) -> Wei:
-            if is_fully_withdrawable_validator(validator, on_epoch):
-                balance = Wei(
-                    balance + self._get_predicted_withdrawable_balance(validator)
-                )
-
-            return balance
+    @lru_cache()
+    def _get_catalist_withdrawable_balances(self, blockstamp: BlockStamp) -> WithdrawableBalances:
+        """
+        Withdrawable epoch of the validator doesn't depend on the epoch we are looking at,
+        so the balances are summed once and looked up for every predicted withdrawal epoch.
+        """
+        catalist_validators = self.w3.catalist_validators.get_catalist_validators(blockstamp=blockstamp)
 
-        result = reduce(
-            get_total_withdrawable_balance,
-            catalist_validators,
-            Wei(0),
+        return WithdrawableBalances.from_balances(
+            (
+                EpochNumber(int(validator.validator.withdrawable_epoch)),
+                self._get_predicted_withdrawable_balance(validator),
+            )
+            for validator in catalist_validators
+            # Validators that will be fully withdrawable at some epoch
+            if is_fully_withdrawable_validator(validator, EpochNumber(FAR_FUTURE_EPOCH))
         )
 
-        return result
-
     def _get_predicted_withdrawable_balance(self, validator: Validator) -> Wei:
         return self.w3.to_wei(min(int(validator.balance), MAX_EFFECTIVE_BALANCE), 'gwei')
 
@@ -275,49 +285,27 @@ class Ejector(BaseModule, ConsensusModule):
         """
         return blockstamp.ref_epoch + 1 + MAX_SEED_LOOKAHEAD
 
-    @lru_cache(maxsize=1)
-    def _get_latest_exit_epoch(self, blockstamp: BlockStamp) -> tuple[EpochNumber, int]:
+    @lru_cache()
+    def _get_validator_set_stats(self, blockstamp: ReferenceBlockStamp) -> ValidatorSetStats:
+        return ValidatorSetStats.from_table(self.w3.cc.get_validators_table(blockstamp), blockstamp.ref_epoch)
+
+    def _get_latest_exit_epoch(self, blockstamp: ReferenceBlockStamp) -> tuple[EpochNumber, int]:
         """
         Returns the latest exit epoch and amount of validators that are exiting in this epoch
         """
-        max_exit_epoch_number = EpochNumber(0)
-        latest_to_exit_validators_count = 0
-
-        for validator in self.w3.cc.get_validators(blockstamp):
-            val_exit_epoch = EpochNumber(int(validator.validator.exit_epoch))
-
-            if val_exit_epoch == FAR_FUTURE_EPOCH:
-                continue
-
-            if val_exit_epoch == max_exit_epoch_number:
-                latest_to_exit_validators_count += 1
-
-            elif val_exit_epoch > max_exit_epoch_number:
-                max_exit_epoch_number = val_exit_epoch
-                latest_to_exit_validators_count = 1
-
-        return max_exit_epoch_number, latest_to_exit_validators_count
+        stats = self._get_validator_set_stats(blockstamp)
+        return stats.max_exit_epoch, stats.max_exit_epoch_validators_count
 
     def _get_sweep_delay_in_epochs(self, blockstamp: ReferenceBlockStamp) -> int:
         """Returns amount of epochs that will take to sweep all validators in chain."""
-        validators = self.w3.cc.get_validators(blockstamp)
-
-        total_withdrawable_validators = len(list(filter(lambda validator: (
-            is_partially_withdrawable_validator(validator) or
-            is_fully_withdrawable_validator(validator, blockstamp.ref_epoch)
-        ), validators)))
+        total_withdrawable_validators = self._get_validator_set_stats(blockstamp).withdrawable_validators_count
 
         chain_config = self.get_chain_config(blockstamp)
         full_sweep_in_epochs = total_withdrawable_validators / MAX_WITHDRAWALS_PER_PAYLOAD / chain_config.slots_per_epoch
         return int(full_sweep_in_epochs * self.AVG_EXPECTING_WITHDRAWALS_SWEEP_DURATION_MULTIPLIER)
 
-    @lru_cache(maxsize=1)
     def _get_churn_limit(self, blockstamp: ReferenceBlockStamp) -> int:
-        total_active_validators = reduce(
-            lambda total, validator: total + int(is_active_validator(validator, blockstamp.ref_epoch)),
-            self.w3.cc.get_validators(blockstamp),
-            0,
-        )
+        total_active_validators = self._get_validator_set_stats(blockstamp).active_validators_count
         return max(MIN_PER_EPOCH_CHURN_LIMIT, total_active_validators // CHURN_LIMIT_QUOTIENT)
 
     def _get_processing_state(self, blockstamp: BlockStamp) -> EjectorProcessingState:
@@ -24,6 +24,7 @@ from src.utils.blockstamp import build_blockstamp
 from src.utils.web3converter import Web3Converter
 from src.utils.slot import get_reference_blockstamp
 from src.utils.cache import global_lru_cache as lru_cache
+from src.web3py.multicall import Multicall, MulticallResult
 from src.web3py.typings import Web3
 
 logger = logging.getLogger(__name__)
@@ -56,7 +57,7 @@ class ConsensusModule(ABC):
 
     def check_contract_configs(self):
         root = self.w3.cc.get_block_root('head').root
-        block_details = self.w3.cc.get_block_details(root)
+        block_details = self.w3.cc.get_blockstamp_details(root)
         bs = build_blockstamp(block_details)
 
         config = self.get_chain_config(bs)
@@ -71,12 +72,11 @@ class ConsensusModule(ABC):
                              f'Beacon chain config: {genesis_time=}, {cc_config.SECONDS_PER_SLOT=}, {cc_config.SLOTS_PER_EPOCH=}')
 
     # ----- Web3 data requests -----
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def _get_consensus_contract(self, blockstamp: BlockStamp) -> Contract | AsyncContract:
-        return self.w3.eth.contract(
-            address=self._get_consensus_contract_address(blockstamp),
-            abi=self.w3.catalist_contracts.load_abi('HashConsensus'),
-            decode_tuples=True,
+        return self.w3.catalist_contracts.load_contract(
+            'HashConsensus',
+            self._get_consensus_contract_address(blockstamp),
         )
 
     def _get_consensus_contract_address(self, blockstamp: BlockStamp) -> ChecksumAddress:
@@ -87,31 +87,40 @@ class ConsensusModule(ABC):
         members, last_reported_ref_slots = consensus_contract.functions.getMembers().call(block_identifier=blockstamp.block_hash)
         return members, last_reported_ref_slots
 
-    @lru_cache(maxsize=1)
-    def get_chain_config(self, blockstamp: BlockStamp) -> ChainConfig:
+    @lru_cache()
+    def _get_consensus_configs(self, blockstamp: BlockStamp) -> dict[str, MulticallResult]:
+        """Chain config, current frame and frame config are read in a single request if multicall is enabled"""
         consensus_contract = self._get_consensus_contract(blockstamp)
+
+        with Multicall(self.w3, blockstamp.block_hash) as multicall:
+            return {
+                'chain_config': multicall.add(consensus_contract.functions.getChainConfig()),
+                'current_frame': multicall.add(consensus_contract.functions.getCurrentFrame()),
+                'frame_config': multicall.add(consensus_contract.functions.getFrameConfig()),
+            }
+
+    @lru_cache()
+    def get_chain_config(self, blockstamp: BlockStamp) -> ChainConfig:
         cc = named_tuple_to_dataclass(
-            consensus_contract.functions.getChainConfig().call(block_identifier=blockstamp.block_hash),
+            self._get_consensus_configs(blockstamp)['chain_config'].value,
             ChainConfig,
         )
         logger.info({'msg': 'Fetch chain config.', 'value': cc})
         return cc
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_current_frame(self, blockstamp: BlockStamp) -> CurrentFrame:
-        consensus_contract = self._get_consensus_contract(blockstamp)
         cf = named_tuple_to_dataclass(
-            consensus_contract.functions.getCurrentFrame().call(block_identifier=blockstamp.block_hash),
+            self._get_consensus_configs(blockstamp)['current_frame'].value,
             CurrentFrame,
         )
         logger.info({'msg': 'Fetch current frame.', 'value': cf})
         return cf
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_frame_config(self, blockstamp: BlockStamp) -> FrameConfig:
-        consensus_contract = self._get_consensus_contract(blockstamp)
         fc = named_tuple_to_dataclass(
-            consensus_contract.functions.getFrameConfig().call(block_identifier=blockstamp.block_hash),
+            self._get_consensus_configs(blockstamp)['frame_config'].value,
             FrameConfig,
         )
         # fc = FrameConfig(initial_epoch=12600, epochs_per_frame=56, fast_lane_length_slots=10)
@@ -119,7 +128,7 @@ class ConsensusModule(ABC):
         logger.info({'msg': 'Fetch frame config.', 'value': fc})
         return fc
         
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_member_info(self, blockstamp: BlockStamp) -> MemberInfo:
         consensus_contract = self._get_consensus_contract(blockstamp)
 
@@ -400,7 +409,7 @@ class ConsensusModule(ABC):
 
     def _get_latest_blockstamp(self) -> BlockStamp:
         root = self.w3.cc.get_block_root('head').root
-        block_details = self.w3.cc.get_block_details(root)
+        block_details = self.w3.cc.get_blockstamp_details(root)
         bs = build_blockstamp(block_details)
         logger.debug({'msg': 'Fetch latest blockstamp.', 'value': bs})
         ORACLE_SLOT_NUMBER.labels('head').set(bs.slot_number)
@@ -413,7 +422,7 @@ class ConsensusModule(ABC):
 
         return bs
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def _get_slot_delay_before_data_submit(self, blockstamp: BlockStamp) -> int:
         """
         Fast lane offchain implementation for report data
@@ -452,7 +461,7 @@ class ConsensusModule(ABC):
         return total_delay
 
     @abstractmethod
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def build_report(self, blockstamp: ReferenceBlockStamp) -> tuple:
         """Returns ReportData struct with calculated data."""
 
@@ -11,7 +11,7 @@ from src.metrics.prometheus.basic import ORACLE_BLOCK_NUMBER, ORACLE_SLOT_NUMBER
 from src.modules.submodules.exceptions import IsNotMemberException, IncompatibleContractVersion
 from src.providers.http_provider import NotOkResponse
 from src.providers.keys.client import KeysOutdatedException
-from src.utils.cache import clear_global_cache
+from src.utils.cache import clear_global_cache, start_cache_cycle
 from src.web3py.extensions.catalist_validators import CountOfKeysDiffersException
 from src.utils.blockstamp import build_blockstamp
 from src.utils.slot import NoSlotsAvailable, SlotNotFinalized, InconsistentData
@@ -55,6 +55,7 @@ class BaseModule(ABC):
 
     @timeout(variables.MAX_CYCLE_LIFETIME_IN_SECONDS)
     def cycle_handler(self):
+        start_cache_cycle()
         blockstamp = self._receive_last_finalized_slot()
 
         if blockstamp.slot_number > self._slot_threshold:
@@ -76,7 +77,7 @@ class BaseModule(ABC):
 
     def _receive_last_finalized_slot(self) -> BlockStamp:
         block_root = BlockRoot(self.w3.cc.get_block_root('finalized').root)
-        block_details = self.w3.cc.get_block_details(block_root)
+        block_details = self.w3.cc.get_blockstamp_details(block_root)
         bs = build_blockstamp(block_details)
         logger.info({'msg': 'Fetch last finalized BlockStamp.', 'value': asdict(bs)})
         ORACLE_SLOT_NUMBER.labels('finalized').set(bs.slot_number)
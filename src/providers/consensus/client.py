@@ -1,8 +1,17 @@
+import time
+from collections import OrderedDict
 from http import HTTPStatus
-from typing import Literal, Optional, Union
+from typing import Iterator, Literal, Optional, Sequence, Union
+
+from requests import Response
 
 from src.metrics.logging import logging
-from src.metrics.prometheus.basic import CL_REQUESTS_DURATION
+from src.metrics.prometheus.basic import (
+    CL_BLOCKSTAMP_BYTES,
+    CL_BLOCKSTAMP_BYTES_SAVED,
+    CL_BLOCKSTAMP_REQUESTS,
+    CL_REQUESTS_DURATION,
+)
 from src.providers.consensus.typings import (
     BlockDetailsResponse,
     BlockHeaderFullResponse,
@@ -12,9 +21,13 @@ from src.providers.consensus.typings import (
     BeaconSpecResponse,
     GenesisResponse,
 )
-from src.providers.http_provider import HTTPProvider, NotOkResponse
+from src.providers.consensus.headers_cache import FinalizedHeadersCache
+from src.providers.consensus.slashings_memo import SlashingsMemo
+from src.providers.consensus.ssz import SSZ_CONTENT_TYPE, decode_signed_block, decode_state_validators
+from src.providers.consensus.validator_snapshots import ValidatorSnapshotStore
+from src.providers.consensus.validator_table import ValidatorTable
+from src.providers.http_provider import HTTPProvider, NotOkResponse, TransferStats
 from src.typings import BlockRoot, BlockStamp, SlotNumber
-from src.utils.dataclass import list_of_dataclasses
 from src.utils.cache import global_lru_cache as lru_cache
 
 logger = logging.getLogger(__name__)
@@ -23,6 +36,10 @@ logger = logging.getLogger(__name__)
 LiteralState = Literal['head', 'genesis', 'finalized', 'justified']
 
 
+class SSZNotSupported(Exception):
+    pass
+
+
 class ConsensusClient(HTTPProvider):
     """
     API specifications can be found here
@@ -36,9 +53,32 @@ class ConsensusClient(HTTPProvider):
     API_GET_BLOCK_ROOT = 'eth/v1/beacon/blocks/{}/root'
     API_GET_BLOCK_HEADER = 'eth/v1/beacon/headers/{}'
     API_GET_BLOCK_DETAILS = 'eth/v2/beacon/blocks/{}'
+    API_GET_BLINDED_BLOCK = 'eth/v1/beacon/blinded_blocks/{}'
     API_GET_VALIDATORS = 'eth/v1/beacon/states/{}/validators'
     API_GET_SPEC = 'eth/v1/config/spec'
     API_GET_GENESIS = 'eth/v1/beacon/genesis'
+    API_GET_STATE = 'eth/v2/debug/beacon/states/{}'
+
+    # SSZ encoded responses are opt-in. Hosts that don't support SSZ are remembered and requested with json.
+    use_ssz: bool = False
+    _ssz_unsupported_hosts: frozenset[str] = frozenset()
+
+    # Validators sets stored on disk by state root
+    validators_snapshots: Optional[ValidatorSnapshotStore] = None
+
+    FINALIZED_HEADERS_CACHE_SIZE = 1024
+    _finalized_headers: Optional[FinalizedHeadersCache] = None
+
+    _slashings_memo: Optional[SlashingsMemo] = None
+
+    BLOCKSTAMP_BLOCKS_CACHE_SIZE = 64
+    _blockstamp_blocks: Optional[OrderedDict[str, tuple[BlockDetailsResponse, int]]] = None
+
+    SSZ_NOT_SUPPORTED_STATUSES = (
+        HTTPStatus.NOT_ACCEPTABLE,
+        HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+        HTTPStatus.NOT_IMPLEMENTED,
+    )
 
     def get_config_spec(self):
         """Spec: https://ethereum.github.io/beacon-APIs/#/Config/getSpec"""
@@ -71,9 +111,15 @@ class ConsensusClient(HTTPProvider):
             raise ValueError("Expected mapping response from getBlockRoot")
         return BlockRootResponse.from_response(**data)
 
-    @lru_cache(maxsize=1)
     def get_block_header(self, state_id: Union[SlotNumber, BlockRoot]) -> BlockHeaderFullResponse:
-        """Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getBlockHeader"""
+        """
+        Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getBlockHeader
+
+        Finalized headers are cached by slot and by root. Not finalized headers could be reorganized, so they are not cached.
+        """
+        if cached_header := self._get_finalized_headers().get(state_id):
+            return cached_header
+
         data, meta_data = self._get(
             self.API_GET_BLOCK_HEADER,
             path_params=(state_id,),
@@ -82,43 +128,204 @@ class ConsensusClient(HTTPProvider):
         if not isinstance(data, dict):
             raise ValueError("Expected mapping response from getBlockHeader")
         resp = BlockHeaderFullResponse.from_response(data=BlockHeaderResponseData.from_response(**data), **meta_data)
+        self._get_finalized_headers().put(resp)
         return resp
 
-    @lru_cache(maxsize=1)
+    def get_blockstamp_details(self, state_id: Union[SlotNumber, BlockRoot]) -> BlockDetailsResponse:
+        """
+        Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getBlindedBlock
+
+        Returns block with fields required for the blockstamp only.
+        Body contains only execution payload's block_number, block_hash and timestamp.
+
+        Blinded block has execution payload header instead of the transactions, so it's much smaller than the full block.
+        Blocks are immutable, so they are cached by block root.
+        Full block is requested if no host responds with blinded block.
+        """
+        root = state_id.lower() if isinstance(state_id, str) and state_id.startswith('0x') else None
+        blocks = self._get_blockstamp_blocks()
+
+        if root is not None and root in blocks:
+            blocks.move_to_end(root)
+            block, size = blocks[root]
+            CL_BLOCKSTAMP_REQUESTS.labels('cache').inc()
+            CL_BLOCKSTAMP_BYTES_SAVED.inc(size)
+            return block
+
+        try:
+            data, size = self._get_blinded_block(state_id)
+        except Exception as error:  # pylint: disable=W0703
+            # Some clients respond 404 for unsupported endpoints, so missed block is confirmed by full block request
+            block, size = self._get_blockstamp_full_block(state_id, error), 0
+        else:
+            block = BlockDetailsResponse.from_response(**data)
+            CL_BLOCKSTAMP_REQUESTS.labels('blinded_block').inc()
+            CL_BLOCKSTAMP_BYTES.labels('blinded_block').inc(size)
+
+        if root is not None:
+            blocks[root] = block, size
+            while len(blocks) > self.BLOCKSTAMP_BLOCKS_CACHE_SIZE:
+                blocks.popitem(last=False)
+
+        return block
+
+    def _get_blockstamp_full_block(self, state_id: Union[SlotNumber, BlockRoot], error: Exception) -> BlockDetailsResponse:
+        logger.warning({'msg': 'Failed to get blinded block. Fetch full block.', 'error': str(error)})
+        CL_BLOCKSTAMP_REQUESTS.labels('full_block').inc()
+        return self.get_block_details(state_id)
+
+    def _get_blinded_block(self, state_id: Union[SlotNumber, BlockRoot]) -> tuple[dict, int]:
+        """Returns blinded block in the getBlockV2 form and the size of the response body"""
+        def request(host: str) -> tuple[dict, int]:
+            if host in self._get_ssz_hosts():
+                try:
+                    response = self._get_ssz_without_fallbacks(host, self.API_GET_BLINDED_BLOCK, (state_id,))
+                except SSZNotSupported:
+                    pass
+                else:
+                    with response:
+                        # Execution payload header has the same layout of the required fields as execution payload
+                        content = response.content
+                        return decode_signed_block(content, response.headers.get('Eth-Consensus-Version', '')), len(content)
+
+            response = self._get_response_without_fallbacks(host, self.API_GET_BLINDED_BLOCK, (state_id,))
+            content = response.content
+            data = response.json().get('data')
+            if not isinstance(data, dict):
+                raise ValueError("Expected mapping response from getBlindedBlock")
+            return self._unblind_block_data(data), len(content)
+
+        return self._with_fallbacks(request, force_raise=self.__raise_last_missed_slot_error)
+
+    @staticmethod
+    def _unblind_block_data(data: dict) -> dict:
+        message = data['message']
+        payload_header = message['body'].get('execution_payload_header')
+
+        body = {}
+        if payload_header is not None:
+            body['execution_payload'] = {
+                'block_number': payload_header['block_number'],
+                'block_hash': payload_header['block_hash'],
+                'timestamp': payload_header['timestamp'],
+            }
+
+        return {**data, 'message': {**message, 'body': body}}
+
+    def _get_blockstamp_blocks(self) -> OrderedDict[str, tuple[BlockDetailsResponse, int]]:
+        if self._blockstamp_blocks is None:
+            self._blockstamp_blocks = OrderedDict()
+        return self._blockstamp_blocks
+
+    @lru_cache()
     def get_block_details(self, state_id: Union[SlotNumber, BlockRoot]) -> BlockDetailsResponse:
         """Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getBlockV2"""
-        data, _ = self._get(
-            self.API_GET_BLOCK_DETAILS,
-            path_params=(state_id,),
-            force_raise=self.__raise_last_missed_slot_error,
-        )
+        if self._get_ssz_hosts():
+            data = self._get_block_details_ssz(state_id)
+        else:
+            data, _ = self._get(
+                self.API_GET_BLOCK_DETAILS,
+                path_params=(state_id,),
+                force_raise=self.__raise_last_missed_slot_error,
+            )
         if not isinstance(data, dict):
             raise ValueError("Expected mapping response from getBlockV2")
         return BlockDetailsResponse.from_response(**data)
 
     @lru_cache(maxsize=1)
     def get_validators(self, blockstamp: BlockStamp) -> list[Validator]:
-        """Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getStateValidators"""
-        return self.get_validators_no_cache(blockstamp)
+        """
+        Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getStateValidators
+
+        Validators are built once from the cached table and are shared by all callers, so they must not be modified.
+        """
+        return self.get_validators_table(blockstamp).to_validators()
 
-    @list_of_dataclasses(Validator.from_response)
-    def get_validators_no_cache(self, blockstamp: BlockStamp, pub_keys: Optional[str | tuple] = None) -> list[dict]:
+    @lru_cache()
+    def get_validators_table(self, blockstamp: BlockStamp) -> ValidatorTable:
+        """Columnar representation of the validators set. Use it for aggregations over all validators."""
+        return self._get_validators_table_no_cache(blockstamp)
+
+    def get_validators_no_cache(self, blockstamp: BlockStamp, pub_keys: Optional[str | tuple] = None) -> list[Validator]:
         """Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getStateValidators"""
+        if self.validators_snapshots is not None:
+            if pub_keys is None:
+                return self._get_validators_table_no_cache(blockstamp).to_validators()
+
+            if (table := self.validators_snapshots.load(blockstamp.state_root)) is not None:
+                return self._select_validators(table, pub_keys)
+
+        return list(self.iter_validators(blockstamp, pub_keys))
+
+    def _get_validators_table_no_cache(self, blockstamp: BlockStamp) -> ValidatorTable:
+        if self.validators_snapshots is not None:
+            if (table := self.validators_snapshots.load(blockstamp.state_root)) is not None:
+                return table
+
+        table = None
+        if self._get_ssz_hosts():
+            try:
+                table = self._get_validators_table_ssz(blockstamp)
+            except Exception as error:  # pylint: disable=W0703
+                logger.warning({'msg': 'Failed to get SSZ encoded state. Fallback to json.', 'error': str(error)})
+
+        if table is None:
+            table = ValidatorTable.from_validators(self.iter_validators(blockstamp))
+
+        if self.validators_snapshots is not None:
+            self.validators_snapshots.save(blockstamp.state_root, table)
+
+        return table
+
+    @staticmethod
+    def _select_validators(table: ValidatorTable, pub_keys: Optional[str | tuple]) -> list[Validator]:
+        """Same filter as `id` query param of getStateValidators: comma separated or repeated pubkeys and indexes"""
+        if pub_keys is None:
+            return table.to_validators()
+
+        ids = pub_keys.split(',') if isinstance(pub_keys, str) else pub_keys
+        rows = set()
+
+        for validator_id in ids:
+            if str(validator_id).startswith('0x'):
+                row = table.find_row(validator_id)
+            else:
+                row = int(validator_id) if int(validator_id) < len(table) else None
+
+            if row is not None:
+                rows.add(row)
+
+        return [table.get_validator(row) for row in sorted(rows)]
+
+    def iter_validators(self, blockstamp: BlockStamp, pub_keys: Optional[str | tuple] = None) -> Iterator[Validator]:
+        """
+        Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getStateValidators
+
+        Validators are decoded one by one while the response is being received,
+        so neither raw response nor decoded json of the whole validators set is kept in memory.
+        """
         try:
-            data, _ = self._get(
+            items = self._get_stream(
                 self.API_GET_VALIDATORS,
                 path_params=(blockstamp.state_root,),
                 query_params={'id': pub_keys},
                 force_raise=self.__raise_on_prysm_error
             )
-            if not isinstance(data, list):
-                raise ValueError("Expected list response from getStateValidators")
-            return data
         except NotOkResponse as error:
-            if self.PRYSM_STATE_NOT_FOUND_ERROR in error.text:
-                return self._get_validators_with_prysm(blockstamp, pub_keys)
+            if self.PRYSM_STATE_NOT_FOUND_ERROR not in error.text:
+                raise error
 
-            raise error
+            items = self._get_validators_with_prysm(blockstamp, pub_keys)
+
+        materialize_seconds = 0.0
+        try:
+            for item in items:
+                started_at = time.perf_counter()
+                validator = Validator.from_response(**item)
+                materialize_seconds += time.perf_counter() - started_at
+                yield validator
+        finally:
+            self._observe_stage(self.API_GET_VALIDATORS, 'materialize', materialize_seconds)
 
     PRYSM_STATE_NOT_FOUND_ERROR = 'State not found: state not found in the last'
 
@@ -133,17 +340,14 @@ class ConsensusClient(HTTPProvider):
             return last_error
         return None
 
-    def _get_validators_with_prysm(self, blockstamp: BlockStamp, pub_keys: Optional[str | tuple] = None) -> list[dict]:
+    def _get_validators_with_prysm(self, blockstamp: BlockStamp, pub_keys: Optional[str | tuple] = None) -> Iterator[dict]:
         # Avoid Prysm issue with state root - https://github.com/prysmaticlabs/prysm/issues/12053
         # Trying to get validators by slot number
-        data, _ = self._get(
+        return self._get_stream(
             self.API_GET_VALIDATORS,
             path_params=(blockstamp.slot_number,),
             query_params={'id': pub_keys}
         )
-        if not isinstance(data, list):
-            raise ValueError("Expected list response from getStateValidators")  # pylint: disable=raise-missing-from
-        return data
 
     def __raise_last_missed_slot_error(self, errors: list[Exception]) -> Exception | None:
         """
@@ -157,6 +361,90 @@ class ConsensusClient(HTTPProvider):
 
         return None
 
+    def _get_ssz_hosts(self) -> list[str]:
+        if not self.use_ssz:
+            return []
+        return [host for host in self.hosts if host not in self._ssz_unsupported_hosts]
+
+    def _get_ssz_without_fallbacks(self, host: str, endpoint: str, path_params: Sequence[str | int]) -> Response:
+        """
+        Requests SSZ encoded response.
+        If host can't respond with SSZ it is excluded from SSZ requests and SSZNotSupported is raised.
+        """
+        try:
+            response = self._get_response_without_fallbacks(
+                host,
+                endpoint,
+                path_params,
+                stream=True,
+                headers={'Accept': SSZ_CONTENT_TYPE},
+            )
+        except NotOkResponse as error:
+            if error.status in self.SSZ_NOT_SUPPORTED_STATUSES:
+                self._ssz_unsupported_hosts |= {host}
+                raise SSZNotSupported(f'Host does not support SSZ for {endpoint}.') from error
+            raise error
+
+        if not response.headers.get('Content-Type', '').startswith(SSZ_CONTENT_TYPE):
+            response.close()
+            self._ssz_unsupported_hosts |= {host}
+            raise SSZNotSupported(f'Host does not support SSZ for {endpoint}.')
+
+        return response
+
+    def _get_validators_table_ssz(self, blockstamp: BlockStamp) -> ValidatorTable:
+        """
+        Spec: https://ethereum.github.io/beacon-APIs/#/Debug/getStateV2
+
+        There is no SSZ encoding for getStateValidators, so validators and balances are decoded from the whole state.
+        It's still several times smaller than json validators response.
+        """
+        slots_per_epoch = self._get_slots_per_epoch()
+
+        def request(host: str) -> ValidatorTable:
+            response = self._get_ssz_without_fallbacks(host, self.API_GET_STATE, (blockstamp.state_root,))
+            stats = TransferStats()
+            started_at = time.perf_counter()
+
+            with response:
+                table = decode_state_validators(self._iter_response_content(response, stats), slots_per_epoch)
+
+            self._observe_transfer(self.API_GET_STATE, stats, time.perf_counter() - started_at - stats.seconds)
+            return table
+
+        return self._with_fallbacks(request, hosts=self._get_ssz_hosts())
+
+    def _get_block_details_ssz(self, state_id: Union[SlotNumber, BlockRoot]) -> dict | list:
+        def request(host: str) -> dict | list:
+            if host in self._get_ssz_hosts():
+                try:
+                    response = self._get_ssz_without_fallbacks(host, self.API_GET_BLOCK_DETAILS, (state_id,))
+                except SSZNotSupported:
+                    pass
+                else:
+                    with response:
+                        return decode_signed_block(response.content, response.headers.get('Eth-Consensus-Version', ''))
+
+            data, _ = self._get_without_fallbacks(host, self.API_GET_BLOCK_DETAILS, (state_id,))
+            return data
+
+        return self._with_fallbacks(request, force_raise=self.__raise_last_missed_slot_error)
+
+    def _get_finalized_headers(self) -> FinalizedHeadersCache:
+        if self._finalized_headers is None:
+            self._finalized_headers = FinalizedHeadersCache(self.FINALIZED_HEADERS_CACHE_SIZE)
+        return self._finalized_headers
+
+    def get_slashings_memo(self) -> SlashingsMemo:
+        """Slashed flags of the validators known from the finalized states requested by this client"""
+        if self._slashings_memo is None:
+            self._slashings_memo = SlashingsMemo()
+        return self._slashings_memo
+
+    @lru_cache()
+    def _get_slots_per_epoch(self) -> int:
+        return int(self.get_config_spec().SLOTS_PER_EPOCH)
+
     def _get_chain_id_with_provider(self, provider_index: int) -> int:
         data, _ = self._get_without_fallbacks(self.hosts[provider_index], self.API_GET_SPEC)
         if not isinstance(data, dict):
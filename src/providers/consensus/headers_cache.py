@@ -0,0 +1,54 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from src.providers.consensus.typings import BlockHeaderFullResponse
+
+
+class FinalizedHeadersCache:
+    """
+    Finalized canonical block headers never change, so they are kept by slot and by block root.
+    The least recently used headers are removed when cache is full.
+    """
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._headers_by_root: OrderedDict[str, BlockHeaderFullResponse] = OrderedDict()
+        self._roots_by_slot: dict[int, str] = {}
+        self._lock = Lock()
+
+    def get(self, state_id: int | str) -> Optional[BlockHeaderFullResponse]:
+        with self._lock:
+            root = self._get_root(state_id)
+            if root is None or root not in self._headers_by_root:
+                return None
+
+            self._headers_by_root.move_to_end(root)
+            return self._headers_by_root[root]
+
+    def put(self, header: BlockHeaderFullResponse) -> None:
+        if not header.finalized or not header.data.canonical:
+            return
+
+        root = header.data.root.lower()
+        slot = int(header.data.header.message.slot)
+
+        with self._lock:
+            self._headers_by_root[root] = header
+            self._headers_by_root.move_to_end(root)
+            self._roots_by_slot[slot] = root
+
+            while len(self._headers_by_root) > self.max_size:
+                removed_root, removed = self._headers_by_root.popitem(last=False)
+                removed_slot = int(removed.data.header.message.slot)
+                if self._roots_by_slot.get(removed_slot) == removed_root:
+                    del self._roots_by_slot[removed_slot]
+
+    def _get_root(self, state_id: int | str) -> Optional[str]:
+        if isinstance(state_id, int):
+            return self._roots_by_slot.get(state_id)
+        if state_id.isdecimal():
+            return self._roots_by_slot.get(int(state_id))
+        if state_id.startswith('0x'):
+            return state_id.lower()
+        # Literal states like "head" or "finalized" point to different blocks over time
+        return None
@@ -0,0 +1,34 @@
+from threading import Lock
+from typing import Optional
+
+from src.typings import SlotNumber
+
+
+class SlashingsMemo:
+    """
+    Known slashed flags of the validators.
+
+    Slashed flag can't be undone, so for every pubkey it is enough to keep the latest slot where the validator
+    is known to be not slashed and the earliest slot where it is known to be slashed.
+    Flags are read from finalized states, so they are kept between oracle cycles.
+    """
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._not_slashed_at: dict[str, SlotNumber] = {}
+        self._slashed_at: dict[str, SlotNumber] = {}
+
+    def is_slashed(self, pubkey: str, slot: SlotNumber) -> Optional[bool]:
+        """Returns None if the slashed flag at the slot is unknown"""
+        with self._lock:
+            if pubkey in self._slashed_at and self._slashed_at[pubkey] <= slot:
+                return True
+            if pubkey in self._not_slashed_at and self._not_slashed_at[pubkey] >= slot:
+                return False
+        return None
+
+    def update(self, pubkey: str, slot: SlotNumber, slashed: bool) -> None:
+        with self._lock:
+            if slashed:
+                self._slashed_at[pubkey] = min(slot, self._slashed_at.get(pubkey, slot))
+            else:
+                self._not_slashed_at[pubkey] = max(slot, self._not_slashed_at.get(pubkey, slot))
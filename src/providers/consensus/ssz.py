@@ -0,0 +1,216 @@
+"""
+Decoders of SSZ encoded beacon node responses.
+Spec: https://github.com/ethereum/consensus-specs/blob/dev/ssz/simple-serialize.md
+
+Only the fields the oracle uses are decoded.
+Positions of the fields are calculated for the mainnet preset and are the same for all forks since phase0.
+"""
+import struct
+import sys
+from array import array
+from typing import Iterable
+
+from src.constants import (
+    EPOCHS_PER_HISTORICAL_VECTOR,
+    EPOCHS_PER_SLASHINGS_VECTOR,
+    FAR_FUTURE_EPOCH,
+    SLOTS_PER_HISTORICAL_ROOT,
+)
+from src.providers.consensus.typings import ValidatorStatus
+from src.providers.consensus.validator_table import VALIDATOR_STATUS_CODES, ValidatorTable
+
+
+SSZ_CONTENT_TYPE = 'application/octet-stream'
+
+OFFSET_SIZE = 4
+ROOT_SIZE = 32
+UINT64_SIZE = 8
+
+# https://github.com/ethereum/consensus-specs/blob/dev/specs/capella/beacon-chain.md#beaconstate
+# genesis_time, genesis_validators_root
+STATE_SLOT_POSITION = UINT64_SIZE + ROOT_SIZE
+# slot, fork, latest_block_header
+_STATE_BLOCK_ROOTS_POSITION = STATE_SLOT_POSITION + UINT64_SIZE + 16 + 112
+# block_roots, state_roots, historical_roots, eth1_data, eth1_data_votes, eth1_deposit_index
+STATE_VALIDATORS_OFFSET_POSITION = (
+    _STATE_BLOCK_ROOTS_POSITION + 2 * SLOTS_PER_HISTORICAL_ROOT * ROOT_SIZE + OFFSET_SIZE + 72 + OFFSET_SIZE + UINT64_SIZE
+)
+STATE_BALANCES_OFFSET_POSITION = STATE_VALIDATORS_OFFSET_POSITION + OFFSET_SIZE
+# balances, randao_mixes, slashings. Next field is the first variable-size field after balances.
+STATE_BALANCES_END_OFFSET_POSITION = (
+    STATE_BALANCES_OFFSET_POSITION + OFFSET_SIZE + EPOCHS_PER_HISTORICAL_VECTOR * ROOT_SIZE
+    + EPOCHS_PER_SLASHINGS_VECTOR * UINT64_SIZE
+)
+
+# pubkey, withdrawal_credentials, effective_balance, slashed,
+# activation_eligibility_epoch, activation_epoch, exit_epoch, withdrawable_epoch
+VALIDATOR_STRUCT = struct.Struct('<48s32sQ?QQQQ')
+VALIDATORS_BATCH_SIZE = 1024
+
+# https://github.com/ethereum/consensus-specs/blob/dev/specs/phase0/beacon-chain.md#signedbeaconblock
+SIGNED_BLOCK_OFFSET_STRUCT = struct.Struct('<I96s')
+# slot, proposer_index, parent_root, state_root, body offset
+BLOCK_STRUCT = struct.Struct('<QQ32s32sI')
+# randao_reveal, eth1_data, graffiti, five list offsets, sync_aggregate
+BLOCK_BODY_EXECUTION_PAYLOAD_OFFSET_POSITION = 96 + 72 + 32 + 5 * OFFSET_SIZE + 160
+# https://github.com/ethereum/consensus-specs/blob/dev/specs/bellatrix/beacon-chain.md#executionpayload
+PAYLOAD_BLOCK_NUMBER_POSITION = 32 + 20 + 32 + 32 + 256 + 32
+PAYLOAD_TIMESTAMP_POSITION = PAYLOAD_BLOCK_NUMBER_POSITION + 3 * UINT64_SIZE
+# timestamp, extra_data offset, base_fee_per_gas
+PAYLOAD_BLOCK_HASH_POSITION = PAYLOAD_TIMESTAMP_POSITION + UINT64_SIZE + OFFSET_SIZE + 32
+
+FORKS_WITHOUT_EXECUTION_PAYLOAD = ('phase0', 'altair')
+
+
+class SSZDecodeError(ValueError):
+    pass
+
+
+class ByteStreamReader:
+    """Reads exact amount of bytes from a stream of byte chunks"""
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+        self.position = 0
+
+    def read(self, size: int) -> bytes:
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                raise SSZDecodeError(f'Unexpected end of the stream at position {self.position + len(self._buffer)}.')
+            self._buffer += chunk
+
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self.position += size
+        return data
+
+    def skip_to(self, position: int) -> None:
+        if position < self.position:
+            raise SSZDecodeError(f'Can not skip back from position {self.position} to {position}.')
+        self.read(position - self.position)
+
+
+def decode_state_validators(chunks: Iterable[bytes], slots_per_epoch: int) -> ValidatorTable:
+    """
+    Decodes validators and balances from SSZ encoded BeaconState received by chunks.
+    Validators are unpacked by batches, so the whole state is never kept in memory.
+
+    Statuses are calculated on the state epoch the same way beacon nodes do it for getStateValidators.
+    https://github.com/ethereum/beacon-APIs/blob/master/validator-flow.md
+    """
+    reader = ByteStreamReader(chunks)
+
+    fixed_part = reader.read(STATE_BALANCES_END_OFFSET_POSITION + OFFSET_SIZE)
+    (slot,) = struct.unpack_from('<Q', fixed_part, STATE_SLOT_POSITION)
+    validators_offset, balances_offset = struct.unpack_from('<II', fixed_part, STATE_VALIDATORS_OFFSET_POSITION)
+    (balances_end,) = struct.unpack_from('<I', fixed_part, STATE_BALANCES_END_OFFSET_POSITION)
+    del fixed_part
+
+    validators_size = balances_offset - validators_offset
+    if validators_size < 0 or validators_size % VALIDATOR_STRUCT.size:
+        raise SSZDecodeError(f'Unexpected validators list size: {validators_size}.')
+
+    validators_count = validators_size // VALIDATOR_STRUCT.size
+    if balances_end - balances_offset != validators_count * UINT64_SIZE:
+        raise SSZDecodeError('Validators and balances lists have different length.')
+
+    table = ValidatorTable()
+    reader.skip_to(validators_offset)
+
+    for batch_start in range(0, validators_count, VALIDATORS_BATCH_SIZE):
+        batch_size = min(VALIDATORS_BATCH_SIZE, validators_count - batch_start)
+        batch = reader.read(batch_size * VALIDATOR_STRUCT.size)
+
+        for (
+            pubkey,
+            withdrawal_credentials,
+            effective_balance,
+            slashed,
+            activation_eligibility_epoch,
+            activation_epoch,
+            exit_epoch,
+            withdrawable_epoch,
+        ) in VALIDATOR_STRUCT.iter_unpack(batch):
+            table.pubkeys += pubkey
+            table.withdrawal_credentials += withdrawal_credentials
+            table.effective_balance.append(effective_balance)
+            table.slashed.append(slashed)
+            table.activation_eligibility_epoch.append(activation_eligibility_epoch)
+            table.activation_epoch.append(activation_epoch)
+            table.exit_epoch.append(exit_epoch)
+            table.withdrawable_epoch.append(withdrawable_epoch)
+
+    table.index = array('Q', range(validators_count))
+    table.balance.frombytes(reader.read(validators_count * UINT64_SIZE))
+    if sys.byteorder == 'big':
+        table.balance.byteswap()
+
+    epoch = slot // slots_per_epoch
+    table.status = bytearray(
+        VALIDATOR_STATUS_CODES[get_validator_status(table, row, epoch)] for row in range(validators_count)
+    )
+
+    return table
+
+
+def get_validator_status(table: ValidatorTable, row: int, epoch: int) -> ValidatorStatus:
+    activation_epoch = table.activation_epoch[row]
+    exit_epoch = table.exit_epoch[row]
+    slashed = table.slashed[row]
+
+    if activation_epoch > epoch:
+        if table.activation_eligibility_epoch[row] == FAR_FUTURE_EPOCH:
+            return ValidatorStatus.PENDING_INITIALIZED
+        return ValidatorStatus.PENDING_QUEUED
+
+    if epoch < exit_epoch:
+        if exit_epoch == FAR_FUTURE_EPOCH:
+            return ValidatorStatus.ACTIVE_ONGOING
+        return ValidatorStatus.ACTIVE_SLASHED if slashed else ValidatorStatus.ACTIVE_EXITING
+
+    if epoch < table.withdrawable_epoch[row]:
+        return ValidatorStatus.EXITED_SLASHED if slashed else ValidatorStatus.EXITED_UNSLASHED
+
+    return ValidatorStatus.WITHDRAWAL_POSSIBLE if table.balance[row] else ValidatorStatus.WITHDRAWAL_DONE
+
+
+def decode_signed_block(data: bytes, fork: str) -> dict:
+    """
+    Decodes SSZ encoded SignedBeaconBlock into the form of getBlockV2 json response.
+    Body contains only execution payload's block_number, block_hash and timestamp.
+    """
+    try:
+        message_offset, signature = SIGNED_BLOCK_OFFSET_STRUCT.unpack_from(data, 0)
+        slot, proposer_index, parent_root, state_root, body_offset = BLOCK_STRUCT.unpack_from(data, message_offset)
+
+        body: dict = {}
+        if fork not in FORKS_WITHOUT_EXECUTION_PAYLOAD:
+            body_position = message_offset + body_offset
+            (payload_offset,) = struct.unpack_from(
+                '<I', data, body_position + BLOCK_BODY_EXECUTION_PAYLOAD_OFFSET_POSITION,
+            )
+            payload_position = body_position + payload_offset
+
+            (block_number,) = struct.unpack_from('<Q', data, payload_position + PAYLOAD_BLOCK_NUMBER_POSITION)
+            (timestamp,) = struct.unpack_from('<Q', data, payload_position + PAYLOAD_TIMESTAMP_POSITION)
+            (block_hash,) = struct.unpack_from('32s', data, payload_position + PAYLOAD_BLOCK_HASH_POSITION)
+
+            body['execution_payload'] = {
+                'block_number': str(block_number),
+                'block_hash': '0x' + block_hash.hex(),
+                'timestamp': str(timestamp),
+            }
+    except struct.error as error:
+        raise SSZDecodeError(f'Failed to decode SignedBeaconBlock: {error}') from error
+
+    return {
+        'message': {
+            'slot': str(slot),
+            'proposer_index': str(proposer_index),
+            'parent_root': '0x' + parent_root.hex(),
+            'state_root': '0x' + state_root.hex(),
+            'body': body,
+        },
+        'signature': '0x' + signature.hex(),
+    }
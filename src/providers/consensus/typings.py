@@ -6,7 +6,7 @@ from src.typings import BlockRoot, StateRoot
 from src.utils.dataclass import Nested, FromResponse
 
 
-@dataclass
+@dataclass(slots=True)
 class BeaconSpecResponse(FromResponse):
     DEPOSIT_CHAIN_ID: str
     SLOTS_PER_EPOCH: str
@@ -14,20 +14,20 @@ class BeaconSpecResponse(FromResponse):
     DEPOSIT_CONTRACT_ADDRESS: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GenesisResponse(FromResponse):
     genesis_time: str
     genesis_validators_root: str
     genesis_fork_version: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockRootResponse(FromResponse):
     # https://ethereum.github.io/beacon-APIs/#/Beacon/getBlockRoot
     root: BlockRoot
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockHeaderMessage(FromResponse):
     slot: str
     proposer_index: str
@@ -36,13 +36,13 @@ class BlockHeaderMessage(FromResponse):
     body_root: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockHeader(Nested, FromResponse):
     message: BlockHeaderMessage
     signature: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockHeaderResponseData(Nested, FromResponse):
     # https://ethereum.github.io/beacon-APIs/#/Beacon/getBlockHeader
     root: BlockRoot
@@ -50,7 +50,7 @@ class BlockHeaderResponseData(Nested, FromResponse):
     header: BlockHeader
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockHeaderFullResponse(Nested, FromResponse):
     # https://ethereum.github.io/beacon-APIs/#/Beacon/getBlockHeader
     execution_optimistic: bool
@@ -58,7 +58,7 @@ class BlockHeaderFullResponse(Nested, FromResponse):
     finalized: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockMessage(FromResponse):
     slot: str
     proposer_index: str
@@ -82,7 +82,7 @@ class ValidatorStatus(Enum):
     WITHDRAWAL_DONE = 'withdrawal_done'
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatorState(FromResponse):
     # All uint variables presents in str
     pubkey: str
@@ -95,7 +95,7 @@ class ValidatorState(FromResponse):
     withdrawable_epoch: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Validator(Nested, FromResponse):
     index: str
     balance: str
@@ -103,7 +103,7 @@ class Validator(Nested, FromResponse):
     validator: ValidatorState
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockDetailsResponse(Nested, FromResponse):
     # https://ethereum.github.io/beacon-APIs/#/Beacon/getBlockV2
     message: BlockMessage
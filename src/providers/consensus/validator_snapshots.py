@@ -0,0 +1,109 @@
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+from eth_typing import HexStr
+
+from src.metrics.logging import logging
+from src.metrics.prometheus.validators import (
+    VALIDATORS_SNAPSHOT_BYTES,
+    VALIDATORS_SNAPSHOT_REQUESTS,
+    VALIDATORS_SNAPSHOT_SIZE,
+)
+from src.providers.consensus.validator_table import ValidatorTable
+from src.typings import StateRoot
+
+
+logger = logging.getLogger(__name__)
+
+
+STATE_ROOT_PATTERN = re.compile(r'^0x[0-9a-f]{64}$')
+
+
+class ValidatorSnapshotStore:
+    """
+    Validators sets stored on disk in the columnar form, one file per state root.
+
+    Validators set for the state root never changes, so snapshots never get stale.
+    When total size of the snapshots exceeds the limit, the least recently used ones are removed.
+    """
+    FILE_SUFFIX = '.validators'
+
+    def __init__(self, directory: str | Path, max_size_bytes: int):
+        self.directory = Path(directory)
+        self.max_size_bytes = max_size_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        VALIDATORS_SNAPSHOT_SIZE.set(self._get_total_size())
+
+    def load(self, state_root: StateRoot) -> Optional[ValidatorTable]:
+        path = self._get_path(state_root)
+
+        if path is None or not path.exists():
+            VALIDATORS_SNAPSHOT_REQUESTS.labels('miss').inc()
+            return None
+
+        try:
+            with open(path, 'rb') as file:
+                table = ValidatorTable.load(file)
+        except (OSError, ValueError) as error:
+            logger.warning({'msg': f'Failed to read validators snapshot {path.name}. Remove it.', 'error': str(error)})
+            path.unlink(missing_ok=True)
+            VALIDATORS_SNAPSHOT_REQUESTS.labels('miss').inc()
+            return None
+
+        # Mark snapshot as recently used
+        os.utime(path)
+
+        VALIDATORS_SNAPSHOT_REQUESTS.labels('hit').inc()
+        VALIDATORS_SNAPSHOT_BYTES.labels('read').inc(path.stat().st_size)
+        return table
+
+    def save(self, state_root: StateRoot, table: ValidatorTable) -> None:
+        path = self._get_path(state_root)
+
+        if path is None or path.exists():
+            return
+
+        # Write to the temporary file first, so partially written snapshot is never read
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'wb') as file:
+                table.dump(file)
+            os.replace(tmp_path, path)
+        except OSError as error:
+            logger.warning({'msg': f'Failed to write validators snapshot {path.name}.', 'error': str(error)})
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        VALIDATORS_SNAPSHOT_BYTES.labels('write').inc(path.stat().st_size)
+        self._evict()
+
+    def _get_path(self, state_root: StateRoot) -> Optional[Path]:
+        state_root = StateRoot(HexStr(state_root.lower()))
+        if not STATE_ROOT_PATTERN.match(state_root):
+            return None
+        return self.directory / f'{state_root}{self.FILE_SUFFIX}'
+
+    def _get_total_size(self) -> int:
+        return sum(path.stat().st_size for path in self.directory.glob(f'*{self.FILE_SUFFIX}'))
+
+    def _evict(self) -> None:
+        snapshots = []
+        for path in self.directory.glob(f'*{self.FILE_SUFFIX}'):
+            stat = path.stat()
+            snapshots.append((stat.st_mtime, stat.st_size, path))
+
+        # Least recently used first
+        snapshots.sort(key=lambda snapshot: snapshot[0])
+        total_size = sum(size for _, size, _ in snapshots)
+
+        # The most recent snapshot is kept even if it exceeds the limit on its own
+        for _, size, path in snapshots[:-1]:
+            if total_size <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+            logger.info({'msg': f'Validators snapshot {path.name} removed.'})
+
+        VALIDATORS_SNAPSHOT_SIZE.set(total_size)
@@ -0,0 +1,197 @@
+import io
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable
+
+from src.providers.consensus.typings import Validator, ValidatorState, ValidatorStatus
+
+
+PUBKEY_SIZE = 48
+WITHDRAWAL_CREDENTIALS_SIZE = 32
+
+VALIDATOR_STATUSES = tuple(ValidatorStatus)
+VALIDATOR_STATUS_CODES = {status: code for code, status in enumerate(VALIDATOR_STATUSES)}
+
+TABLE_FILE_HEADER = struct.Struct('<4sQ')
+TABLE_FILE_MAGIC = b'VTB1'
+
+
+class ValidatorTable:
+    """
+    Struct-of-arrays representation of the validators set.
+
+    Every field is parsed once and stored in its own typed column, row `i` of every column describes the same validator.
+    Numeric fields are stored as uint64 (FAR_FUTURE_EPOCH doesn't fit into int64),
+    pubkeys and withdrawal credentials are stored as fixed-width bytes.
+    It takes ~140 bytes per validator instead of ~2Kb for the nested Validator dataclasses with str fields.
+    """
+    __slots__ = (
+        'index',
+        'balance',
+        'effective_balance',
+        'activation_eligibility_epoch',
+        'activation_epoch',
+        'exit_epoch',
+        'withdrawable_epoch',
+        'slashed',
+        'status',
+        'pubkeys',
+        'withdrawal_credentials',
+        '_rows_by_pubkey',
+    )
+
+    NUMERIC_COLUMNS = (
+        'index',
+        'balance',
+        'effective_balance',
+        'activation_eligibility_epoch',
+        'activation_epoch',
+        'exit_epoch',
+        'withdrawable_epoch',
+    )
+
+    def __init__(self) -> None:
+        self.index = array('Q')
+        self.balance = array('Q')
+        self.effective_balance = array('Q')
+        self.activation_eligibility_epoch = array('Q')
+        self.activation_epoch = array('Q')
+        self.exit_epoch = array('Q')
+        self.withdrawable_epoch = array('Q')
+        self.slashed = bytearray()
+        self.status = bytearray()
+        self.pubkeys = bytearray()
+        self.withdrawal_credentials = bytearray()
+        self._rows_by_pubkey: dict[str, int] | None = None
+
+    @classmethod
+    def from_validators(cls, validators: Iterable[Validator]) -> 'ValidatorTable':
+        table = cls()
+        for validator in validators:
+            table.append(validator)
+        return table
+
+    def append(self, validator: Validator) -> None:
+        state = validator.validator
+
+        self.index.append(int(validator.index))
+        self.balance.append(int(validator.balance))
+        self.effective_balance.append(int(state.effective_balance))
+        self.activation_eligibility_epoch.append(int(state.activation_eligibility_epoch))
+        self.activation_epoch.append(int(state.activation_epoch))
+        self.exit_epoch.append(int(state.exit_epoch))
+        self.withdrawable_epoch.append(int(state.withdrawable_epoch))
+        self.slashed.append(state.slashed)
+        self.status.append(VALIDATOR_STATUS_CODES[validator.status])
+        self.pubkeys += _hex_to_fixed_bytes(state.pubkey, PUBKEY_SIZE)
+        self.withdrawal_credentials += _hex_to_fixed_bytes(state.withdrawal_credentials, WITHDRAWAL_CREDENTIALS_SIZE)
+        self._rows_by_pubkey = None
+
+    def dump(self, file: BinaryIO) -> None:
+        """Writes table to the binary file column by column. Numeric columns are stored as little-endian uint64."""
+        file.write(TABLE_FILE_HEADER.pack(TABLE_FILE_MAGIC, len(self)))
+
+        for name in self.NUMERIC_COLUMNS:
+            column = getattr(self, name)
+            if sys.byteorder == 'big':
+                column = array('Q', column)
+                column.byteswap()
+            column.tofile(file)
+
+        file.write(self.slashed)
+        file.write(self.status)
+        file.write(self.pubkeys)
+        file.write(self.withdrawal_credentials)
+
+    @classmethod
+    def load(cls, file: io.BufferedIOBase) -> 'ValidatorTable':
+        """Reads table written by `dump`. Raises ValueError if file is corrupted."""
+        header = file.read(TABLE_FILE_HEADER.size)
+        if len(header) != TABLE_FILE_HEADER.size:
+            raise ValueError('Unexpected end of the validators table file.')
+
+        magic, count = TABLE_FILE_HEADER.unpack(header)
+        if magic != TABLE_FILE_MAGIC:
+            raise ValueError('Unknown validators table file format.')
+
+        table = cls()
+
+        try:
+            for name in cls.NUMERIC_COLUMNS:
+                column = getattr(table, name)
+                column.fromfile(file, count)
+                if sys.byteorder == 'big':
+                    column.byteswap()
+        except EOFError as error:
+            raise ValueError('Unexpected end of the validators table file.') from error
+
+        table.slashed = _read_exact(file, count)
+        table.status = _read_exact(file, count)
+        table.pubkeys = _read_exact(file, count * PUBKEY_SIZE)
+        table.withdrawal_credentials = _read_exact(file, count * WITHDRAWAL_CREDENTIALS_SIZE)
+
+        if file.read(1):
+            raise ValueError('Unexpected data at the end of the validators table file.')
+
+        return table
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __sizeof__(self) -> int:
+        columns = (*self.NUMERIC_COLUMNS, 'slashed', 'status', 'pubkeys', 'withdrawal_credentials')
+        return object.__sizeof__(self) + sum(sys.getsizeof(getattr(self, name)) for name in columns)
+
+    def get_pubkey(self, row: int) -> str:
+        return '0x' + self.pubkeys[row * PUBKEY_SIZE:(row + 1) * PUBKEY_SIZE].hex()
+
+    def get_withdrawal_credentials(self, row: int) -> str:
+        offset = row * WITHDRAWAL_CREDENTIALS_SIZE
+        return '0x' + self.withdrawal_credentials[offset:offset + WITHDRAWAL_CREDENTIALS_SIZE].hex()
+
+    def get_withdrawal_credentials_prefix(self, row: int) -> int:
+        return self.withdrawal_credentials[row * WITHDRAWAL_CREDENTIALS_SIZE]
+
+    def get_status(self, row: int) -> ValidatorStatus:
+        return VALIDATOR_STATUSES[self.status[row]]
+
+    def find_row(self, pubkey: str) -> int | None:
+        """Returns row of the validator with given pubkey or None if there is no such validator"""
+        if self._rows_by_pubkey is None:
+            self._rows_by_pubkey = {self.get_pubkey(row): row for row in range(len(self))}
+        return self._rows_by_pubkey.get(pubkey.lower())
+
+    def get_validator(self, row: int) -> Validator:
+        return Validator(
+            index=str(self.index[row]),
+            balance=str(self.balance[row]),
+            status=self.get_status(row),
+            validator=ValidatorState(
+                pubkey=self.get_pubkey(row),
+                withdrawal_credentials=self.get_withdrawal_credentials(row),
+                effective_balance=str(self.effective_balance[row]),
+                slashed=bool(self.slashed[row]),
+                activation_eligibility_epoch=str(self.activation_eligibility_epoch[row]),
+                activation_epoch=str(self.activation_epoch[row]),
+                exit_epoch=str(self.exit_epoch[row]),
+                withdrawable_epoch=str(self.withdrawable_epoch[row]),
+            ),
+        )
+
+    def to_validators(self) -> list[Validator]:
+        return [self.get_validator(row) for row in range(len(self))]
+
+
+def _read_exact(file: io.BufferedIOBase, size: int) -> bytearray:
+    data = bytearray(size)
+    if file.readinto(data) != size:
+        raise ValueError('Unexpected end of the validators table file.')
+    return data
+
+
+def _hex_to_fixed_bytes(value: str, size: int) -> bytes:
+    raw = bytes.fromhex(value[2:] if value.startswith('0x') else value)
+    if len(raw) != size:
+        raise ValueError(f'Expected {size} bytes, got {len(raw)} bytes in {value}.')
+    return raw
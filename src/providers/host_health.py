@@ -0,0 +1,114 @@
+import time
+from enum import IntEnum
+from threading import Lock
+from urllib.parse import urlparse
+
+from src.metrics.prometheus.basic import HTTP_HOST_CIRCUIT_STATE, HTTP_HOST_ERROR_RATE, HTTP_HOST_LATENCY
+
+
+class CircuitState(IntEnum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class HostHealth:
+    """
+    Exponentially weighted moving averages of the latency and the error rate of the host, and its circuit breaker.
+
+    Circuit opens after several failures in a row. Open host is requested only if all other hosts failed.
+    After the cooldown the circuit is half-open: the host is requested as usual, and the next response
+    either closes the circuit or opens it again.
+    """
+    def __init__(self):
+        self.latency: float | None = None
+        self.error_rate = 0.0
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+
+    def get_state(self, now: float, cooldown: float) -> CircuitState:
+        if self.opened_at is None:
+            return CircuitState.CLOSED
+        if now - self.opened_at < cooldown:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+
+class HostsHealth:
+    """Health of every host of the provider, used to choose the order in which hosts are requested."""
+    # Weight of the latest observation in the moving averages
+    EWMA_ALPHA = 0.3
+    # Failures in a row to open the circuit
+    FAILURE_THRESHOLD = 3
+    # Seconds the circuit stays open before the host is probed again
+    COOLDOWN = 60
+    # Latency multiplier for the host that fails every request
+    ERROR_RATE_PENALTY = 10
+
+    def __init__(self, provider: str, hosts: list[str]):
+        self.provider = provider
+        self._hosts = {host: HostHealth() for host in hosts}
+        self._lock = Lock()
+
+    def sort_hosts(self, hosts: list[str]) -> list[str]:
+        """
+        Healthy hosts go first, the fastest of them first. Hosts without observations are considered the fastest,
+        so every host gets measured. Hosts with open circuit are kept at the end, so they are still requested
+        if all other hosts failed.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            def sort_key(host: str) -> tuple[bool, float]:
+                health = self._get_health(host)
+                is_open = health.get_state(now, self.COOLDOWN) == CircuitState.OPEN
+                return is_open, self._get_score(health)
+
+            return sorted(hosts, key=sort_key)
+
+    def record_success(self, host: str, latency: float) -> None:
+        with self._lock:
+            health = self._get_health(host)
+            health.latency = latency if health.latency is None else self._ewma(health.latency, latency)
+            health.error_rate = self._ewma(health.error_rate, 0)
+            health.consecutive_failures = 0
+            health.opened_at = None
+            self._export(host, health)
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            health = self._get_health(host)
+            health.error_rate = self._ewma(health.error_rate, 1)
+            health.consecutive_failures += 1
+
+            now = time.monotonic()
+            state = health.get_state(now, self.COOLDOWN)
+            if state == CircuitState.HALF_OPEN or (
+                state == CircuitState.CLOSED and health.consecutive_failures >= self.FAILURE_THRESHOLD
+            ):
+                health.opened_at = now
+
+            self._export(host, health)
+
+    def get_state(self, host: str) -> CircuitState:
+        with self._lock:
+            return self._get_health(host).get_state(time.monotonic(), self.COOLDOWN)
+
+    def _get_health(self, host: str) -> HostHealth:
+        return self._hosts.setdefault(host, HostHealth())
+
+    def _get_score(self, health: HostHealth) -> float:
+        if health.latency is None:
+            # Not measured yet or never succeeded
+            return 0 if not health.error_rate else float('inf')
+        return health.latency * (1 + self.ERROR_RATE_PENALTY * health.error_rate)
+
+    def _ewma(self, average: float, value: float) -> float:
+        return self.EWMA_ALPHA * value + (1 - self.EWMA_ALPHA) * average
+
+    def _export(self, host: str, health: HostHealth) -> None:
+        domain = urlparse(host).netloc
+        if health.latency is not None:
+            HTTP_HOST_LATENCY.labels(self.provider, domain).set(health.latency)
+        HTTP_HOST_ERROR_RATE.labels(self.provider, domain).set(health.error_rate)
+        HTTP_HOST_CIRCUIT_STATE.labels(self.provider, domain).set(health.get_state(time.monotonic(), self.COOLDOWN))
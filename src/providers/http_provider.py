@@ -1,24 +1,77 @@
+import asyncio
 import logging
+import time
 from abc import ABC
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
 from http import HTTPStatus
-from typing import Optional, Tuple, Sequence, Callable
+from threading import BoundedSemaphore, Event, Lock
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple, TypeVar
 from urllib.parse import urljoin, urlparse
 
 from prometheus_client import Histogram
-from requests import Session, JSONDecodeError
+from prometheus_client.context_managers import Timer
+from requests import Response, Session, JSONDecodeError
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 
+from src.metrics.prometheus.basic import HTTP_REQUEST_STAGE_DURATION, HTTP_RESPONSE_SIZE
 from src.providers.consistency import ProviderConsistencyModule
+from src.providers.host_health import HostsHealth
+from src.utils.json_stream import iter_json_array_items
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 class NoHostsProvided(Exception):
     pass
 
 
+class RequestPermit:
+    """
+    One of `max_concurrent_requests` permits, held while the request is sent and its response is received.
+    Released once, further releases are ignored.
+    """
+    def __init__(self, semaphore: BoundedSemaphore):
+        self._semaphore = semaphore
+        self._lock = Lock()
+        self._released = False
+        semaphore.acquire()
+
+    def release(self) -> None:
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._semaphore.release()
+
+
+@dataclass
+class PermittedResponse:
+    """Streamed response and the permit held until its body is read"""
+    response: Response
+    permit: Optional[RequestPermit] = None
+
+    def keep_permit(self, permit: RequestPermit) -> None:
+        self.permit = permit
+
+    def close(self) -> None:
+        try:
+            self.response.close()
+        finally:
+            if self.permit is not None:
+                self.permit.release()
+
+
+class RequestDiscarded(Exception):
+    """Hedged request is not sent, because the result is already received from another host"""
+
+
 class NotOkResponse(Exception):
     status: int
     text: str
@@ -29,6 +82,37 @@ class NotOkResponse(Exception):
         super().__init__(*args)
 
 
+@dataclass
+class TransferStats:
+    """Time spent waiting for the body chunks and the body size of the streamed response"""
+    seconds: float = 0
+    size: int = 0
+
+
+class EndpointLatencies:
+    """Latencies of the recent successful requests for each endpoint"""
+    SAMPLES_COUNT = 100
+    MIN_SAMPLES_COUNT = 10
+
+    def __init__(self):
+        self._samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=self.SAMPLES_COUNT))
+        self._lock = Lock()
+
+    def add(self, endpoint: str, latency: float) -> None:
+        with self._lock:
+            self._samples[endpoint].append(latency)
+
+    def get_percentile(self, endpoint: str, percentile: float) -> Optional[float]:
+        """Returns None if there are not enough samples yet"""
+        with self._lock:
+            samples = sorted(self._samples[endpoint])
+
+        if len(samples) < self.MIN_SAMPLES_COUNT:
+            return None
+
+        return samples[min(len(samples) - 1, int(len(samples) * percentile / 100))]
+
+
 class HTTPProvider(ProviderConsistencyModule, ABC):
     """
     Base HTTP Provider with metrics and retry strategy integrated inside.
@@ -42,7 +126,14 @@ class HTTPProvider(ProviderConsistencyModule, ABC):
         request_timeout: int,
         retry_total: int,
         retry_backoff_factor: int,
+        hedging_percentile: Optional[float] = None,
+        max_concurrent_requests: int = 1,
     ):
+        """
+        hedging_percentile - if set, request to the next host is sent when the current one is slower than
+        this percentile of the recent latencies of the endpoint.
+        max_concurrent_requests - limit of requests sent at the same time from different threads or coroutines.
+        """
         if not hosts:
             raise NoHostsProvided(f"No hosts provided for {self.__class__.__name__}")
 
@@ -51,13 +142,23 @@ class HTTPProvider(ProviderConsistencyModule, ABC):
         self.retry_count = retry_total
         self.backoff_factor = retry_backoff_factor
 
+        self.hedging_percentile = hedging_percentile
+        self._latencies = EndpointLatencies()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.hosts_health = HostsHealth(self.__class__.__name__, hosts)
+
+        self.max_concurrent_requests = max_concurrent_requests
+        self._requests_semaphore = BoundedSemaphore(max_concurrent_requests)
+
         retry_strategy = Retry(
             total=self.retry_count,
             status_forcelist=[418, 429, 500, 502, 503, 504],
             backoff_factor=self.backoff_factor,
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep connection for every concurrent request (and hedged requests) to each host
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=max(max_concurrent_requests, len(hosts)))
         self.session = Session()
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
@@ -82,11 +183,98 @@ class HTTPProvider(ProviderConsistencyModule, ABC):
         force_raise - function that returns an Exception if it should be thrown immediately.
         Sometimes NotOk response from first provider is the response that we are expecting.
         """
+        return self._with_fallbacks(
+            lambda host: self._get_without_fallbacks(host, endpoint, path_params, query_params),
+            force_raise,
+            endpoint=endpoint,
+        )
+
+    async def _get_async(
+        self,
+        endpoint: str,
+        path_params: Optional[Sequence[str | int]] = None,
+        query_params: Optional[dict] = None,
+        force_raise: Callable[..., Exception | None] = lambda _: None,
+    ) -> Tuple[dict | list, dict]:
+        """
+        Same as `_get`, but could be awaited together with other requests.
+        Request is sent from the worker thread, the number of concurrent requests is limited by `max_concurrent_requests`.
+        """
+        return await asyncio.to_thread(self._get, endpoint, path_params, query_params, force_raise)
+
+    def _get_stream(
+        self,
+        endpoint: str,
+        path_params: Optional[Sequence[str | int]] = None,
+        query_params: Optional[dict] = None,
+        force_raise: Callable[..., Exception | None] = lambda _: None,
+        stream_key: str = 'data',
+    ) -> Iterator[Any]:
+        """
+        Get request with fallbacks for responses with a large list under the `stream_key`.
+        Returns iterator over decoded list elements or raises exception.
+
+        The request is sent immediately, but the body is decoded element by element while it's being received,
+        so neither the whole body nor the whole decoded list is kept in memory.
+        Fallbacks are applied until response status is received, errors during body transfer are raised as is.
+        The request permit is held until the body is read or the iterator is closed.
+        """
+        response = self._with_fallbacks(
+            lambda host: PermittedResponse(
+                self._get_response_without_fallbacks(host, endpoint, path_params, query_params, stream=True)
+            ),
+            force_raise,
+            endpoint=endpoint,
+            discard=PermittedResponse.close,
+            keep_permit=PermittedResponse.keep_permit,
+        )
+        items = self._iter_response_items(response, endpoint, stream_key)
+        # Enter the generator, so the permit is released by its `finally` even if it's closed before the first item
+        next(items)
+        return items
+
+    def _with_fallbacks(
+        self,
+        request: Callable[[str], T],
+        force_raise: Callable[..., Exception | None] = lambda _: None,
+        hosts: Optional[list[str]] = None,
+        endpoint: Optional[str] = None,
+        discard: Callable[[T], None] = lambda _: None,
+        keep_permit: Optional[Callable[[T, RequestPermit], None]] = None,
+    ) -> T:
+        """
+        Calls request with every host (all provider's hosts by default) one by one until success.
+        Hosts are requested in order of their health: the fastest hosts first, hosts with open circuit last.
+
+        If hedging is enabled, the request to the next host is sent without waiting for the previous one
+        when it takes longer than usual for the endpoint. The first successful result is returned
+        and late results are passed to `discard`.
+
+        Every request holds a permit until it returns. If `keep_permit` is set, the permit of the successful request
+        is passed to it with the result instead, e.g. to be released when the streamed body is read.
+        """
+        hosts = self.hosts_health.sort_hosts(self.hosts if hosts is None else hosts)
+        request = self._with_health_tracking(request)
+
+        hedging_percentile = self.hedging_percentile
+        if hedging_percentile is not None and endpoint is not None and len(hosts) > 1:
+            return self._with_hedged_fallbacks(
+                request, force_raise, hosts, endpoint, hedging_percentile, discard, keep_permit,
+            )
+
+        return self._with_sequential_fallbacks(self._with_request_permit(request, keep_permit), force_raise, hosts)
+
+    def _with_sequential_fallbacks(
+        self,
+        request: Callable[[str], T],
+        force_raise: Callable[..., Exception | None],
+        hosts: list[str],
+    ) -> T:
         errors: list[Exception] = []
 
-        for host in self.hosts:
+        for host in hosts:
             try:
-                return self._get_without_fallbacks(host, endpoint, path_params, query_params)
+                return request(host)
             except Exception as e:  # pylint: disable=W0703
                 errors.append(e)
 
@@ -94,17 +282,165 @@ class HTTPProvider(ProviderConsistencyModule, ABC):
                 if to_force_raise := force_raise(errors):
                     raise to_force_raise from e
 
-                logger.warning(
-                    {
-                        'msg': f'[{self.__class__.__name__}] Host [{urlparse(host).netloc}] responded with error',
-                        'error': str(e),
-                        'provider': urlparse(host).netloc,
-                    }
-                )
+                self._log_host_error(host, e)
 
         # Raise error from last provider.
         raise errors[-1]
 
+    def _with_hedged_fallbacks(
+        self,
+        request: Callable[[str], T],
+        force_raise: Callable[..., Exception | None],
+        hosts: list[str],
+        endpoint: str,
+        hedging_percentile: float,
+        discard: Callable[[T], None],
+        keep_permit: Optional[Callable[[T, RequestPermit], None]],
+    ) -> T:
+        errors: list[Exception] = []
+        pending: dict[Future, str] = {}
+        not_requested_hosts = iter(hosts)
+        hedging_delay = self._latencies.get_percentile(endpoint, hedging_percentile)
+        finished = Event()
+        # Latency of every host attempt, without time spent waiting for the hedging delay and the permit
+        latencies: dict[str, float] = {}
+
+        def timed_request(host: str) -> T:
+            started_at = time.monotonic()
+            result = request(host)
+            latencies[host] = time.monotonic() - started_at
+            return result
+
+        permitted_request = self._with_request_permit(timed_request, keep_permit, finished)
+
+        def request_next_host() -> bool:
+            host = next(not_requested_hosts, None)
+            if host is None:
+                return False
+            pending[self._get_executor().submit(permitted_request, host)] = host
+            return True
+
+        def discard_pending() -> None:
+            # Requests waiting for the executor or the permit are not sent at all,
+            # responses of the already sent ones are discarded as soon as they are received
+            finished.set()
+            for future in pending:
+                if not future.cancel():
+                    future.add_done_callback(lambda f: f.exception() is None and discard(f.result()))
+
+        request_next_host()
+
+        while pending:
+            done, _ = wait(pending, timeout=hedging_delay, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # Current hosts are slower than usual, ask one more host
+                if not request_next_host():
+                    hedging_delay = None
+                continue
+
+            for future in done:
+                host = pending.pop(future)
+
+                try:
+                    result = future.result()
+                except RequestDiscarded:
+                    # Another host already responded, its result is picked up on the next wait
+                    continue
+                except Exception as e:  # pylint: disable=W0703
+                    errors.append(e)
+
+                    if to_force_raise := force_raise(errors):
+                        discard_pending()
+                        raise to_force_raise from e
+
+                    self._log_host_error(host, e)
+
+                    if not pending:
+                        request_next_host()
+                    continue
+
+                self._latencies.add(endpoint, latencies[host])
+                discard_pending()
+                return result
+
+        # Raise error from last provider.
+        raise errors[-1]
+
+    def _with_request_permit(
+        self,
+        request: Callable[[str], T],
+        keep_permit: Optional[Callable[[T, RequestPermit], None]] = None,
+        finished: Optional[Event] = None,
+    ) -> Callable[[str], T]:
+        """
+        Every request to the host holds its own permit, so hedged requests are limited by `max_concurrent_requests` too.
+        Hedged request is not sent if another host already responded (`finished` is set) while it waited for the permit.
+        """
+        def request_with_permit(host: str) -> T:
+            permit = RequestPermit(self._requests_semaphore)
+
+            try:
+                if finished is not None and finished.is_set():
+                    raise RequestDiscarded(f'Request to {urlparse(host).netloc} is not needed anymore')
+
+                result = request(host)
+
+                if finished is not None:
+                    # Set before the permit is released to the requests waiting for it
+                    finished.set()
+            except BaseException:
+                permit.release()
+                raise
+
+            if keep_permit is None:
+                permit.release()
+            else:
+                keep_permit(result, permit)
+
+            return result
+
+        return request_with_permit
+
+    def _with_health_tracking(self, request: Callable[[str], T]) -> Callable[[str], T]:
+        def tracked_request(host: str) -> T:
+            started_at = time.monotonic()
+
+            try:
+                result = request(host)
+            except NotOkResponse as error:
+                # Host is alive and responded, e.g. with 404 for missed slot
+                if error.status < HTTPStatus.INTERNAL_SERVER_ERROR:
+                    self.hosts_health.record_success(host, time.monotonic() - started_at)
+                else:
+                    self.hosts_health.record_failure(host)
+                raise error
+            except Exception as error:
+                self.hosts_health.record_failure(host)
+                raise error
+
+            self.hosts_health.record_success(host, time.monotonic() - started_at)
+            return result
+
+        return tracked_request
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.hosts) * self.max_concurrent_requests,
+                thread_name_prefix=self.__class__.__name__,
+            )
+        return self._executor
+
+    def _log_host_error(self, host: str, error: Exception) -> None:
+        logger.warning(
+            {
+                'msg': f'[{self.__class__.__name__}] Host [{urlparse(host).netloc}] responded with error',
+                'error': str(error),
+                'provider': urlparse(host).netloc,
+            }
+        )
+
     def _get_without_fallbacks(
         self,
         host: str,
@@ -116,40 +452,14 @@ class HTTPProvider(ProviderConsistencyModule, ABC):
         Simple get request without fallbacks
         Returns (data, meta) or raises exception
         """
-        complete_endpoint = endpoint.format(*path_params) if path_params else endpoint
-
         with self.PROMETHEUS_HISTOGRAM.time() as t:
-            try:
-                response = self.session.get(
-                    self._urljoin(host, complete_endpoint if path_params else endpoint),
-                    params=query_params,
-                    timeout=self.request_timeout,
-                )
-            except Exception as error:
-                logger.error({'msg': str(error)})
-                t.labels(
-                    endpoint=endpoint,
-                    code=0,
-                    domain=urlparse(host).netloc,
-                )
-                raise error
-
-            t.labels(
-                endpoint=endpoint,
-                code=response.status_code,
-                domain=urlparse(host).netloc,
-            )
-
-            response_fail_msg = f'Response from {complete_endpoint} [{response.status_code}] with text: "{str(response.text)}" returned.'
-
-            if response.status_code != HTTPStatus.OK:
-                logger.debug({'msg': response_fail_msg})
-                raise NotOkResponse(response_fail_msg, status=response.status_code, text=response.text)
+            response = self._send_get(t, host, endpoint, path_params, query_params)
 
             try:
-                json_response = response.json()
+                with self._measure_stage(endpoint, 'decode'):
+                    json_response = response.json()
             except JSONDecodeError as error:
-                logger.debug({'msg': response_fail_msg})
+                logger.debug({'msg': self._response_fail_msg(endpoint, path_params, response)})
                 raise error
 
         if 'data' in json_response:
@@ -162,6 +472,139 @@ class HTTPProvider(ProviderConsistencyModule, ABC):
 
         return data, meta
 
+    def _get_response_without_fallbacks(
+        self,
+        host: str,
+        endpoint: str,
+        path_params: Optional[Sequence[str | int]] = None,
+        query_params: Optional[dict] = None,
+        stream: bool = False,
+        headers: Optional[dict] = None,
+    ) -> Response:
+        """
+        Simple get request without fallbacks
+        Returns response with OK status or raises exception
+        """
+        with self.PROMETHEUS_HISTOGRAM.time() as t:
+            return self._send_get(t, host, endpoint, path_params, query_params, stream, headers)
+
+    def _send_get(
+        self,
+        timer: Timer,
+        host: str,
+        endpoint: str,
+        path_params: Optional[Sequence[str | int]] = None,
+        query_params: Optional[dict] = None,
+        stream: bool = False,
+        headers: Optional[dict] = None,
+    ) -> Response:
+        complete_endpoint = endpoint.format(*path_params) if path_params else endpoint
+        started_at = time.perf_counter()
+
+        try:
+            response = self.session.get(
+                self._urljoin(host, complete_endpoint if path_params else endpoint),
+                params=query_params,
+                timeout=self.request_timeout,
+                stream=stream,
+                headers=headers,
+            )
+        except Exception as error:
+            logger.error({'msg': str(error)})
+            timer.labels(
+                endpoint=endpoint,
+                code=0,
+                domain=urlparse(host).netloc,
+            )
+            raise error
+
+        timer.labels(
+            endpoint=endpoint,
+            code=response.status_code,
+            domain=urlparse(host).netloc,
+        )
+
+        if response.status_code != HTTPStatus.OK:
+            response_fail_msg = self._response_fail_msg(endpoint, path_params, response)
+            logger.debug({'msg': response_fail_msg})
+            raise NotOkResponse(response_fail_msg, status=response.status_code, text=response.text)
+
+        # Time until response headers are parsed
+        ttfb = response.elapsed.total_seconds()
+        self._observe_stage(endpoint, 'ttfb', ttfb)
+
+        if not stream:
+            # Body is already received
+            self._observe_stage(endpoint, 'transfer', max(0.0, time.perf_counter() - started_at - ttfb))
+            HTTP_RESPONSE_SIZE.labels(self.__class__.__name__, endpoint).observe(len(response.content))
+
+        return response
+
+    @staticmethod
+    def _response_fail_msg(endpoint: str, path_params: Optional[Sequence[str | int]], response: Response) -> str:
+        complete_endpoint = endpoint.format(*path_params) if path_params else endpoint
+        return f'Response from {complete_endpoint} [{response.status_code}] with text: "{str(response.text)}" returned.'
+
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def _iter_response_items(self, response: PermittedResponse, endpoint: str, stream_key: str) -> Iterator[Any]:
+        """
+        Yields None first: the caller enters the generator before returning it,
+        so the response is closed and its permit is released once the generator is finished or closed.
+        """
+        stats = TransferStats()
+        items = iter_json_array_items(self._iter_response_content(response.response, stats), stream_key)
+        # Time spent to receive and decode items, without the time spent by consumer
+        busy_seconds = 0.0
+
+        try:
+            yield None
+
+            while True:
+                started_at = time.perf_counter()
+                item = next(items, StopIteration)
+                busy_seconds += time.perf_counter() - started_at
+
+                if item is StopIteration:
+                    break
+                yield item
+        finally:
+            try:
+                self._observe_transfer(endpoint, stats, busy_seconds - stats.seconds)
+            finally:
+                response.close()
+
+    def _iter_response_content(self, response: Response, stats: TransferStats) -> Iterator[bytes]:
+        """Yields body chunks of the streamed response and collects transfer stats"""
+        chunks = iter(response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE))
+
+        while True:
+            started_at = time.perf_counter()
+            chunk = next(chunks, None)
+            stats.seconds += time.perf_counter() - started_at
+
+            if chunk is None:
+                return
+
+            stats.size += len(chunk)
+            yield chunk
+
+    def _observe_transfer(self, endpoint: str, stats: TransferStats, decode_seconds: float) -> None:
+        self._observe_stage(endpoint, 'transfer', stats.seconds)
+        self._observe_stage(endpoint, 'decode', max(0.0, decode_seconds))
+        HTTP_RESPONSE_SIZE.labels(self.__class__.__name__, endpoint).observe(stats.size)
+
+    @contextmanager
+    def _measure_stage(self, endpoint: str, stage: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._observe_stage(endpoint, stage, time.perf_counter() - started_at)
+
+    def _observe_stage(self, endpoint: str, stage: str, seconds: float) -> None:
+        HTTP_REQUEST_STAGE_DURATION.labels(self.__class__.__name__, endpoint, stage).observe(seconds)
+
     def get_all_providers(self) -> list[str]:
         return self.hosts
 
@@ -1,12 +1,18 @@
+from functools import partial
 from time import sleep
-from typing import Optional, cast
+from typing import Optional, Sequence, cast
 
-from src.metrics.prometheus.basic import KEYS_API_REQUESTS_DURATION, KEYS_API_LATEST_BLOCKNUMBER
+from src.metrics.logging import logging
+from src.metrics.prometheus.basic import KEYS_API_LATEST_BLOCKNUMBER, KEYS_API_REQUESTS_DURATION, KEYS_STORE_MODULES
 from src.providers.http_provider import HTTPProvider
+from src.providers.keys.store import KeysStore, ModuleKeys
 from src.providers.keys.typings import CatalistKey, KeysApiStatus
 from src.typings import BlockStamp
-from src.utils.dataclass import list_of_dataclasses
 from src.utils.cache import global_lru_cache as lru_cache
+from src.utils.concurrency import gather
+
+
+logger = logging.getLogger(__name__)
 
 
 class KeysOutdatedException(Exception):
@@ -26,29 +32,139 @@ class KeysAPIClient(HTTPProvider):
     PROMETHEUS_HISTOGRAM = KEYS_API_REQUESTS_DURATION
 
     USED_KEYS = 'v1/keys?used=true'
+    MODULES = 'v1/modules'
+    MODULE_KEYS = 'v1/modules/{}/keys'
     STATUS = 'v1/status'
 
+    # Wait for the fresh snapshot using status endpoint before requesting keys
+    poll_status = False
+    # Latest block number of Keys API snapshot seen in responses
+    _latest_block_number = 0
+
+    # Used keys kept between blockstamps. If not set, all used keys are fetched for every blockstamp
+    keys_store: Optional[KeysStore] = None
+
     def _get_with_blockstamp(self, url: str, blockstamp: BlockStamp, params: Optional[dict] = None) -> dict | list:
         """
         Returns response if blockstamp < blockNumber from response
         """
+        data, _ = self._get_with_block_number(url, blockstamp.block_number, params=params)
+        return data
+
+    def _get_with_block_number(
+        self,
+        url: str,
+        block_number: int,
+        path_params: Optional[Sequence[str | int]] = None,
+        params: Optional[dict] = None,
+    ) -> tuple[dict | list, dict]:
+        """
+        Returns response and its elBlockSnapshot if block_number <= blockNumber from response
+        """
+        self._wait_for_block_number(block_number)
+
         for i in range(self.retry_count):
-            data, meta = self._get(url, query_params=params)
-            blocknumber_meta = meta['meta']['elBlockSnapshot']['blockNumber']
-            KEYS_API_LATEST_BLOCKNUMBER.set(blocknumber_meta)
-            if blocknumber_meta >= blockstamp.block_number:
-                return data
+            data, meta = self._get(url, path_params, params)
+            # Snapshot is in the "meta" field for keys and in the root for modules
+            el_block_snapshot = meta.get('meta', meta)['elBlockSnapshot']
+            blocknumber_meta = self._set_latest_block_number(el_block_snapshot['blockNumber'])
+            if blocknumber_meta >= block_number:
+                return data, el_block_snapshot
+
+            if i != self.retry_count - 1:
+                sleep(self.backoff_factor)
+
+        raise KeysOutdatedException(f'Keys API Service stuck, no updates for {self.backoff_factor * self.retry_count} seconds.')
+
+    def _wait_for_block_number(self, block_number: int) -> None:
+        """
+        Polls small status response until Keys API snapshot reaches the block number,
+        so large responses are not downloaded only to find out they are outdated.
+        """
+        if not self.poll_status or self._latest_block_number >= block_number:
+            return
+
+        for i in range(self.retry_count):
+            el_block_snapshot = self.get_status().elBlockSnapshot
+            if el_block_snapshot is None:
+                # Snapshot is not reported in the status, the response itself will be checked
+                return
+
+            if self._set_latest_block_number(el_block_snapshot['blockNumber']) >= block_number:
+                return
 
             if i != self.retry_count - 1:
                 sleep(self.backoff_factor)
 
         raise KeysOutdatedException(f'Keys API Service stuck, no updates for {self.backoff_factor * self.retry_count} seconds.')
 
-    @lru_cache(maxsize=1)
-    @list_of_dataclasses(CatalistKey.from_response)
-    def get_used_catalist_keys(self, blockstamp: BlockStamp) -> list[dict]:
-        """Docs: https://keys-api.catalist.fi/api/static/index.html#/keys/KeysController_get"""
-        return cast(list[dict], self._get_with_blockstamp(self.USED_KEYS, blockstamp))
+    def _set_latest_block_number(self, block_number: int) -> int:
+        KEYS_API_LATEST_BLOCKNUMBER.set(block_number)
+        self._latest_block_number = block_number
+        return block_number
+
+    @lru_cache()
+    def get_used_catalist_keys(self, blockstamp: BlockStamp, full_resync: bool = False) -> list[CatalistKey]:
+        """
+        Docs: https://keys-api.catalist.fi/api/static/index.html#/keys/KeysController_get
+
+        full_resync - fetch keys of all modules even if they are stored already.
+        """
+        if self.keys_store is not None:
+            return self._get_used_catalist_keys_from_store(self.keys_store, blockstamp, full_resync)
+
+        keys = cast(list[dict], self._get_with_blockstamp(self.USED_KEYS, blockstamp))
+
+        with self._measure_stage(self.USED_KEYS, 'materialize'):
+            return [CatalistKey.from_response(**key) for key in keys]
+
+    def _get_used_catalist_keys_from_store(
+        self,
+        keys_store: KeysStore,
+        blockstamp: BlockStamp,
+        full_resync: bool,
+    ) -> list[CatalistKey]:
+        """
+        Docs: https://keys-api.catalist.fi/api/static/index.html#/modules/SRModulesController_getModules
+
+        Only modules with changed nonce are fetched, keys of the other modules are taken from the store.
+        """
+        with keys_store.lock:
+            if full_resync:
+                logger.info({'msg': 'Fetch keys of all staking modules from Keys API.'})
+                keys_store.clear()
+
+            modules, el_block_snapshot = self._get_with_block_number(self.MODULES, blockstamp.block_number)
+            modules = cast(list[dict], modules)
+
+            outdated_modules = [
+                module for module in modules
+                if keys_store.get_nonce(module['stakingModuleAddress']) != module['nonce']
+            ]
+            KEYS_STORE_MODULES.labels('reused').inc(len(modules) - len(outdated_modules))
+            KEYS_STORE_MODULES.labels('fetched').inc(len(outdated_modules))
+
+            fetched_modules = gather(*(
+                partial(self._get_module_used_keys, module, el_block_snapshot['blockNumber'])
+                for module in outdated_modules
+            ))
+
+            keys_store.update(el_block_snapshot, {
+                module['stakingModuleAddress']: module_keys
+                for module, module_keys in zip(outdated_modules, fetched_modules)
+            })
+
+            return keys_store.get_keys([module['stakingModuleAddress'] for module in modules])
+
+    def _get_module_used_keys(self, module: dict, block_number: int) -> ModuleKeys:
+        """Docs: https://keys-api.catalist.fi/api/static/index.html#/sr-module-keys/SRModulesKeysController_getModuleKeys"""
+        # Keys should not be older than the nonce of the module, otherwise they would be stored as up-to-date
+        data, _ = self._get_with_block_number(self.MODULE_KEYS, block_number, [module['id']], {'used': 'true'})
+
+        with self._measure_stage(self.MODULE_KEYS, 'materialize'):
+            keys = [CatalistKey.from_response(**key) for key in cast(dict, data)['keys']]
+
+        return ModuleKeys(module['nonce'], keys)
 
     def get_status(self) -> KeysApiStatus:
         """Docs: https://keys-api.catalist.fi/api/static/index.html#/status/StatusController_get"""
@@ -0,0 +1,103 @@
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from src.metrics.logging import logging
+from src.providers.keys.typings import CatalistKey
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModuleKeys:
+    # Nonce of the staking module the keys were fetched at. Nonce is increased on every change of the module keys
+    nonce: int
+    keys: list[CatalistKey]
+
+
+class KeysStore:
+    """
+    Used keys of every staking module with the module nonce they were fetched at.
+
+    Used keys are never deleted, so the keys of the module are fetched again only if the module nonce changed.
+    If path is set, keys are saved to the file and are reused after restart.
+    """
+    VERSION = 1
+
+    def __init__(self, path: Optional[str | Path] = None):
+        self.path = Path(path) if path else None
+        self.el_block_snapshot: Optional[dict] = None
+        self._modules: dict[str, ModuleKeys] = {}
+        self.lock = Lock()
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    def get_nonce(self, module_address: str) -> Optional[int]:
+        module = self._modules.get(module_address)
+        return None if module is None else module.nonce
+
+    def get_keys(self, module_addresses: list[str]) -> list[CatalistKey]:
+        keys: list[CatalistKey] = []
+        for address in module_addresses:
+            if address in self._modules:
+                keys.extend(self._modules[address].keys)
+        return keys
+
+    def update(self, el_block_snapshot: dict, modules: dict[str, ModuleKeys]) -> None:
+        self.el_block_snapshot = el_block_snapshot
+        self._modules.update(modules)
+
+        if self.path is not None and modules:
+            self._save()
+
+    def clear(self) -> None:
+        self.el_block_snapshot = None
+        self._modules.clear()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r') as file:
+                data = json.load(file)
+
+            if data['version'] != self.VERSION:
+                return
+
+            self._modules = {
+                address: ModuleKeys(module['nonce'], [CatalistKey(**key) for key in module['keys']])
+                for address, module in data['modules'].items()
+            }
+            self.el_block_snapshot = data['elBlockSnapshot']
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning({'msg': f'Failed to read keys from {self.path}. Keys will be fetched again.', 'error': str(error)})
+            self.clear()
+
+    def _save(self) -> None:
+        assert self.path is not None
+
+        data = {
+            'version': self.VERSION,
+            'elBlockSnapshot': self.el_block_snapshot,
+            'modules': {
+                address: {'nonce': module.nonce, 'keys': [asdict(key) for key in module.keys]}
+                for address, module in self._modules.items()
+            },
+        }
+
+        # Write to the temporary file first, so partially written keys are never read
+        tmp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'w') as file:
+                json.dump(data, file)
+            os.replace(tmp_path, self.path)
+        except OSError as error:
+            logger.warning({'msg': f'Failed to write keys to {self.path}.', 'error': str(error)})
+            tmp_path.unlink(missing_ok=True)
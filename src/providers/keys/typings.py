@@ -1,11 +1,12 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from eth_typing import ChecksumAddress, HexStr
 
 from src.utils.dataclass import FromResponse
 
 
-@dataclass
+@dataclass(slots=True)
 class CatalistKey(FromResponse):
     key: HexStr
     depositSignature: HexStr
@@ -14,7 +15,9 @@ class CatalistKey(FromResponse):
     moduleAddress: ChecksumAddress
 
 
-@dataclass
+@dataclass(slots=True)
 class KeysApiStatus(FromResponse):
     appVersion: str
     chainId: int
+    # Latest EL block processed by Keys API
+    elBlockSnapshot: Optional[dict] = None
@@ -48,13 +48,13 @@ class BunkerService:
     ) -> bool:
         """If any of cases is True, then bunker mode is ON"""
         bunker_config = self._get_config(blockstamp)
-        all_validators = self.w3.cc.get_validators(blockstamp)
+        all_validators_table = self.w3.cc.get_validators_table(blockstamp)
         catalist_validators = self.w3.catalist_validators.get_catalist_validators(blockstamp)
 
         # Set metrics
-        ALL_VALIDATORS.set(len(all_validators))
+        ALL_VALIDATORS.set(len(all_validators_table))
         CATALIST_VALIDATORS.set(len(catalist_validators))
-        ALL_SLASHED_VALIDATORS.set(len(filter_slashed_validators(all_validators)))
+        ALL_SLASHED_VALIDATORS.set(all_validators_table.slashed.count(1))
         CATALIST_SLASHED_VALIDATORS.set(len(filter_slashed_validators(catalist_validators)))
 
         last_report_ref_slot = self.w3.catalist_contracts.get_accounting_last_processing_ref_slot(blockstamp)
@@ -71,14 +71,20 @@ class BunkerService:
             return True
 
         high_midterm_slashing_penalty = MidtermSlashingPenalty.is_high_midterm_slashing_penalty(
-            blockstamp, frame_config, chain_config, all_validators, catalist_validators, current_report_cl_rebase, last_report_ref_slot
+            blockstamp,
+            frame_config,
+            chain_config,
+            all_validators_table,
+            catalist_validators,
+            current_report_cl_rebase,
+            last_report_ref_slot,
         )
         if high_midterm_slashing_penalty:
             logger.info({"msg": "Bunker ON. High midterm slashing penalty"})
             return True
 
         abnormal_cl_rebase = AbnormalClRebase(self.w3, chain_config, bunker_config).is_abnormal_cl_rebase(
-            blockstamp, all_validators, catalist_validators, current_report_cl_rebase
+            blockstamp, self.w3.cc.get_validators(blockstamp), catalist_validators, current_report_cl_rebase
         )
         if abnormal_cl_rebase:
             logger.info({"msg": "Bunker ON. Abnormal CL rebase"})
@@ -22,7 +22,7 @@ logger = logging.getLogger(__name__)
 
 class AbnormalClRebase:
 
-    all_validators: list[Validator]
+    all_validators: Sequence[Validator]
     catalist_validators: list[CatalistValidator]
     catalist_keys: list[CatalistKey]
 
@@ -34,7 +34,7 @@ class AbnormalClRebase:
     def is_abnormal_cl_rebase(
         self,
         blockstamp: ReferenceBlockStamp,
-        all_validators: list[Validator],
+        all_validators: Sequence[Validator],
         catalist_validators: list[CatalistValidator],
         current_report_cl_rebase: Gwei
     ) -> bool:
@@ -1,5 +1,7 @@
 import logging
-from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from typing import Iterable, Optional, Sequence
 
 from src.constants import (
     EPOCHS_PER_SLASHINGS_VECTOR,
@@ -9,14 +11,37 @@ from src.constants import (
 )
 from src.modules.submodules.typings import FrameConfig, ChainConfig
 from src.providers.consensus.typings import Validator
+from src.providers.consensus.validator_table import ValidatorTable
 from src.typings import EpochNumber, Gwei, ReferenceBlockStamp, FrameNumber, SlotNumber
-from src.utils.validator_state import calculate_total_active_effective_balance
+from src.utils.validator_state import calculate_table_total_active_effective_balance
 from src.web3py.extensions.catalist_validators import CatalistValidator
 
 
 logger = logging.getLogger(__name__)
 
 
+class SlashedEpochsIndex:
+    """
+    Counts slashed validators that could have been slashed in the given epochs range.
+
+    Every validator has a range of possible slashed epochs. Range intersects [a, b] unless it ends before `a`
+    or starts after `b`, and both can't be true at once. So the count is
+    total - count(range_end < a) - count(range_start > b), two binary searches in the sorted range bounds.
+    """
+    def __init__(self, slashed_epochs_ranges: Iterable[tuple[EpochNumber, EpochNumber]]):
+        ranges = [(start, end) for start, end in slashed_epochs_ranges if start <= end]
+        self.starts = sorted(start for start, _ in ranges)
+        self.ends = sorted(end for _, end in ranges)
+
+    def count_in_range(self, from_epoch: int, to_epoch: int) -> int:
+        if from_epoch > to_epoch:
+            return 0
+
+        ended_before = bisect_left(self.ends, from_epoch)
+        started_after = len(self.starts) - bisect_right(self.starts, to_epoch)
+        return len(self.starts) - ended_before - started_after
+
+
 class MidtermSlashingPenalty:
 
     @staticmethod
@@ -24,8 +49,8 @@ class MidtermSlashingPenalty:
         blockstamp: ReferenceBlockStamp,
         frame_config: FrameConfig,
         chain_config: ChainConfig,
-        all_validators: list[Validator],
-        catalist_validators: list[CatalistValidator],
+        all_validators: ValidatorTable,
+        catalist_validators: Sequence[CatalistValidator],
         current_report_cl_rebase: Gwei,
         last_report_ref_slot: SlotNumber
     ) -> bool:
@@ -55,7 +80,7 @@ class MidtermSlashingPenalty:
 
         # We should calculate total balance for each midterm penalty epoch and
         # make projection based on the current state of the chain
-        total_balance = calculate_total_active_effective_balance(all_validators, blockstamp.ref_epoch)
+        total_balance = calculate_table_total_active_effective_balance(all_validators, blockstamp.ref_epoch)
 
         # Calculate sum of Catalist midterm penalties in each future frame
         frames_catalist_midterm_penalties = MidtermSlashingPenalty.get_future_midterm_penalty_sum_in_frames(
@@ -79,7 +104,7 @@ class MidtermSlashingPenalty:
 
     @staticmethod
     def get_slashed_validators_with_impact_on_midterm_penalties(
-        validators: list[Validator],
+        validators: ValidatorTable,
         ref_epoch: EpochNumber
     ) -> list[Validator]:
         """
@@ -98,11 +123,14 @@ class MidtermSlashingPenalty:
         ref_epoch < withdrawable_epoch
 
         https://github.com/ethereum/consensus-specs/blob/dev/specs/phase0/beacon-chain.md#slash_validator
-        """
-        def is_have_impact(v: Validator) -> bool:
-            return v.validator.slashed and int(v.validator.withdrawable_epoch) > ref_epoch
 
-        return list(filter(is_have_impact, validators))
+        Only the columns are scanned, validators are built for the matched rows.
+        """
+        return [
+            validators.get_validator(row)
+            for row, (slashed, withdrawable_epoch) in enumerate(zip(validators.slashed, validators.withdrawable_epoch))
+            if slashed and withdrawable_epoch > ref_epoch
+        ]
 
     @staticmethod
     def get_possible_slashed_epochs(validator: Validator, ref_epoch: EpochNumber) -> list[EpochNumber]:
@@ -117,23 +145,41 @@ class MidtermSlashingPenalty:
         https://github.com/ethereum/consensus-specs/blob/dev/specs/altair/beacon-chain.md#modified-slash_validator
         https://github.com/ethereum/consensus-specs/blob/dev/specs/phase0/beacon-chain.md#initiate_validator_exit
         """
+        start_epoch, end_epoch = MidtermSlashingPenalty.get_possible_slashed_epochs_range(validator, ref_epoch)
+        return [EpochNumber(epoch) for epoch in range(start_epoch, end_epoch + 1)]
+
+    @staticmethod
+    def get_possible_slashed_epochs_range(
+        validator: Validator,
+        ref_epoch: EpochNumber,
+    ) -> tuple[EpochNumber, EpochNumber]:
+        """
+        Same as `get_possible_slashed_epochs`, but returns the first and the last epoch of the range.
+        Range is empty if the first epoch is greater than the last one.
+        """
         v = validator.validator
 
         if int(v.withdrawable_epoch) - int(v.exit_epoch) > MIN_VALIDATOR_WITHDRAWABILITY_DELAY:
             determined_slashed_epoch = EpochNumber(int(v.withdrawable_epoch) - EPOCHS_PER_SLASHINGS_VECTOR)
-            return [determined_slashed_epoch]
+            return determined_slashed_epoch, determined_slashed_epoch
 
         earliest_possible_slashed_epoch = max(0, ref_epoch - EPOCHS_PER_SLASHINGS_VECTOR)
         # We get here `min` because exit queue can be greater than `EPOCHS_PER_SLASHINGS_VECTOR`
         # So possible slashed epoch can not be greater than `ref_epoch`
         latest_possible_epoch = min(ref_epoch, int(v.withdrawable_epoch) - EPOCHS_PER_SLASHINGS_VECTOR)
-        return [EpochNumber(epoch) for epoch in range(earliest_possible_slashed_epoch, latest_possible_epoch + 1)]
+        return EpochNumber(earliest_possible_slashed_epoch), EpochNumber(latest_possible_epoch)
+
+    @staticmethod
+    def get_slashed_epochs_index(ref_epoch: EpochNumber, slashed_validators: Sequence[Validator]) -> SlashedEpochsIndex:
+        return SlashedEpochsIndex(
+            MidtermSlashingPenalty.get_possible_slashed_epochs_range(v, ref_epoch) for v in slashed_validators
+        )
 
     @staticmethod
     def get_catalist_validators_with_future_midterm_epoch(
         ref_epoch: EpochNumber,
         frame_config: FrameConfig,
-        catalist_validators: list[CatalistValidator],
+        catalist_validators: Sequence[CatalistValidator],
     ) -> dict[FrameNumber, list[CatalistValidator]]:
         """
         Put validators to frame buckets by their midterm penalty epoch to calculate penalties impact in each frame
@@ -155,18 +201,21 @@ class MidtermSlashingPenalty:
     @staticmethod
     def get_future_midterm_penalty_sum_in_frames(
         ref_epoch: EpochNumber,
-        all_slashed_validators: list[Validator],
+        all_slashed_validators: Sequence[Validator],
         total_balance: Gwei,
         per_frame_validators: dict[FrameNumber, list[CatalistValidator]],
     ) -> dict[FrameNumber, Gwei]:
         """Calculate sum of midterm penalties in each frame"""
+        slashed_epochs_index = MidtermSlashingPenalty.get_slashed_epochs_index(ref_epoch, all_slashed_validators)
+
         per_frame_midterm_penalty_sum: dict[FrameNumber, Gwei] = {}
         for frame_number, validators_in_future_frame in per_frame_validators.items():
             per_frame_midterm_penalty_sum[frame_number] = MidtermSlashingPenalty.predict_midterm_penalty_in_frame(
                 ref_epoch,
                 all_slashed_validators,
                 total_balance,
-                validators_in_future_frame
+                validators_in_future_frame,
+                slashed_epochs_index,
             )
 
         return per_frame_midterm_penalty_sum
@@ -174,19 +223,32 @@ class MidtermSlashingPenalty:
     @staticmethod
     def predict_midterm_penalty_in_frame(
         ref_epoch: EpochNumber,
-        all_slashed_validators: list[Validator],
+        all_slashed_validators: Sequence[Validator],
         total_balance: Gwei,
-        midterm_penalized_validators_in_frame: list[CatalistValidator]
+        midterm_penalized_validators_in_frame: Sequence[CatalistValidator],
+        slashed_epochs_index: Optional[SlashedEpochsIndex] = None,
     ) -> Gwei:
-        """Predict penalty in frame"""
+        """
+        Predict penalty in frame
+
+        Penalty depends only on the midterm penalty epoch and the effective balance of the validator,
+        so it is calculated once for every such pair and multiplied by the number of validators.
+        """
+        if slashed_epochs_index is None:
+            slashed_epochs_index = MidtermSlashingPenalty.get_slashed_epochs_index(ref_epoch, all_slashed_validators)
+
+        penalized_validators_count = Counter(
+            (MidtermSlashingPenalty.get_midterm_penalty_epoch(validator), int(validator.validator.effective_balance))
+            for validator in midterm_penalized_validators_in_frame
+        )
+
         penalty_in_frame = 0
-        for validator in midterm_penalized_validators_in_frame:
-            midterm_penalty_epoch = MidtermSlashingPenalty.get_midterm_penalty_epoch(validator)
-            bound_slashed_validators = MidtermSlashingPenalty.get_bound_with_midterm_epoch_slashed_validators(
-                ref_epoch, all_slashed_validators, EpochNumber(midterm_penalty_epoch)
+        for (midterm_penalty_epoch, effective_balance), validators_count in penalized_validators_count.items():
+            bound_slashed_validators_count = slashed_epochs_index.count_in_range(
+                max(0, midterm_penalty_epoch - EPOCHS_PER_SLASHINGS_VECTOR), midterm_penalty_epoch
             )
-            penalty_in_frame += MidtermSlashingPenalty.get_validator_midterm_penalty(
-                validator, len(bound_slashed_validators), total_balance
+            penalty_in_frame += validators_count * MidtermSlashingPenalty.get_midterm_penalty(
+                effective_balance, bound_slashed_validators_count, total_balance
             )
         return Gwei(penalty_in_frame)
 
@@ -200,12 +262,17 @@ class MidtermSlashingPenalty:
         Calculate midterm penalty for particular validator
         https://github.com/ethereum/consensus-specs/blob/dev/specs/phase0/beacon-chain.md#slashings
         """
+        return MidtermSlashingPenalty.get_midterm_penalty(
+            int(validator.validator.effective_balance), bound_slashed_validators_count, total_balance
+        )
+
+    @staticmethod
+    def get_midterm_penalty(effective_balance: int, bound_slashed_validators_count: int, total_balance: Gwei) -> Gwei:
         # We don't know which balance was at slashing epoch, so we make a pessimistic assumption that it was 32 ETH
         slashings = Gwei(bound_slashed_validators_count * MAX_EFFECTIVE_BALANCE)
         adjusted_total_slashing_balance = min(
             slashings * PROPORTIONAL_SLASHING_MULTIPLIER_BELLATRIX, total_balance
         )
-        effective_balance = int(validator.validator.effective_balance)
         penalty_numerator = effective_balance // EFFECTIVE_BALANCE_INCREMENT * adjusted_total_slashing_balance
         penalty = penalty_numerator // total_balance * EFFECTIVE_BALANCE_INCREMENT
 
@@ -214,7 +281,7 @@ class MidtermSlashingPenalty:
     @staticmethod
     def get_bound_with_midterm_epoch_slashed_validators(
         ref_epoch: EpochNumber,
-        slashed_validators: list[Validator],
+        slashed_validators: Sequence[Validator],
         midterm_penalty_epoch: EpochNumber,
     ) -> list[Validator]:
         """
@@ -224,8 +291,8 @@ class MidtermSlashingPenalty:
         min_bound_epoch = max(0, midterm_penalty_epoch - EPOCHS_PER_SLASHINGS_VECTOR)
 
         def is_bound(v: Validator) -> bool:
-            possible_slashing_epochs = MidtermSlashingPenalty.get_possible_slashed_epochs(v, ref_epoch)
-            return any(min_bound_epoch <= epoch <= midterm_penalty_epoch for epoch in possible_slashing_epochs)
+            start_epoch, end_epoch = MidtermSlashingPenalty.get_possible_slashed_epochs_range(v, ref_epoch)
+            return max(start_epoch, min_bound_epoch) <= min(end_epoch, midterm_penalty_epoch)
 
         return list(filter(is_bound, slashed_validators))
 
@@ -1,6 +1,7 @@
 import dataclasses
+import heapq
 import logging
-from typing import Iterator
+from typing import Iterator, Optional
 
 from eth_typing import ChecksumAddress
 
@@ -35,6 +36,13 @@ class ExitOrderIterator:
        | Validator with the lowest index
        V
 
+    Validators of every operator are ordered by index, and operators are kept in the heap by their predicates
+    and the lowest index of their validators. So the first validator in the heap is the same as in the fully sorted queue.
+    Only stats of the operator of the ejected validator change, so only this operator is pushed to the heap again.
+    Stale heap entries are skipped by version.
+    The exception is the stake weight predicate, which depends on the total number of predictable validators.
+    The total only decreases, so operators can only cross the network penetration threshold upwards.
+    Operators under the threshold are kept in a separate heap by validators count, to be pushed again once they cross it.
     """
     left_queue_count: int
     max_validators_to_exit: int
@@ -45,6 +53,13 @@ class ExitOrderIterator:
     staking_module_id: dict[ChecksumAddress, StakingModuleId]
     operator_network_penetration_threshold: float
 
+    # Queue state is built from `exitable_catalist_validators` on the first `__next__`
+    _queue_source: Optional[list[CatalistValidator]] = None
+    _operator_validators: dict[NodeOperatorGlobalIndex, list[CatalistValidator]]
+    _operator_versions: dict[NodeOperatorGlobalIndex, int]
+    _operators_heap: list[tuple[tuple, int, int, NodeOperatorGlobalIndex]]
+    _under_threshold_heap: list[tuple[int, int, NodeOperatorGlobalIndex]]
+
     def __init__(self, web3: Web3, blockstamp: ReferenceBlockStamp, chain_config: ChainConfig):
         self.w3 = web3
         self.blockstamp = blockstamp
@@ -62,8 +77,9 @@ class ExitOrderIterator:
         self.max_validators_to_exit = eois.get_oracle_report_limits(self.blockstamp).max_validator_exit_requests_per_report
         self.operator_network_penetration_threshold = eois.get_operator_network_penetration_threshold(self.blockstamp)
 
-        # Prepare list of exitable validators, which will be sorted by exit order predicates
+        # Prepare list of exitable validators, which will be ordered by exit order predicates
         self.exitable_catalist_validators = eois.get_exitable_catalist_validators()
+        self._queue_source = None
         # Prepare dict of node operators stats to sort exitable validators
         self.catalist_node_operator_stats = eois.prepare_catalist_node_operator_stats(self.blockstamp, self.chain_config)
         # And total predictable validators count to stake weight sort predicate
@@ -73,29 +89,101 @@ class ExitOrderIterator:
         )
 
         # Prepare dict of staking module id by staking module address for faster search
-        self.staking_module_id = {
-            operator.staking_module.staking_module_address: operator.staking_module.id
-            for operator in self.w3.catalist_validators.get_catalist_node_operators(self.blockstamp)
-        }
+        self.staking_module_id = self.w3.catalist_validators.get_catalist_validators_index(
+            self.blockstamp
+        ).staking_module_ids
         return self
 
     @duration_meter()
     def __next__(self) -> tuple[NodeOperatorGlobalIndex, CatalistValidator]:
         """
-        Sort the queue, pop validator from the queue, decrease particular operator stats and return validator from order
+        Pop validator with the highest exit priority, decrease particular operator stats and return validator from order
         """
         if self.left_queue_count >= self.max_validators_to_exit:
             raise StopIteration
 
-        if not self.exitable_catalist_validators:
+        if self._queue_source is not self.exitable_catalist_validators:
+            self._build_queue()
+
+        global_index = self._pop_operator()
+        if global_index is None:
             raise StopIteration
 
-        self.exitable_catalist_validators.sort(key=self._predicates)
-        to_exit = self.exitable_catalist_validators.pop(0)
+        to_exit = self._operator_validators[global_index].pop()
         global_index = self._decrease_node_operator_stats(to_exit)
+        self._push_operator(global_index)
+        self._push_operators_crossed_threshold()
+
         self.left_queue_count += 1
         return global_index, to_exit
 
+    def _build_queue(self) -> None:
+        self._queue_source = self.exitable_catalist_validators
+        self._operator_validators = {}
+        self._operator_versions = {}
+        self._operators_heap = []
+        self._under_threshold_heap = []
+
+        for validator in self.exitable_catalist_validators:
+            global_index = ExitOrderIterator.operator_index_by_validator(self.staking_module_id, validator)
+            self._operator_validators.setdefault(global_index, []).append(validator)
+
+        for global_index, validators in self._operator_validators.items():
+            # The lowest index is the last one, so it is popped in O(1)
+            validators.sort(key=self._validator_index, reverse=True)
+            self._operator_versions[global_index] = 0
+            self._push_operator(global_index)
+
+    def _push_operator(self, global_index: NodeOperatorGlobalIndex) -> None:
+        """Pushes operator with the current stats. Previous entries of the operator become stale"""
+        self._operator_versions[global_index] += 1
+
+        validators = self._operator_validators[global_index]
+        if not validators:
+            return
+
+        version = self._operator_versions[global_index]
+        operator_stats = self.catalist_node_operator_stats[global_index]
+        heapq.heappush(
+            self._operators_heap,
+            (self._operator_predicates(operator_stats), self._validator_index(validators[-1]), version, global_index),
+        )
+
+        if not self._is_over_penetration_threshold(operator_stats):
+            heapq.heappush(
+                self._under_threshold_heap,
+                (-operator_stats.predictable_validators_count, version, global_index),
+            )
+
+    def _pop_operator(self) -> Optional[NodeOperatorGlobalIndex]:
+        while self._operators_heap:
+            _, _, version, global_index = heapq.heappop(self._operators_heap)
+            if version == self._operator_versions[global_index]:
+                return global_index
+        return None
+
+    def _push_operators_crossed_threshold(self) -> None:
+        """
+        Operator with more validators crosses the threshold first,
+        so the check stops on the first operator that is still under the threshold.
+        """
+        while self._under_threshold_heap:
+            _, version, global_index = self._under_threshold_heap[0]
+
+            if version != self._operator_versions[global_index]:
+                heapq.heappop(self._under_threshold_heap)
+                continue
+
+            if not self._is_over_penetration_threshold(self.catalist_node_operator_stats[global_index]):
+                break
+
+            heapq.heappop(self._under_threshold_heap)
+            self._push_operator(global_index)
+
+    def _is_over_penetration_threshold(self, operator_stats: NodeOperatorPredictableState) -> bool:
+        stake_volume = operator_stats.predictable_validators_count / self.total_predictable_validators_count
+        return stake_volume > self.operator_network_penetration_threshold
+
     def _decrease_node_operator_stats(self, validator: CatalistValidator) -> NodeOperatorGlobalIndex:
         """
         Sub particular validator stats from its node operator stats
@@ -121,6 +209,12 @@ class ExitOrderIterator:
     def _predicates(self, validator: CatalistValidator) -> tuple:
         global_index = ExitOrderIterator.operator_index_by_validator(self.staking_module_id, validator)
         operator_stats = self.catalist_node_operator_stats[global_index]
+        return (
+            *self._operator_predicates(operator_stats),
+            self._validator_index(validator),
+        )
+
+    def _operator_predicates(self, operator_stats: NodeOperatorPredictableState) -> tuple:
         return (
             # positive mean asc sorting
             # negative mean desc sorting
@@ -130,7 +224,6 @@ class ExitOrderIterator:
                 operator_stats, self.total_predictable_validators_count, self.operator_network_penetration_threshold
             ),
             -self._operator_predictable_validators(operator_stats),
-            self._validator_index(validator),
         )
 
     @staticmethod
@@ -1,8 +1,6 @@
 from dataclasses import dataclass
 
-from more_itertools import ilen
-
-from src.constants import TOTAL_BASIS_POINTS
+from src.constants import FAR_FUTURE_EPOCH, TOTAL_BASIS_POINTS
 from src.modules.submodules.typings import ChainConfig
 from src.services.validator_state import CatalistValidatorStateService
 from src.typings import ReferenceBlockStamp
@@ -93,12 +91,11 @@ class ExitOrderIteratorStateService(CatalistValidatorStateService):
         catalist_node_operator_stats: dict[NodeOperatorGlobalIndex, NodeOperatorPredictableState]
     ) -> int:
         """Get total predictable validators count for stake weight calculation"""
-        catalist_validators = {
-            v.validator.pubkey: v for v in self.w3.catalist_validators.get_catalist_validators(blockstamp)
-        }
-        not_catalist_predictable_validators_count = ilen(
-            v for v in self.w3.cc.get_validators(blockstamp)
-            if v.validator.pubkey not in catalist_validators and not is_on_exit(v)
+        catalist_validators = self.w3.catalist_validators.get_catalist_validators_index(blockstamp).by_pubkey
+        # Validators that are not on exit are counted by the exit_epoch column, Catalist ones are subtracted
+        predictable_validators_count = self.w3.cc.get_validators_table(blockstamp).exit_epoch.count(FAR_FUTURE_EPOCH)
+        not_catalist_predictable_validators_count = predictable_validators_count - sum(
+            1 for v in catalist_validators.values() if not is_on_exit(v)
         )
         catalist_predictable_validators_count = sum(
             o.predictable_validators_count for o in catalist_node_operator_stats.values()
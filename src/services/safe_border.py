@@ -1,4 +1,5 @@
 import math
+from functools import partial
 from typing import Any, Iterable, Optional
 
 from eth_typing import HexStr
@@ -9,10 +10,12 @@ from src.modules.submodules.consensus import ChainConfig, FrameConfig
 from src.modules.accounting.typings import OracleReportLimits
 from src.utils.web3converter import Web3Converter
 from src.utils.abi import named_tuple_to_dataclass
+from src.utils.concurrency import gather
 from src.typings import EpochNumber, FrameNumber, ReferenceBlockStamp, SlotNumber
 from src.web3py.extensions.catalist_validators import Validator
 from src.web3py.typings import Web3
 from src.utils.slot import get_blockstamp
+from src.variables import HTTP_REQUEST_MAX_CONCURRENCY
 
 
 class WrongExitPeriod(Exception):
@@ -40,6 +43,11 @@ class SafeBorder(Web3Converter):
     blockstamp: ReferenceBlockStamp
     converter: Web3Converter
 
+    # Frames checked concurrently on every step of the slashed epoch search
+    SLASHINGS_SEARCH_PROBES = max(HTTP_REQUEST_MAX_CONCURRENCY, 1)
+    # Keeps the validators request url short enough
+    MAX_PUBKEYS_PER_REQUEST = 64
+
     def __init__(
         self,
         w3: Web3,
@@ -195,33 +203,69 @@ class SafeBorder(Web3Converter):
         slashed_pubkeys = set(v.validator.pubkey for v in validators)
 
         # Since the border will be rounded to the frame, we are iterating over the frames
-        # to avoid unnecessary queries
+        # to avoid unnecessary queries. Search space is split by a few frames checked concurrently on every step.
         while start_frame < end_frame:
-            mid_frame = FrameNumber((end_frame + start_frame) // 2)
-
-            if self._slashings_in_frame(mid_frame, slashed_pubkeys):
-                end_frame = mid_frame
-            else:
-                start_frame = FrameNumber(mid_frame + 1)
+            probe_frames = self._get_probe_frames(start_frame, end_frame)
+            probe_results = gather(*(
+                partial(self._slashings_in_frame, frame, slashed_pubkeys) for frame in probe_frames
+            ))
+
+            next_start_frame = start_frame
+            for frame, has_slashings in zip(probe_frames, probe_results):
+                if has_slashings:
+                    end_frame = frame
+                    break
+                next_start_frame = FrameNumber(frame + 1)
+            start_frame = next_start_frame
 
         slot_number = self.get_frame_first_slot(start_frame)
         epoch_number = self.get_epoch_by_slot(slot_number)
         return epoch_number
 
+    def _get_probe_frames(self, start_frame: FrameNumber, end_frame: FrameNumber) -> list[FrameNumber]:
+        """
+        Splits [start_frame, end_frame) into equal parts. With one probe it is the middle frame of the binary search.
+        """
+        probes = self.SLASHINGS_SEARCH_PROBES
+        return sorted({
+            FrameNumber(start_frame + (end_frame - start_frame) * (i + 1) // (probes + 1))
+            for i in range(probes)
+        })
+
     def _slashings_in_frame(self, frame: FrameNumber, slashed_pubkeys: set[str]) -> bool:
         """
-        Returns number of slashed validators for the frame for the given validators
-        Slashed flag can't be undone, so we can only look at the last slot
+        Returns True if any of the given validators is slashed in the frame.
+        Slashed flag can't be undone, so we can only look at the last slot.
+        Only the validators with unknown flag at that slot are requested from CL.
         """
         last_slot_in_frame = self.get_frame_last_slot(frame)
+        memo = self.w3.cc.get_slashings_memo()
+
+        unknown_pubkeys = []
+        for pubkey in sorted(slashed_pubkeys):
+            slashed = memo.is_slashed(pubkey, last_slot_in_frame)
+            if slashed:
+                return True
+            if slashed is None:
+                unknown_pubkeys.append(pubkey)
+
+        if not unknown_pubkeys:
+            return False
+
         last_slot_in_frame_blockstamp = self._get_blockstamp(last_slot_in_frame)
 
-        catalist_validators = self.w3.catalist_validators.get_catalist_validators(last_slot_in_frame_blockstamp)
-        slashed_validators = filter_slashed_validators(
-            v for v in catalist_validators if v.validator.pubkey in slashed_pubkeys
-        )
+        for start in range(0, len(unknown_pubkeys), self.MAX_PUBKEYS_PER_REQUEST):
+            pubkeys = unknown_pubkeys[start:start + self.MAX_PUBKEYS_PER_REQUEST]
+            validators = self.w3.cc.get_validators_no_cache(last_slot_in_frame_blockstamp, tuple(pubkeys))
+            slashed_validators_pubkeys = {v.validator.pubkey for v in filter_slashed_validators(validators)}
+
+            for pubkey in pubkeys:
+                memo.update(pubkey, last_slot_in_frame, pubkey in slashed_validators_pubkeys)
+
+            if slashed_validators_pubkeys:
+                return True
 
-        return len(slashed_validators) > 0
+        return False
 
     def _filter_validators_with_earliest_exit_epoch(self, validators: list[Validator]) -> list[Validator]:
         sorted_validators = sorted(validators, key=lambda validator: (int(validator.validator.exit_epoch)))
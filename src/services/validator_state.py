@@ -25,6 +25,7 @@ from src.web3py.extensions.catalist_validators import (
     CatalistValidator,
     StakingModule,
 )
+from src.web3py.multicall import Multicall
 from src.web3py.typings import Web3
 
 
@@ -37,7 +38,7 @@ class CatalistValidatorStateService:
         self.w3 = w3
         self.extra_data_service = ExtraDataService()
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_extra_data(self, blockstamp: ReferenceBlockStamp, chain_config: ChainConfig) -> ExtraData:
         stuck_validators = self.get_catalist_newly_stuck_validators(blockstamp, chain_config)
         logger.info({'msg': 'Calculate stuck validators.', 'value': stuck_validators})
@@ -117,7 +118,7 @@ class CatalistValidatorStateService:
 
         return set(bytes_to_hex_str(event['args']['validatorPubkey']) for event in events)
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_validator_delinquent_timeout_in_slot(self, blockstamp: ReferenceBlockStamp) -> int:
         exiting_keys_stuck_border_in_slots_bytes = self.w3.catalist_contracts.oracle_daemon_config.functions.get(
             'VALIDATOR_DELINQUENT_TIMEOUT_IN_SLOTS'
@@ -131,17 +132,26 @@ class CatalistValidatorStateService:
 
         result = {}
 
-        for module in staking_modules:
-            node_operators_ids_in_module = list(map(lambda op: op.id, filter(lambda operator: operator.staking_module.id == module.id, node_operators)))
+        node_operators_ids_by_module = [
+            (module, [operator.id for operator in node_operators if operator.staking_module.id == module.id])
+            for module in staking_modules
+        ]
 
-            last_requested_validators = self._get_last_requested_validator_indices(blockstamp, module, node_operators_ids_in_module)
+        last_requested_validators_by_module = self._get_last_requested_validator_indices(
+            blockstamp,
+            node_operators_ids_by_module,
+        )
 
+        for (module, node_operators_ids_in_module), last_requested_validators in zip(
+            node_operators_ids_by_module,
+            last_requested_validators_by_module,
+        ):
             for no_id, validator_index in zip(node_operators_ids_in_module, last_requested_validators):
                 result[(module.id, no_id)] = validator_index
 
         return result
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_catalist_newly_exited_validators(self, blockstamp: ReferenceBlockStamp) -> dict[NodeOperatorGlobalIndex, int]:
         catalist_validators = deepcopy(self.get_exited_catalist_validators(blockstamp))
         node_operators = self.w3.catalist_validators.get_catalist_node_operators(blockstamp)
@@ -156,7 +166,7 @@ class CatalistValidatorStateService:
         logger.info({'msg': 'Fetch new catalist exited validators by node operator.', 'value': catalist_validators})
         return catalist_validators
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_exited_catalist_validators(self, blockstamp: ReferenceBlockStamp) -> dict[NodeOperatorGlobalIndex, int]:
         catalist_validators = self.w3.catalist_validators.get_catalist_validators_by_node_operators(blockstamp)
 
@@ -179,11 +189,21 @@ class CatalistValidatorStateService:
         logger.info({'msg': 'Fetch oracle sanity checks.', 'value': orl})
         return orl
 
-    def _get_last_requested_validator_indices(self, blockstamp: BlockStamp, module: StakingModule, node_operators_ids_in_module: Sequence[int]) -> list[int]:
-        return self.w3.catalist_contracts.validators_exit_bus_oracle.functions.getLastRequestedValidatorIndices(
-            module.id,
-            node_operators_ids_in_module,
-        ).call(block_identifier=blockstamp.block_hash)
+    def _get_last_requested_validator_indices(
+        self,
+        blockstamp: BlockStamp,
+        node_operators_ids_by_module: Sequence[tuple[StakingModule, Sequence[int]]],
+    ) -> list[list[int]]:
+        """Last requested validator indices of every module are read in a single request if multicall is enabled"""
+        exit_bus_oracle = self.w3.catalist_contracts.validators_exit_bus_oracle
+
+        with Multicall(self.w3, blockstamp.block_hash) as multicall:
+            results = [
+                multicall.add(exit_bus_oracle.functions.getLastRequestedValidatorIndices(module.id, operators_ids))
+                for module, operators_ids in node_operators_ids_by_module
+            ]
+
+        return [result.value for result in results]
 
     def get_recently_requested_but_not_exited_validators(
         self,
@@ -278,7 +298,7 @@ class CatalistValidatorStateService:
 
         return global_indexes
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_validator_delayed_timeout_in_slot(self, blockstamp: ReferenceBlockStamp) -> int:
         exiting_keys_delayed_border_in_slots_bytes = self.w3.catalist_contracts.oracle_daemon_config.functions.get(
             'VALIDATOR_DELAYED_TIMEOUT_IN_SLOTS'
@@ -1,8 +1,11 @@
+from typing import Optional
+
 from web3.types import Wei
 
 from src.metrics.prometheus.business import CONTRACT_ON_PAUSE
 from src.variables import FINALIZATION_BATCH_MAX_REQUEST_COUNT
 from src.utils.abi import named_tuple_to_dataclass
+from src.web3py.multicall import Multicall, MulticallResult
 from src.web3py.typings import Web3
 from src.typings import ReferenceBlockStamp
 from src.services.safe_border import SafeBorder
@@ -30,6 +33,7 @@ class Withdrawal:
         self.chain_config = chain_config
         self.frame_config = frame_config
         self.blockstamp = blockstamp
+        self._state: Optional[dict[str, MulticallResult]] = None
 
     def get_finalization_batches(
         self,
@@ -90,35 +94,40 @@ class Withdrawal:
 
         return list(filter(lambda value: value > 0, state.batches))
 
+    def _get_state(self) -> dict[str, MulticallResult]:
+        """Independent withdrawal queue values are read in a single request if multicall is enabled"""
+        if self._state is None:
+            withdrawal_queue = self.w3.catalist_contracts.withdrawal_queue_nft.functions
+
+            with Multicall(self.w3, self.blockstamp.block_hash) as multicall:
+                self._state = {
+                    'is_paused': multicall.add(withdrawal_queue.isPaused()),
+                    'last_finalized_request_id': multicall.add(withdrawal_queue.getLastFinalizedRequestId()),
+                    'last_request_id': multicall.add(withdrawal_queue.getLastRequestId()),
+                    'buffered_ace': multicall.add(self.w3.catalist_contracts.catalist.functions.getBufferedAce()),
+                    'unfinalized_bace': multicall.add(withdrawal_queue.unfinalizedBACE()),
+                    'max_batches_length': multicall.add(withdrawal_queue.MAX_BATCHES_LENGTH()),
+                }
+
+        return self._state
+
     def _fetch_last_finalized_request_id(self) -> int:
-        return self.w3.catalist_contracts.withdrawal_queue_nft.functions.getLastFinalizedRequestId().call(
-            block_identifier=self.blockstamp.block_hash
-        )
+        return self._get_state()['last_finalized_request_id'].value
 
     def _fetch_last_request_id(self) -> int:
-        return self.w3.catalist_contracts.withdrawal_queue_nft.functions.getLastRequestId().call(
-            block_identifier=self.blockstamp.block_hash
-        )
+        return self._get_state()['last_request_id'].value
 
     def _fetch_buffered_ace(self) -> Wei:
-        return Wei(self.w3.catalist_contracts.catalist.functions.getBufferedAce().call(
-            block_identifier=self.blockstamp.block_hash
-        ))
+        return Wei(self._get_state()['buffered_ace'].value)
 
     def _fetch_unfinalized_bace(self) -> Wei:
-        return Wei(self.w3.catalist_contracts.withdrawal_queue_nft.functions.unfinalizedBACE().call(
-            block_identifier=self.blockstamp.block_hash
-        ))
+        return Wei(self._get_state()['unfinalized_bace'].value)
 
     def _is_requests_finalization_paused(self) -> bool:
-        return self.w3.catalist_contracts.withdrawal_queue_nft.functions.isPaused().call(
-            block_identifier=self.blockstamp.block_hash
-        )
+        return self._get_state()['is_paused'].value
 
     def _fetch_max_batches_length(self) -> int:
-        return self.w3.catalist_contracts.withdrawal_queue_nft.functions.MAX_BATCHES_LENGTH().call(
-            block_identifier=self.blockstamp.block_hash
-        )
+        return self._get_state()['max_batches_length'].value
 
     def _fetch_finalization_batches(self, share_rate: int, timestamp: int, batch_state: BatchState) -> BatchState:
         return named_tuple_to_dataclass(
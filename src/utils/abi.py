@@ -1,6 +1,11 @@
+import json
+import os
 import re
 from collections.abc import Callable
-from typing import TypeVar
+from typing import Any, TypeVar
+
+
+ABI_PATH = './assets/'
 
 
 def camel_to_snake(name):
@@ -19,3 +24,12 @@ def named_tuple_to_dataclass(response, dataclass_factory: Callable[..., T] | typ
         Output: ChainConfig(slots_per_epoch=32, seconds_per_slot=12, genesis_time=1675263480)
     """
     return dataclass_factory(**{camel_to_snake(key): value for key, value in response._asdict().items()})
+
+
+def load_abi(abi_name: str, abi_path: str = ABI_PATH) -> list[dict[str, Any]]:
+    with open(f'{abi_path}{abi_name}.json') as f:
+        return json.load(f)
+
+
+def get_abi_names(abi_path: str = ABI_PATH) -> list[str]:
+    return sorted(filename.removesuffix('.json') for filename in os.listdir(abi_path) if filename.endswith('.json'))
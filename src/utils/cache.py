@@ -1,31 +1,243 @@
 import functools
-from weakref import WeakKeyDictionary
+import sys
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import fields, is_dataclass
+from threading import Lock, RLock
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Sequence
 
-global_cache: WeakKeyDictionary = WeakKeyDictionary()
+from src.metrics.prometheus.basic import CACHE_ENTRIES, CACHE_EVICTIONS, CACHE_REQUESTS, CACHE_SIZE
+from src.variables import GLOBAL_CACHE_MAX_SIZE_MB
 
 
-def global_lru_cache(*args, **kwargs):
+class CacheInfo(NamedTuple):
+    """Same as functools.lru_cache statistics"""
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class _Entry:
+    __slots__ = ('value', 'size', 'cycle')
+
+    def __init__(self, value: Any, size: int, cycle: int):
+        self.value = value
+        self.size = size
+        self.cycle = cycle
+
+
+class CachedFunction:
+    """
+    Results of the function keyed by arguments (usually by blockstamp).
+
+    Entries are removed when
+    - there are more than `maxsize` entries (if set) - the least recently used entry first,
+    - total estimated size of all cached results exceeds the global limit - the least recently used entries of all functions,
+    - entry was not used during the previous and the current cycle.
+    """
+    def __init__(self, func: Callable, maxsize: Optional[int]):
+        self.func = func
+        self.name = func.__qualname__
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._pending: dict[Hashable, Future] = {}
+
+    def __call__(self, *args, **kwargs):
+        key = functools._make_key(args, kwargs, typed=False)  # pylint: disable=protected-access
+
+        with _registry.lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                entry.cycle = _registry.cycle
+                _registry.touch(self, key)
+                self.hits += 1
+                CACHE_REQUESTS.labels(self.name, 'hit').inc()
+                return entry.value
+
+            # The same result is being fetched by another thread - wait for it instead of fetching twice
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = future = Future()
+                self.misses += 1
+                CACHE_REQUESTS.labels(self.name, 'miss').inc()
+            else:
+                self.hits += 1
+                CACHE_REQUESTS.labels(self.name, 'hit').inc()
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            value = self.func(*args, **kwargs)
+        except BaseException as error:
+            with _registry.lock:
+                del self._pending[key]
+            future.set_exception(error)
+            raise
+
+        with _registry.lock:
+            del self._pending[key]
+            self._put(key, value)
+        future.set_result(value)
+
+        return value
+
+    def _put(self, key: Hashable, value: Any) -> None:
+        entry = _Entry(value, estimate_size(value), _registry.cycle)
+        self._entries[key] = entry
+        _registry.add(self, key, entry.size)
+
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                self._evict(next(iter(self._entries)), 'maxsize')
+
+        _registry.evict_to_limit()
+        self._export()
+
+    def _evict(self, key: Hashable, reason: str) -> None:
+        entry = self._entries.pop(key)
+        _registry.remove(self, key, entry.size)
+        CACHE_EVICTIONS.labels(self.name, reason).inc()
+        self._export()
+
+    def evict_unused(self, cycle: int) -> None:
+        for key in [key for key, entry in self._entries.items() if entry.cycle < cycle]:
+            self._evict(key, 'cycle')
+
+    def cache_clear(self) -> None:
+        with _registry.lock:
+            for key, entry in self._entries.items():
+                _registry.remove(self, key, entry.size)
+            self._entries.clear()
+            self.hits = self.misses = 0
+            self._export()
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def _export(self) -> None:
+        CACHE_ENTRIES.labels(self.name).set(len(self._entries))
+        CACHE_SIZE.labels(self.name).set(sum(entry.size for entry in self._entries.values()))
+
+
+class _Registry:
+    """All cached functions with the global LRU order of their entries"""
+    def __init__(self, max_size_bytes: int):
+        self.max_size_bytes = max_size_bytes
+        self.functions: list[CachedFunction] = []
+        self.cycle = 0
+        self.size = 0
+        self.lock = RLock()
+        self._order: OrderedDict[tuple[int, Hashable], CachedFunction] = OrderedDict()
+
+    def add(self, function: CachedFunction, key: Hashable, size: int) -> None:
+        self._order[(id(function), key)] = function
+        self.size += size
+
+    def touch(self, function: CachedFunction, key: Hashable) -> None:
+        self._order.move_to_end((id(function), key))
+
+    def remove(self, function: CachedFunction, key: Hashable, size: int) -> None:
+        del self._order[(id(function), key)]
+        self.size -= size
+
+    def evict_to_limit(self) -> None:
+        # The most recent entry is kept even if it exceeds the limit on its own
+        while self.size > self.max_size_bytes and len(self._order) > 1:
+            (_, key), function = next(iter(self._order.items()))
+            function._evict(key, 'size')  # pylint: disable=protected-access
+
+
+_registry = _Registry(GLOBAL_CACHE_MAX_SIZE_MB * 2**20)
+_registration_lock = Lock()
+
+
+def global_lru_cache(maxsize: Optional[int] = None):
+    """
+    Caches results of the function by its arguments. All cached functions share the memory limit
+    and are cleared by `clear_global_cache`. Entries not used during the last cycle are dropped by `start_cache_cycle`.
+    """
     def caching_decorator(func):
-        cached_func = functools.lru_cache(*args, **kwargs)(func)
+        cached_func = CachedFunction(func, maxsize)
 
-        def wrapper(*args, **kwargs):
-            result = cached_func(*args, **kwargs)
-            global_cache[func] = cached_func
-            return result
+        with _registration_lock:
+            _registry.functions.append(cached_func)
 
-        def cache_clear():
-            cached_func.cache_clear()
-            if func in global_cache:
-                del global_cache[func]
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cached_func(*args, **kwargs)
 
-        wrapper.cache_clear = cache_clear
+        wrapper.cache_clear = cached_func.cache_clear
         wrapper.cache_info = cached_func.cache_info
         return wrapper
 
     return caching_decorator
 
 
+def start_cache_cycle():
+    """
+    Marks the beginning of the new oracle cycle.
+    Entries that were not used during the previous cycle are removed, the rest are kept for the current cycle.
+    """
+    with _registry.lock:
+        _registry.cycle += 1
+        for function in _registry.functions:
+            function.evict_unused(_registry.cycle - 1)
+
+
 def clear_global_cache():
-    for cached_func in global_cache.values():
-        cached_func.cache_clear()
-    global_cache.clear()
+    for function in _registry.functions:
+        function.cache_clear()
+
+
+def estimate_size(value: Any, depth: int = 3) -> int:
+    """
+    Rough estimation of the memory used by the value with nested objects.
+    Only several items of the large collections are measured.
+    """
+    size = sys.getsizeof(value)
+
+    if depth == 0 or isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return size
+
+    items: Sequence[Any]
+    if isinstance(value, dict):
+        items = list(value.values())
+    elif isinstance(value, (list, tuple)):
+        items = value
+    elif isinstance(value, (set, frozenset)):
+        items = list(value)
+    elif _measures_itself(type(value)):
+        # Class measures itself as ValidatorTable does
+        return size
+    elif is_dataclass(value):
+        items = [getattr(value, field.name) for field in fields(value)]
+    else:
+        items = _get_attributes(value)
+
+    if not items:
+        return size
+
+    sample = items[:: max(1, len(items) // 16)][:16]
+    return size + sum(estimate_size(item, depth - 1) for item in sample) * len(items) // len(sample)
+
+
+def _measures_itself(cls: type) -> bool:
+    """Class or one of its bases overrides `object.__sizeof__`"""
+    return any('__sizeof__' in base.__dict__ for base in cls.__mro__ if base is not object)
+
+
+def _get_attributes(value: Any) -> list:
+    """Values of the instance attributes stored both in `__dict__` and in `__slots__`"""
+    items = list(getattr(value, '__dict__', {}).values())
+
+    for cls in type(value).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ('__dict__', '__weakref__') and hasattr(value, name):
+                items.append(getattr(value, name))
+
+    return items
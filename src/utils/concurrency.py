@@ -0,0 +1,37 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+def gather(*calls: Callable[[], Any], return_exceptions: bool = False) -> list[Any]:
+    """
+    Runs independent blocking calls (e.g. requests to CL and Keys API) concurrently and returns their results in order.
+    The first raised exception is propagated after all calls are finished,
+    unless `return_exceptions` is set - then exceptions are returned in place of the results.
+
+    Concurrency of the requests to each provider is limited by the provider itself.
+    """
+    if len(calls) < 2:
+        return [_call(call, return_exceptions) for call in calls]
+
+    return asyncio.run(gather_async(*(asyncio.to_thread(call) for call in calls), return_exceptions=return_exceptions))
+
+
+async def gather_async(*awaitables: Awaitable[Any], return_exceptions: bool = False) -> list[Any]:
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+
+    if not return_exceptions:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    return list(results)
+
+
+def _call(call: Callable[[], Any], return_exceptions: bool) -> Any:
+    if not return_exceptions:
+        return call()
+
+    try:
+        return call()
+    except Exception as error:  # pylint: disable=broad-except
+        return error
@@ -1,7 +1,7 @@
 import functools
 from dataclasses import dataclass, fields, is_dataclass
 from types import GenericAlias
-from typing import Callable, Self, Sequence, TypeVar
+from typing import Callable, Optional, Self, Sequence, TypeVar, cast
 
 from src.utils.abi import named_tuple_to_dataclass
 
@@ -16,25 +16,15 @@ class Nested:
     Base class for dataclasses that converts all inner dicts into dataclasses
     Also works with lists of dataclasses
     """
+    __slots__ = ()
+
     def __post_init__(self):
-        for field in fields(self):
-            if isinstance(field.type, GenericAlias):
-                field_type = field.type.__args__[0]
-                if is_dataclass(field_type):
-                    factory = self.__get_dataclass_factory(field_type)
-                    setattr(self, field.name,
-                            field.type.__origin__(map(
-                                lambda x: factory(**x) if not is_dataclass(x) else x,
-                                getattr(self, field.name))))
-            elif is_dataclass(field.type) and not is_dataclass(getattr(self, field.name)):
-                factory = self.__get_dataclass_factory(field.type)
-                setattr(self, field.name, factory(**getattr(self, field.name)))
-
-    @staticmethod
-    def __get_dataclass_factory(field_type):
-        if issubclass(field_type, FromResponse):
-            return field_type.from_response
-        return field_type
+        for name, factory, container in _get_nested_fields(type(self)):
+            value = getattr(self, name)
+            if container is not None:
+                setattr(self, name, container(map(lambda x: factory(**x) if not is_dataclass(x) else x, value)))
+            elif not is_dataclass(value):
+                setattr(self, name, factory(**value))
 
 
 T = TypeVar('T')
@@ -45,13 +35,43 @@ class FromResponse:
     """
     Class for extending dataclass with custom from_response method, ignored extra fields
     """
+    __slots__ = ()
 
     @classmethod
     def from_response(cls, **kwargs) -> Self:
-        class_field_names = [field.name for field in fields(cls)]
+        class_field_names = _get_field_names(cast(type, cls))
+        if class_field_names.issuperset(kwargs):
+            return cls(**kwargs)
         return cls(**{k: v for k, v in kwargs.items() if k in class_field_names})
 
 
+@functools.cache
+def _get_field_names(cls: type) -> frozenset[str]:
+    return frozenset(field.name for field in fields(cls))
+
+
+@functools.cache
+def _get_nested_fields(cls: type) -> tuple[tuple[str, Callable, Optional[type]], ...]:
+    """Fields that should be converted to dataclasses: name, dataclass factory and container type for generics"""
+    nested_fields = []
+
+    for field in fields(cls):
+        if isinstance(field.type, GenericAlias):
+            field_type = field.type.__args__[0]
+            if is_dataclass(field_type):
+                nested_fields.append((field.name, _get_dataclass_factory(field_type), field.type.__origin__))
+        elif is_dataclass(field.type):
+            nested_fields.append((field.name, _get_dataclass_factory(field.type), None))
+
+    return tuple(nested_fields)
+
+
+def _get_dataclass_factory(field_type):
+    if issubclass(field_type, FromResponse):
+        return field_type.from_response
+    return field_type
+
+
 def list_of_dataclasses(
     _dataclass_factory: Callable[..., T]
 ) -> Callable[[Callable[..., Sequence]], Callable[..., list[T]]]:
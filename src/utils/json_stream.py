@@ -0,0 +1,133 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+
+class JSONStreamDecodeError(ValueError):
+    pass
+
+
+WHITESPACE = ' \t\n\r'
+
+
+class ChunkReader:
+    """
+    Text reader over a stream of utf-8 encoded byte chunks.
+    Keeps in memory only the part of the stream that is not consumed yet.
+    """
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Appends next chunk to the buffer. Returns False if stream is exhausted."""
+        if self._eof:
+            return False
+
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+
+        for chunk in self._chunks:
+            text = self._text_decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+
+        self._eof = True
+        text = self._text_decoder.decode(b'', final=True)
+        self._buffer += text
+        return bool(text)
+
+    def peek(self) -> str:
+        """Skips whitespaces and returns next char without consuming it"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in WHITESPACE:
+                self._pos += 1
+
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+
+            if not self._fill():
+                raise JSONStreamDecodeError('Unexpected end of the stream.')
+
+    def consume(self, expected: str) -> None:
+        char = self.peek()
+        if char != expected:
+            raise JSONStreamDecodeError(f'Expected "{expected}", got "{char}".')
+        self._pos += 1
+
+    def decode_value(self) -> Any:
+        """Decodes next JSON value. The value should be completely received before it can be decoded."""
+        self.peek()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+
+            # Scalars (e.g. numbers) could be continued in the next chunk,
+            # so value is accepted only if something follows it or the stream is exhausted.
+            if end == len(self._buffer) and self._fill():
+                continue
+
+            self._pos = end
+            return value
+
+
+def iter_json_array_items(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Incrementally decodes JSON object received by chunks and yields elements of the array stored under the `key`.
+
+    Only one element of the array is decoded and kept in memory at a time.
+    Any other values of the object before the `key` are decoded and skipped, values after the array are not read.
+
+    Example:
+        Input: b'{"execution_optimistic": false, "data": [{"index": "1"}, {"index": "2"}]}', key='data'
+        Output: {'index': '1'}, {'index': '2'}
+    """
+    reader = ChunkReader(chunks)
+    reader.consume('{')
+
+    if reader.peek() == '}':
+        raise JSONStreamDecodeError(f'Expected list response, but there is no "{key}" key.')
+
+    while True:
+        current_key = reader.decode_value()
+        reader.consume(':')
+
+        if current_key == key:
+            yield from _iter_array(reader)
+            return
+
+        reader.decode_value()
+
+        if reader.peek() == '}':
+            raise JSONStreamDecodeError(f'Expected list response, but there is no "{key}" key.')
+
+        reader.consume(',')
+
+
+def _iter_array(reader: ChunkReader) -> Iterator[Any]:
+    if reader.peek() != '[':
+        raise JSONStreamDecodeError(f'Expected list response, got "{reader.peek()}" instead.')
+
+    reader.consume('[')
+
+    if reader.peek() == ']':
+        return
+
+    while True:
+        yield reader.decode_value()
+
+        if reader.peek() == ']':
+            return
+
+        reader.consume(',')
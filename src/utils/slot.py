@@ -1,11 +1,14 @@
 import logging
+from functools import partial
 from http import HTTPStatus
+from typing import Iterator
 
 from src.providers.consensus.client import ConsensusClient
 from src.providers.consensus.typings import BlockHeaderFullResponse, BlockDetailsResponse
 from src.providers.http_provider import NotOkResponse
 from src.typings import SlotNumber, EpochNumber, ReferenceBlockStamp
 from src.utils.blockstamp import build_reference_blockstamp, build_blockstamp
+from src.utils.concurrency import gather
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +52,7 @@ def get_first_non_missed_slot(
     #
     #  We have range [19, 24] and we need to find first non-missed slot.
     #
-    #  Let's dive into the range circle and consider it in each tick:
+    #  Let's dive into the range circle and consider it in each tick (slots of several ticks are requested at once):
     #    1st tick - 19 slot is missed. Check next slot.
     #    2nd tick - 20 slot is missed. Check next slot.
     #    3rd tick - 21 slot is missed. Check next slot.
@@ -70,21 +73,29 @@ def get_first_non_missed_slot(
 
     ref_slot_is_missed = False
     existed_header = None
-    for i in range(slot, last_finalized_slot_number + 1):
-        try:
-            existed_header = cc.get_block_header(SlotNumber(i))
-        except NotOkResponse as error:
-            if error.status != HTTPStatus.NOT_FOUND:
-                # Not expected status - raise exception
-                raise error
-
-            ref_slot_is_missed = True
-
-            logger.warning({'msg': f'Missed slot: {i}. Check next slot.', 'error': str(error.__dict__)})
-        else:
+    for window in _get_probe_windows(slot, last_finalized_slot_number, cc.max_concurrent_requests):
+        headers = gather(
+            *(partial(_get_block_header_or_none, cc, SlotNumber(i)) for i in window),
+            return_exceptions=True,
+        )
+
+        for i, header in zip(window, headers):
+            # Slots are walked in order, so errors of the slots after the first existing one are ignored
+            if isinstance(header, Exception):
+                raise header
+
+            if header is None:
+                ref_slot_is_missed = True
+                logger.warning({'msg': f'Missed slot: {i}. Check next slot.'})
+                continue
+
+            existed_header = header
             _check_block_header(existed_header)
             break
 
+        if existed_header:
+            break
+
     if not existed_header:
         raise NoSlotsAvailable('No slots available for current report. Check your CL node.')
 
@@ -102,10 +113,33 @@ def get_first_non_missed_slot(
                 'Probably problem with the consensus node.'
             )
 
-    slot_details = cc.get_block_details(existed_header.data.root)
+    slot_details = cc.get_blockstamp_details(existed_header.data.root)
     return slot_details
 
 
+def _get_probe_windows(slot: SlotNumber, last_slot: SlotNumber, window_size: int) -> Iterator[range]:
+    """
+    Ref slot is usually not missed, so it is requested alone.
+    Next slots are requested by windows, so the run of missed slots costs one round trip per window.
+    """
+    yield range(slot, slot + 1)
+
+    window_size = max(1, window_size)
+    for window_start in range(slot + 1, last_slot + 1, window_size):
+        yield range(window_start, min(window_start + window_size, last_slot + 1))
+
+
+def _get_block_header_or_none(cc: ConsensusClient, slot: SlotNumber) -> BlockHeaderFullResponse | None:
+    """Returns None if slot is missed"""
+    try:
+        return cc.get_block_header(slot)
+    except NotOkResponse as error:
+        if error.status != HTTPStatus.NOT_FOUND:
+            # Not expected status - raise exception
+            raise error
+        return None
+
+
 def get_blockstamp(
     cc: ConsensusClient,
     slot: SlotNumber,
@@ -1,4 +1,7 @@
-from typing import Sequence
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Iterable, Sequence
 
 from src.constants import (
     MAX_EFFECTIVE_BALANCE,
@@ -8,6 +11,7 @@ from src.constants import (
     EFFECTIVE_BALANCE_INCREMENT,
 )
 from src.providers.consensus.typings import Validator
+from src.providers.consensus.validator_table import ValidatorTable
 from src.typings import EpochNumber, Gwei
 
 
@@ -98,3 +102,97 @@ def calculate_active_effective_balance_sum(validators: Sequence[Validator], ref_
             effective_balance_sum += int(validator.validator.effective_balance)
 
     return Gwei(effective_balance_sum)
+
+
+# Counterparts of the functions above that run over the columns of ValidatorTable.
+# Validator fields stay strings as they come from the API and are parsed on every call of the functions above,
+# so passes over the whole validators set use the table, where numeric fields are parsed once at decode time.
+
+
+def calculate_table_total_active_effective_balance(table: ValidatorTable, ref_epoch: EpochNumber) -> Gwei:
+    """Same as `calculate_total_active_effective_balance`"""
+    total_effective_balance = calculate_table_active_effective_balance_sum(table, ref_epoch)
+    return Gwei(max(EFFECTIVE_BALANCE_INCREMENT, total_effective_balance))
+
+
+def calculate_table_active_effective_balance_sum(table: ValidatorTable, ref_epoch: EpochNumber) -> Gwei:
+    """Same as `calculate_active_effective_balance_sum`"""
+    return Gwei(sum(
+        effective_balance
+        for effective_balance, activation_epoch, exit_epoch in zip(
+            table.effective_balance, table.activation_epoch, table.exit_epoch,
+        )
+        if activation_epoch <= ref_epoch < exit_epoch
+    ))
+
+
+@dataclass(frozen=True)
+class ValidatorSetStats:
+    """
+    Aggregates over the whole validators set, collected in a single pass over the table:
+    the latest exit epoch with amount of validators exiting in it,
+    amount of active and amount of partially or fully withdrawable validators on the epoch.
+    """
+    max_exit_epoch: EpochNumber
+    max_exit_epoch_validators_count: int
+    active_validators_count: int
+    withdrawable_validators_count: int
+
+    @classmethod
+    def from_table(cls, table: ValidatorTable, epoch: EpochNumber) -> 'ValidatorSetStats':
+        eth1_prefix = int(ETH1_ADDRESS_WITHDRAWAL_PREFIX, 16)
+
+        max_exit_epoch = 0
+        max_exit_epoch_validators_count = 0
+        active_validators_count = 0
+        withdrawable_validators_count = 0
+
+        for row, (activation_epoch, exit_epoch, withdrawable_epoch, balance, effective_balance) in enumerate(zip(
+            table.activation_epoch, table.exit_epoch, table.withdrawable_epoch, table.balance, table.effective_balance,
+        )):
+            if exit_epoch != FAR_FUTURE_EPOCH:
+                if exit_epoch > max_exit_epoch:
+                    max_exit_epoch = exit_epoch
+                    max_exit_epoch_validators_count = 0
+                if exit_epoch == max_exit_epoch:
+                    max_exit_epoch_validators_count += 1
+
+            if activation_epoch <= epoch < exit_epoch:
+                active_validators_count += 1
+
+            if table.get_withdrawal_credentials_prefix(row) == eth1_prefix:
+                has_excess_balance = effective_balance == MAX_EFFECTIVE_BALANCE and balance > MAX_EFFECTIVE_BALANCE
+                is_fully_withdrawable = withdrawable_epoch <= epoch and balance > 0
+
+                if has_excess_balance or is_fully_withdrawable:
+                    withdrawable_validators_count += 1
+
+        return cls(
+            max_exit_epoch=EpochNumber(max_exit_epoch),
+            max_exit_epoch_validators_count=max_exit_epoch_validators_count,
+            active_validators_count=active_validators_count,
+            withdrawable_validators_count=withdrawable_validators_count,
+        )
+
+
+@dataclass(frozen=True)
+class WithdrawableBalances:
+    """
+    Prefix sums of the balances ordered by withdrawable epoch.
+    Answers how much will be withdrawn from the given validators until the epoch with a single binary search.
+    """
+    withdrawable_epochs: list[int]
+    balance_sums: list[int]
+
+    @classmethod
+    def from_balances(cls, balances: Iterable[tuple[EpochNumber, int]]) -> 'WithdrawableBalances':
+        """Takes pairs of the withdrawable epoch and the balance"""
+        sorted_balances = sorted(balances)
+        return cls(
+            withdrawable_epochs=[epoch for epoch, _ in sorted_balances],
+            balance_sums=list(accumulate((balance for _, balance in sorted_balances), initial=0)),
+        )
+
+    def get_balance(self, epoch: EpochNumber) -> int:
+        """Sum of the balances with withdrawable epoch less than or equal to the epoch"""
+        return self.balance_sums[bisect_right(self.withdrawable_epochs, epoch)]
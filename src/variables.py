@@ -52,18 +52,42 @@ else:
 
 # HTTP variables
 HTTP_REQUEST_TIMEOUT_EXECUTION = int(os.getenv('HTTP_REQUEST_TIMEOUT_EXECUTION', 2 * 60))
+# Responses of EL requests by block hash never change, so they could be stored on disk and reused after restart
+EL_CALL_STORE_PATH = os.getenv('EL_CALL_STORE_PATH', '')
+EL_CALL_STORE_MAX_SIZE_MB = int(os.getenv('EL_CALL_STORE_MAX_SIZE_MB', 512))
+
+# Multicall3 contract used to read several contract values in a single request. Values are read one by one if empty
+MULTICALL_ADDRESS = os.getenv('MULTICALL_ADDRESS', '')
+
+# Max requests sent at the same time to CL or Keys API
+HTTP_REQUEST_MAX_CONCURRENCY = int(os.getenv('HTTP_REQUEST_MAX_CONCURRENCY', 4))
 
 HTTP_REQUEST_TIMEOUT_CONSENSUS = int(os.getenv('HTTP_REQUEST_TIMEOUT_CONSENSUS', 5 * 60))
 HTTP_REQUEST_RETRY_COUNT_CONSENSUS = int(os.getenv('HTTP_REQUEST_RETRY_COUNT_CONSENSUS', 5))
 HTTP_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS_CONSENSUS = int(
     os.getenv('HTTP_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS_CONSENSUS', 5)
 )
+# Request the next host without waiting for the slow one. Disabled if empty
+HTTP_REQUEST_HEDGING_PERCENTILE_CONSENSUS = float(os.getenv('HTTP_REQUEST_HEDGING_PERCENTILE_CONSENSUS') or 0) or None
+
+# Request validators and blocks in SSZ encoding from hosts that support it
+CONSENSUS_CLIENT_USE_SSZ = os.getenv('CONSENSUS_CLIENT_USE_SSZ', 'False').lower() == 'true'
+
+# Validators sets are immutable for the state root, so they could be stored on disk and reused after restart
+VALIDATORS_SNAPSHOT_DIR = os.getenv('VALIDATORS_SNAPSHOT_DIR', '')
+VALIDATORS_SNAPSHOT_MAX_SIZE_MB = int(os.getenv('VALIDATORS_SNAPSHOT_MAX_SIZE_MB', 4096))
 
 HTTP_REQUEST_TIMEOUT_KEYS_API = int(os.getenv('HTTP_REQUEST_TIMEOUT_KEYS_API', 120))
 HTTP_REQUEST_RETRY_COUNT_KEYS_API = int(os.getenv('HTTP_REQUEST_RETRY_COUNT_KEYS_API', 5))
 HTTP_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS_KEYS_API = int(
     os.getenv('HTTP_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS_KEYS_API', 5)
 )
+HTTP_REQUEST_HEDGING_PERCENTILE_KEYS_API = float(os.getenv('HTTP_REQUEST_HEDGING_PERCENTILE_KEYS_API') or 0) or None
+# Used keys are fetched only for changed staking modules. If set, keys are stored in the file and reused after restart
+KEYS_STORE_PATH = os.getenv('KEYS_STORE_PATH', '')
+
+# Memory limit for results of cached functions (validators, keys etc.)
+GLOBAL_CACHE_MAX_SIZE_MB = int(os.getenv('GLOBAL_CACHE_MAX_SIZE_MB', 4096))
 
 # - Metrics -
 PROMETHEUS_PORT = int(os.getenv('PROMETHEUS_PORT', 3002))
@@ -0,0 +1,142 @@
+import logging
+import time
+from typing import Any, Callable, Optional
+
+from web3 import Web3
+from web3.middleware.cache import SIMPLE_CACHE_RPC_WHITELIST
+from web3.types import RPCEndpoint
+
+from src.metrics.prometheus.basic import EL_CALL_STORE_REQUESTS, EL_REQUESTS_DURATION
+from src.web3py.call_store import CallResultsStore
+from src.web3py.middleware import BLOCK_PINNED_METHODS, get_call_store, get_provider_domain, get_response_code
+
+
+logger = logging.getLogger(__name__)
+
+
+class BatchResult:
+    """
+    Result of the request added to the batch.
+
+    If the result wasn't received in the batch (provider doesn't support batches, the request failed or the value
+    is accessed before the batch is sent), the request is sent on its own through the middlewares when the value is accessed.
+    So the errors are the same as without batch.
+    """
+    def __init__(self, w3: Web3, method: RPCEndpoint, params: Any, formatter: Optional[Callable[[Any], Any]]):
+        self.w3 = w3
+        self.method = method
+        self.params = params
+        self.formatter = formatter
+        self.resolved = False
+        self._value: Any = None
+
+    @property
+    def value(self) -> Any:
+        if not self.resolved:
+            self.set(self.w3.manager.request_blocking(self.method, self.params))
+        return self._value
+
+    def set(self, result: Any) -> None:
+        self._value = result if self.formatter is None else self.formatter(result)
+        self.resolved = True
+
+
+class BatchRequest:
+    """
+    Sends independent EL requests in a single JSON-RPC batch.
+
+    with BatchRequest(w3) as batch:
+        first = batch.add('eth_getBalance', [first_address, blockstamp.block_hash], to_int)
+        second = batch.add('eth_getBalance', [second_address, blockstamp.block_hash], to_int)
+
+    return first.value, second.value
+
+    Batched requests don't pass through the middlewares:
+    - requests cached in memory by simple_cache_middleware are not batched,
+    - requests pinned to the block hash are looked up in the call store first and successful responses are stored,
+    - duration of the whole batch is collected once with the "batch" endpoint.
+    Params should be already formatted as they are sent to the node.
+    """
+    MAX_REQUESTS_PER_BATCH = 100
+
+    def __init__(self, w3: Web3):
+        self.w3 = w3
+        self.results: list[BatchResult] = []
+
+    def __enter__(self) -> 'BatchRequest':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def add(self, method: str, params: Any, formatter: Optional[Callable[[Any], Any]] = None) -> BatchResult:
+        result = BatchResult(self.w3, RPCEndpoint(method), params, formatter)
+        self.results.append(result)
+        return result
+
+    def execute(self) -> None:
+        pending = [
+            result for result in self.results
+            if not result.resolved and result.method not in SIMPLE_CACHE_RPC_WHITELIST
+        ]
+
+        store = get_call_store(self.w3)
+        if store is not None:
+            pending = [result for result in pending if not self._load_from_store(store, result)]
+
+        # Nothing to gain from a single request, it is sent on its own when the value is accessed
+        if not hasattr(self.w3.provider, 'make_batch_request') or len(pending) < 2:
+            return
+
+        for start in range(0, len(pending), self.MAX_REQUESTS_PER_BATCH):
+            batch = pending[start:start + self.MAX_REQUESTS_PER_BATCH]
+
+            start_time = time.perf_counter()
+            try:
+                responses = self.w3.provider.make_batch_request([(result.method, result.params) for result in batch])
+            except Exception as error:  # pylint: disable=broad-except
+                self._observe_batch(time.perf_counter() - start_time, None)
+                logger.warning({'msg': 'Batch request failed. Requests will be sent one by one.', 'error': str(error)})
+                continue
+            self._observe_batch(
+                time.perf_counter() - start_time,
+                next((code for response in responses if (code := get_response_code(response))), 0),
+            )
+
+            for result, response in zip(batch, responses):
+                # Failed requests are retried one by one
+                if 'result' in response and 'error' not in response:
+                    result.set(response['result'])
+                    if store is not None:
+                        self._save_to_store(store, result, response)
+
+    @staticmethod
+    def _load_from_store(store: CallResultsStore, result: BatchResult) -> bool:
+        """Same as the call store middleware. Returns True if the response is stored"""
+        key = store.get_key(result.method, result.params) if result.method in BLOCK_PINNED_METHODS else None
+        if key is None:
+            return False
+
+        if (response := store.get(key)) is not None:
+            EL_CALL_STORE_REQUESTS.labels(result.method, 'hit').inc()
+            result.set(response['result'])
+            return True
+
+        EL_CALL_STORE_REQUESTS.labels(result.method, 'miss').inc()
+        return False
+
+    @staticmethod
+    def _save_to_store(store: CallResultsStore, result: BatchResult, response: dict) -> None:
+        key = store.get_key(result.method, result.params) if result.method in BLOCK_PINNED_METHODS else None
+        if key is not None:
+            store.put(key, response)
+
+    def _observe_batch(self, duration: float, code: Optional[int]) -> None:
+        EL_REQUESTS_DURATION.labels(
+            endpoint='batch',
+            call_method='',
+            call_to='',
+            code=code,
+            domain=get_provider_domain(self.w3),
+        ).observe(duration)
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any, Optional
+
+from src.metrics.logging import logging
+from src.metrics.prometheus.basic import EL_CALL_STORE_SIZE
+
+
+logger = logging.getLogger(__name__)
+
+
+BLOCK_HASH_PATTERN = re.compile(r'^0x[0-9a-fA-F]{64}$')
+
+
+class CallResultsStore:
+    """
+    Responses of the EL requests pinned to the block hash, stored in the sqlite database.
+
+    State of the block with the given hash never changes, so stored responses never get stale
+    and are reused after restarts. When total size of the responses exceeds the limit,
+    the least recently used ones are removed.
+    """
+    def __init__(self, path: str | Path, max_size_bytes: int):
+        self.path = Path(path)
+        self.max_size_bytes = max_size_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = Lock()
+        # Requests are sent from different threads, access is serialized by the lock
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, response TEXT NOT NULL, size INTEGER NOT NULL, used_at REAL NOT NULL'
+            ')'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)')
+
+        self._size, self._used_at = self._connection.execute(
+            'SELECT COALESCE(SUM(size), 0), COALESCE(MAX(used_at), 0) FROM responses'
+        ).fetchone()
+        EL_CALL_STORE_SIZE.set(self._size)
+
+    @staticmethod
+    def get_key(method: str, params: Any) -> Optional[str]:
+        """Returns None if the request is not pinned to the block hash."""
+        if not isinstance(params, (list, tuple)) or len(params) < 2:
+            return None
+
+        block_identifier = params[1]
+        if isinstance(block_identifier, dict):
+            # EIP-1898 block identifier
+            block_identifier = block_identifier.get('blockHash')
+
+        if not isinstance(block_identifier, str) or not BLOCK_HASH_PATTERN.match(block_identifier):
+            return None
+
+        request = json.dumps([method, params], sort_keys=True, default=_to_json).lower()
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._connection.execute('SELECT response FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+
+            self._connection.execute('UPDATE responses SET used_at = ? WHERE key = ?', (self._get_used_at(), key))
+
+        return json.loads(row[0])
+
+    def put(self, key: str, response: Any) -> None:
+        data = json.dumps(response, default=_to_json)
+
+        with self._lock:
+            try:
+                previous = self._connection.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO responses (key, response, size, used_at) VALUES (?, ?, ?, ?)',
+                    (key, data, len(data), self._get_used_at()),
+                )
+            except sqlite3.Error as error:
+                logger.warning({'msg': 'Failed to store EL response.', 'error': str(error)})
+                return
+
+            self._size += len(data) - (previous[0] if previous else 0)
+            self._evict()
+
+    def _get_used_at(self) -> float:
+        # Strictly increasing, so the order of usage is kept even if the clock is too coarse
+        self._used_at = max(time.time(), self._used_at + 1e-6)
+        return self._used_at
+
+    def _evict(self) -> None:
+        if self._size > self.max_size_bytes:
+            # Remove the least recently used responses, the most recent one is kept even if it exceeds the limit
+            rows = self._connection.execute(
+                'SELECT key, size FROM responses ORDER BY used_at DESC LIMIT -1 OFFSET 1'
+            ).fetchall()
+
+            removed = []
+            for key, size in reversed(rows):
+                if self._size <= self.max_size_bytes:
+                    break
+                removed.append((key,))
+                self._size -= size
+
+            self._connection.executemany('DELETE FROM responses WHERE key = ?', removed)
+
+        EL_CALL_STORE_SIZE.set(self._size)
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray)):
+        return '0x' + value.hex()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
@@ -64,6 +64,35 @@ def call_contract_function(  # pylint: disable=keyword-arg-before-vararg
         ccip_read_enabled=ccip_read_enabled,
     )
 
+    return decode_contract_function_output(
+        w3,
+        address,
+        normalizers,
+        function_identifier,
+        return_data,
+        contract_abi,
+        fn_abi,
+        decode_tuples,
+        *args,
+        **kwargs,
+    )
+
+
+def decode_contract_function_output(  # pylint: disable=keyword-arg-before-vararg
+    w3: "Web3",
+    address: ChecksumAddress,
+    normalizers: Tuple[Callable[..., Any], ...],
+    function_identifier: FunctionIdentifier,
+    return_data: bytes,
+    contract_abi: Optional[ABI] = None,
+    fn_abi: Optional[ABIFunction] = None,
+    decode_tuples: Optional[bool] = False,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """
+    Decodes and normalizes data returned by the contract function call.
+    """
     if fn_abi is None:
         fn_abi = find_matching_fn_abi(
             contract_abi, w3.codec, function_identifier, args, kwargs
@@ -1,6 +1,7 @@
 import logging
-from dataclasses import asdict, dataclass
-from typing import TYPE_CHECKING, NewType, Tuple
+import sys
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, NewType, Sequence, Tuple
 
 from eth_typing import ChecksumAddress
 from web3.module import Module
@@ -9,7 +10,9 @@ from src.providers.consensus.typings import Validator
 from src.providers.keys.typings import CatalistKey
 from src.typings import BlockStamp
 from src.utils.dataclass import Nested, list_of_dataclasses
-from src.utils.cache import global_lru_cache as lru_cache
+from src.utils.cache import estimate_size, global_lru_cache as lru_cache
+from src.utils.concurrency import gather
+from src.web3py.multicall import Multicall
 
 
 logger = logging.getLogger(__name__)
@@ -91,10 +94,29 @@ class NodeOperator(Nested):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CatalistValidator(Validator):
+    """
+    Catalist validators are cached and share nested records with the validators they are built from,
+    so neither of them should be modified.
+    """
     catalist_id: CatalistKey
 
+    @classmethod
+    def from_validator(cls, validator: Validator, catalist_id: CatalistKey) -> 'CatalistValidator':
+        """
+        Catalist validator that shares the fields of the validator, nested records are not copied.
+        Fields are already converted, so __init__ and __post_init__ are skipped.
+        """
+        catalist_validator = cls.__new__(cls)
+        for name in VALIDATOR_FIELDS:
+            setattr(catalist_validator, name, getattr(validator, name))
+        catalist_validator.catalist_id = catalist_id
+        return catalist_validator
+
+
+VALIDATOR_FIELDS = tuple(field.name for field in fields(Validator))
+
 
 class CountOfKeysDiffersException(Exception):
     pass
@@ -103,13 +125,66 @@ class CountOfKeysDiffersException(Exception):
 ValidatorsByNodeOperator = dict[NodeOperatorGlobalIndex, list[CatalistValidator]]
 
 
+class CatalistValidatorIndex:
+    """
+    Catalist validators of the blockstamp indexed in a single pass, shared by all services.
+    Index is cached, so it and its collections must not be modified.
+    """
+    def __init__(self, validators: list[CatalistValidator], node_operators: list[NodeOperator]):
+        self.validators = validators
+        self.node_operators = node_operators
+
+        self.staking_module_ids: dict[ChecksumAddress, StakingModuleId] = {
+            operator.staking_module.staking_module_address: operator.staking_module.id
+            for operator in node_operators
+        }
+
+        # Even operators without validators are presented
+        self.by_node_operator: ValidatorsByNodeOperator = {
+            (operator.staking_module.id, operator.id): [] for operator in node_operators
+        }
+        self.by_pubkey: dict[str, CatalistValidator] = {}
+        # Validators of the operators that are not in staking router
+        self.unknown_operator_validators: list[tuple[NodeOperatorGlobalIndex, CatalistValidator]] = []
+
+        for validator in validators:
+            self.by_pubkey[validator.validator.pubkey] = validator
+
+            global_no_id = (
+                self.staking_module_ids.get(validator.catalist_id.moduleAddress, StakingModuleId(-1)),
+                NodeOperatorId(validator.catalist_id.operatorIndex),
+            )
+            if global_no_id in self.by_node_operator:
+                self.by_node_operator[global_no_id].append(validator)
+            else:
+                self.unknown_operator_validators.append((global_no_id, validator))
+
+    def __sizeof__(self) -> int:
+        # Validators are shared by all the collections of the index, so they are measured once
+        containers = (
+            self.staking_module_ids,
+            self.by_node_operator,
+            *self.by_node_operator.values(),
+            self.by_pubkey,
+            self.unknown_operator_validators,
+        )
+        return (
+            object.__sizeof__(self)
+            + estimate_size(self.validators)
+            + estimate_size(self.node_operators)
+            + sum(sys.getsizeof(container) for container in containers)
+        )
+
+
 class CatalistValidatorsProvider(Module):
     w3: 'Web3'
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_catalist_validators(self, blockstamp: BlockStamp) -> list[CatalistValidator]:
-        catalist_keys = self.w3.kac.get_used_catalist_keys(blockstamp)
-        validators = self.w3.cc.get_validators(blockstamp)
+        catalist_keys, validators = gather(
+            lambda: self.w3.kac.get_used_catalist_keys(blockstamp),
+            lambda: self.w3.cc.get_validators(blockstamp),
+        )
 
         no_operators = self.get_catalist_node_operators(blockstamp)
 
@@ -118,6 +193,15 @@ class CatalistValidatorsProvider(Module):
         for node_operator in no_operators:
             total_deposited_validators += node_operator.total_deposited_validators
 
+        # Only stored keys could be outdated, without the store all keys are fetched every time
+        if len(catalist_keys) < total_deposited_validators and self.w3.kac.keys_store is not None:
+            logger.warning({
+                'msg': 'Keys API Service returned lesser keys than amount of deposited validators. Fetch all keys again.',
+                'keys': len(catalist_keys),
+                'deposited_validators': total_deposited_validators,
+            })
+            catalist_keys = self.w3.kac.get_used_catalist_keys(blockstamp, full_resync=True)
+
         if len(catalist_keys) < total_deposited_validators:
             raise CountOfKeysDiffersException(f'Keys API Service returned lesser keys ({len(catalist_keys)}) '
                                               f'than amount of deposited validators ({total_deposited_validators}) returned from Staking Router')
@@ -125,7 +209,7 @@ class CatalistValidatorsProvider(Module):
         return self.merge_validators_with_keys(catalist_keys, validators)
 
     @staticmethod
-    def merge_validators_with_keys(keys: list[CatalistKey], validators: list[Validator]) -> list[CatalistValidator]:
+    def merge_validators_with_keys(keys: list[CatalistKey], validators: Sequence[Validator]) -> list[CatalistValidator]:
         """Merging and filter non-catalist validators."""
         validators_keys_dict = {validator.validator.pubkey: validator for validator in validators}
 
@@ -133,59 +217,47 @@ class CatalistValidatorsProvider(Module):
 
         for key in keys:
             if key.key in validators_keys_dict:
-                catalist_validators.append(CatalistValidator(
-                    catalist_id=key,
-                    **asdict(validators_keys_dict[key.key]),
-                ))
+                catalist_validators.append(CatalistValidator.from_validator(validators_keys_dict[key.key], key))
 
         return catalist_validators
 
-    @lru_cache(maxsize=1)
-    def get_catalist_validators_by_node_operators(self, blockstamp: BlockStamp) -> ValidatorsByNodeOperator:
-        merged_validators = self.get_catalist_validators(blockstamp)
-        no_operators = self.get_catalist_node_operators(blockstamp)
-
-        # Make sure even empty NO will be presented in dict
-        no_validators: ValidatorsByNodeOperator = {
-            (operator.staking_module.id, operator.id): [] for operator in no_operators
-        }
-
-        staking_module_address = {
-            operator.staking_module.staking_module_address: operator.staking_module.id
-            for operator in no_operators
-        }
+    @lru_cache()
+    def get_catalist_validators_index(self, blockstamp: BlockStamp) -> CatalistValidatorIndex:
+        index = CatalistValidatorIndex(
+            self.get_catalist_validators(blockstamp),
+            self.get_catalist_node_operators(blockstamp),
+        )
 
-        for validator in merged_validators:
-            global_no_id = (
-                staking_module_address[validator.catalist_id.moduleAddress],
-                NodeOperatorId(validator.catalist_id.operatorIndex),
-            )
+        for global_no_id, _ in index.unknown_operator_validators:
+            logger.warning({
+                'msg': f'Got global node operator id: {global_no_id}, '
+                       f'but it`s not exist in staking router on block number: {blockstamp.block_number}',
+            })
 
-            if global_no_id in no_validators:
-                no_validators[global_no_id].append(validator)
-            else:
-                logger.warning({
-                    'msg': f'Got global node operator id: {global_no_id}, '
-                           f'but it`s not exist in staking router on block number: {blockstamp.block_number}',
-                })
+        return index
 
-        return no_validators
+    def get_catalist_validators_by_node_operators(self, blockstamp: BlockStamp) -> ValidatorsByNodeOperator:
+        return self.get_catalist_validators_index(blockstamp).by_node_operator
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_catalist_node_operators(self, blockstamp: BlockStamp) -> list[NodeOperator]:
         result = []
 
-        for module in self.get_staking_modules(blockstamp):
-            operators = self.w3.catalist_contracts.staking_router.functions.getAllNodeOperatorDigests(
-                module.id
-            ).call(block_identifier=blockstamp.block_hash)
+        staking_router = self.w3.catalist_contracts.staking_router
+
+        with Multicall(self.w3, blockstamp.block_hash) as multicall:
+            modules_operators = [
+                (module, multicall.add(staking_router.functions.getAllNodeOperatorDigests(module.id)))
+                for module in self.get_staking_modules(blockstamp)
+            ]
 
-            for operator in operators:
+        for module, operators in modules_operators:
+            for operator in operators.value:
                 result.append(NodeOperator.from_response(operator, module))
 
         return result
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     @list_of_dataclasses(StakingModule)
     def get_staking_modules(self, blockstamp: BlockStamp) -> list[StakingModule]:
         modules = self.w3.catalist_contracts.staking_router.functions.getStakingModules().call(
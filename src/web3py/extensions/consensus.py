@@ -2,10 +2,16 @@ from web3 import Web3
 from web3.module import Module
 
 from src.providers.consensus.client import ConsensusClient
+from src.providers.consensus.validator_snapshots import ValidatorSnapshotStore
 from src.variables import (
+    CONSENSUS_CLIENT_USE_SSZ,
+    HTTP_REQUEST_HEDGING_PERCENTILE_CONSENSUS,
+    HTTP_REQUEST_MAX_CONCURRENCY,
     HTTP_REQUEST_TIMEOUT_CONSENSUS,
     HTTP_REQUEST_RETRY_COUNT_CONSENSUS,
     HTTP_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS_CONSENSUS,
+    VALIDATORS_SNAPSHOT_DIR,
+    VALIDATORS_SNAPSHOT_MAX_SIZE_MB,
 )
 
 
@@ -18,5 +24,15 @@ class ConsensusClientModule(ConsensusClient, Module):
             HTTP_REQUEST_TIMEOUT_CONSENSUS,
             HTTP_REQUEST_RETRY_COUNT_CONSENSUS,
             HTTP_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS_CONSENSUS,
+            HTTP_REQUEST_HEDGING_PERCENTILE_CONSENSUS,
+            HTTP_REQUEST_MAX_CONCURRENCY,
         )
         super(Module, self).__init__()
+
+        self.use_ssz = CONSENSUS_CLIENT_USE_SSZ
+
+        if VALIDATORS_SNAPSHOT_DIR:
+            self.validators_snapshots = ValidatorSnapshotStore(
+                VALIDATORS_SNAPSHOT_DIR,
+                VALIDATORS_SNAPSHOT_MAX_SIZE_MB * 2**20,
+            )
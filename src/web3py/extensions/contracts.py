@@ -1,7 +1,8 @@
-import json
 import logging
 from time import sleep
+from typing import cast
 
+from eth_typing import ChecksumAddress, HexStr
 from web3 import Web3
 from web3.contract import Contract
 from web3.exceptions import BadFunctionCallOutput
@@ -11,7 +12,10 @@ from web3.types import Wei
 from src import variables
 from src.metrics.prometheus.business import FRAME_PREV_REPORT_REF_SLOT
 from src.typings import BlockStamp, SlotNumber
+from src.utils.abi import ABI_PATH, load_abi
 from src.utils.cache import global_lru_cache as lru_cache
+from src.web3py.batch import BatchRequest, BatchResult
+from src.web3py.multicall import Multicall
 
 logger = logging.getLogger()
 
@@ -29,6 +33,8 @@ class CatalistContracts(Module):
 
     def __init__(self, w3: Web3):
         super().__init__(w3)
+        # Names of the loaded contracts by lowercase address. Used to label EL requests
+        self.contract_names: dict[str, str] = {}
         self._load_contracts()
 
     def __setattr__(self, key, value):
@@ -62,71 +68,59 @@ class CatalistContracts(Module):
 
     def _load_contracts(self):
         # Contract that stores all catalist contract addresses
-        self.catalist_locator = self.w3.eth.contract(
-            address=variables.CATALIST_LOCATOR_ADDRESS,
-            abi=self.load_abi('CatalistLocator'),
-            decode_tuples=True,
-        )
+        self.catalist_locator = self.load_contract('CatalistLocator', variables.CATALIST_LOCATOR_ADDRESS)
 
-        self.catalist = self.w3.eth.contract(
-            address=self.catalist_locator.functions.catalist().call(),
-            abi=self.load_abi('Catalist'),
-            decode_tuples=True,
-        )
+        # All addresses are read from the locator in a single request if multicall is enabled
+        locator = self.catalist_locator.functions
 
-        self.accounting_oracle = self.w3.eth.contract(
-            address=self.catalist_locator.functions.accountingOracle().call(),
-            abi=self.load_abi('AccountingOracle'),
-            decode_tuples=True,
-        )
+        with Multicall(self.w3) as multicall:
+            addresses = {
+                'catalist': multicall.add(locator.catalist()),
+                'accounting_oracle': multicall.add(locator.accountingOracle()),
+                'staking_router': multicall.add(locator.stakingRouter()),
+                'validators_exit_bus_oracle': multicall.add(locator.validatorsExitBusOracle()),
+                'withdrawal_queue_nft': multicall.add(locator.withdrawalQueue()),
+                'oracle_report_sanity_checker': multicall.add(locator.oracleReportSanityChecker()),
+                'oracle_daemon_config': multicall.add(locator.oracleDaemonConfig()),
+                'burner': multicall.add(locator.burner()),
+            }
 
-        self.staking_router = self.w3.eth.contract(
-            address=self.catalist_locator.functions.stakingRouter().call(),
-            abi=self.load_abi('StakingRouter'),
-            decode_tuples=True,
-        )
+        self.catalist = self.load_contract('Catalist', addresses['catalist'].value)
 
-        self.validators_exit_bus_oracle = self.w3.eth.contract(
-            address=self.catalist_locator.functions.validatorsExitBusOracle().call(),
-            abi=self.load_abi('ValidatorsExitBusOracle'),
-            decode_tuples=True,
-        )
+        self.accounting_oracle = self.load_contract('AccountingOracle', addresses['accounting_oracle'].value)
 
-        self.withdrawal_queue_nft = self.w3.eth.contract(
-            address=self.catalist_locator.functions.withdrawalQueue().call(),
-            abi=self.load_abi('WithdrawalQueueERC721'),
-            decode_tuples=True,
-        )
+        self.staking_router = self.load_contract('StakingRouter', addresses['staking_router'].value)
 
-        self.oracle_report_sanity_checker = self.w3.eth.contract(
-            address=self.catalist_locator.functions.oracleReportSanityChecker().call(),
-            abi=self.load_abi('OracleReportSanityChecker'),
-            decode_tuples=True,
+        self.validators_exit_bus_oracle = self.load_contract(
+            'ValidatorsExitBusOracle',
+            addresses['validators_exit_bus_oracle'].value,
         )
 
-        self.oracle_daemon_config = self.w3.eth.contract(
-            address=self.catalist_locator.functions.oracleDaemonConfig().call(),
-            abi=self.load_abi('OracleDaemonConfig'),
-            decode_tuples=True,
-        )
+        self.withdrawal_queue_nft = self.load_contract('WithdrawalQueueERC721', addresses['withdrawal_queue_nft'].value)
 
-        self.burner = self.w3.eth.contract(
-            address=self.catalist_locator.functions.burner().call(),
-            abi=self.load_abi('Burner'),
-            decode_tuples=True,
+        self.oracle_report_sanity_checker = self.load_contract(
+            'OracleReportSanityChecker',
+            addresses['oracle_report_sanity_checker'].value,
         )
 
+        self.oracle_daemon_config = self.load_contract('OracleDaemonConfig', addresses['oracle_daemon_config'].value)
+
+        self.burner = self.load_contract('Burner', addresses['burner'].value)
+
         self._check_contracts()
 
     @staticmethod
-    def load_abi(abi_name: str, abi_path: str = './assets/'):
-        with open(f'{abi_path}{abi_name}.json') as f:
-            return json.load(f)
+    def load_abi(abi_name: str, abi_path: str = ABI_PATH):
+        return load_abi(abi_name, abi_path)
+
+    def load_contract(self, abi_name: str, address: ChecksumAddress) -> Contract:
+        self.contract_names[address.lower()] = abi_name
+        return cast(Contract, self.w3.eth.contract(address=address, abi=self.load_abi(abi_name), decode_tuples=True))
 
     # --- Contract methods ---
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_withdrawal_balance(self, blockstamp: BlockStamp) -> Wei:
-        return self.get_withdrawal_balance_no_cache(blockstamp)
+        return self._get_vaults_balances(blockstamp)['withdrawal_vault'].value
 
     def get_withdrawal_balance_no_cache(self, blockstamp: BlockStamp) -> Wei:
         return Wei(self.w3.eth.get_balance(
@@ -136,16 +130,26 @@ class CatalistContracts(Module):
             block_identifier=blockstamp.block_hash,
         ))
 
-    @lru_cache(maxsize=1)
+    @lru_cache()
     def get_el_vault_balance(self, blockstamp: BlockStamp) -> Wei:
-        return Wei(self.w3.eth.get_balance(
-            self.catalist_locator.functions.elRewardsVault().call(
-                block_identifier=blockstamp.block_hash
-            ),
-            block_identifier=blockstamp.block_hash,
-        ))
-
-    @lru_cache(maxsize=1)
+        return self._get_vaults_balances(blockstamp)['el_rewards_vault'].value
+
+    @lru_cache()
+    def _get_vaults_balances(self, blockstamp: BlockStamp) -> dict[str, BatchResult]:
+        """Vaults addresses and balances are read with a single request each, if multicall and batches are available"""
+        with Multicall(self.w3, blockstamp.block_hash) as multicall:
+            addresses = {
+                'withdrawal_vault': multicall.add(self.catalist_locator.functions.withdrawalVault()),
+                'el_rewards_vault': multicall.add(self.catalist_locator.functions.elRewardsVault()),
+            }
+
+        with BatchRequest(self.w3) as batch:
+            return {
+                vault: batch.add('eth_getBalance', [address.value, blockstamp.block_hash], _to_wei)
+                for vault, address in addresses.items()
+            }
+
+    @lru_cache()
     def get_accounting_last_processing_ref_slot(self, blockstamp: BlockStamp) -> SlotNumber:
         result = self.accounting_oracle.functions.getLastProcessingRefSlot().call(block_identifier=blockstamp.block_hash)
         logger.info({'msg': f'Accounting last processing ref slot {result}'})
@@ -159,3 +163,7 @@ class CatalistContracts(Module):
         logger.info({'msg': f'Ejector last processing ref slot {result}'})
         FRAME_PREV_REPORT_REF_SLOT.set(result)
         return result
+
+
+def _to_wei(value: str) -> Wei:
+    return Wei(Web3.to_int(hexstr=HexStr(value)))
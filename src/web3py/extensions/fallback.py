@@ -1,8 +1,16 @@
-from typing import Any
+import json
+import logging
+from typing import Any, Sequence, cast
 
-from web3_multi_provider import FallbackProvider
+from web3._utils.encoding import Web3JsonEncoder
+from web3._utils.request import make_post_request
+from web3_multi_provider import FallbackProvider, NoActiveProviderError
 from src.providers.consistency import ProviderConsistencyModule
 from web3 import Web3
+from web3.types import RPCEndpoint, RPCResponse
+
+
+logger = logging.getLogger(__name__)
 
 
 class FallbackProviderModule(ProviderConsistencyModule, FallbackProvider):
@@ -11,3 +19,45 @@ class FallbackProviderModule(ProviderConsistencyModule, FallbackProvider):
 
     def _get_chain_id_with_provider(self, provider_index: int) -> int:
         return Web3.to_int(hexstr=self._providers[provider_index].make_request("eth_chainId", []).get('result'))  # type: ignore[attr-defined]
+
+    def make_batch_request(self, requests: Sequence[tuple[RPCEndpoint, Any]]) -> list[RPCResponse]:
+        """
+        Sends all requests in a single JSON-RPC batch. If the provider fails, the whole batch is sent to the next one.
+        Responses are returned in the order of requests, the missing ones are replaced with error responses.
+        """
+        for provider in self.get_all_providers():
+            try:
+                return self._make_batch_request_with_provider(provider, requests)
+            except Exception as error:  # pylint: disable=broad-except
+                logger.warning({'msg': 'Provider failed to process batch request.', 'error': str(error)})
+
+        raise NoActiveProviderError('No active providers available.')
+
+    @staticmethod
+    def _make_batch_request_with_provider(provider: Any, requests: Sequence[tuple[RPCEndpoint, Any]]) -> list[RPCResponse]:
+        payload = [
+            {'jsonrpc': '2.0', 'method': method, 'params': params or [], 'id': request_id}
+            for request_id, (method, params) in enumerate(requests)
+        ]
+
+        raw_response = make_post_request(
+            provider.endpoint_uri,
+            json.dumps(payload, cls=Web3JsonEncoder).encode('utf-8'),
+            **provider.get_request_kwargs(),
+        )
+        responses = provider.decode_rpc_response(raw_response)
+
+        # Node responds with a single error if the whole batch is rejected
+        if not isinstance(responses, list):
+            raise ValueError(responses.get('error', responses))
+
+        responses_by_id = {response.get('id'): response for response in responses}
+
+        return [
+            responses_by_id.get(request_id) or cast(RPCResponse, {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'error': {'code': -32603, 'message': 'No response for the request in the batch.'},
+            })
+            for request_id in range(len(requests))
+        ]
@@ -2,10 +2,14 @@ from web3 import Web3
 from web3.module import Module
 
 from src.providers.keys.client import KeysAPIClient
+from src.providers.keys.store import KeysStore
 from src.variables import (
+    HTTP_REQUEST_HEDGING_PERCENTILE_KEYS_API,
+    HTTP_REQUEST_MAX_CONCURRENCY,
     HTTP_REQUEST_TIMEOUT_KEYS_API,
     HTTP_REQUEST_RETRY_COUNT_KEYS_API,
-    HTTP_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS_KEYS_API
+    HTTP_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS_KEYS_API,
+    KEYS_STORE_PATH,
 )
 
 
@@ -17,6 +21,11 @@ class KeysAPIClientModule(KeysAPIClient, Module):
             hosts,
             HTTP_REQUEST_TIMEOUT_KEYS_API,
             HTTP_REQUEST_RETRY_COUNT_KEYS_API,
-            HTTP_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS_KEYS_API
+            HTTP_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS_KEYS_API,
+            HTTP_REQUEST_HEDGING_PERCENTILE_KEYS_API,
+            HTTP_REQUEST_MAX_CONCURRENCY,
         )
         super(Module, self).__init__()
+
+        self.keys_store = KeysStore(KEYS_STORE_PATH)
+        self.poll_status = True
@@ -1,14 +1,17 @@
+import functools
 import json
 import logging
-import os
-from typing import Any, Callable
+from typing import Any, Callable, Mapping, Optional
 from urllib.parse import urlparse
 
+from eth_utils import encode_hex, function_abi_to_4byte_selector
 from requests import HTTPError, Response
 from web3.types import RPCEndpoint, RPCResponse
 from web3_multi_provider import NoActiveProviderError
 
-from src.metrics.prometheus.basic import EL_REQUESTS_DURATION
+from src.metrics.prometheus.basic import EL_CALL_STORE_REQUESTS, EL_REQUESTS_DURATION
+from src.utils.abi import ABI_PATH, get_abi_names, load_abi
+from src.web3py.call_store import CallResultsStore
 from web3 import Web3
 
 logger = logging.getLogger(__name__)
@@ -23,38 +26,11 @@ def metrics_collector(
 
     EL_REQUESTS_DURATION - HISTOGRAM with requests time, count, response codes and request domain.
     """
-
-    contracts = []
-
-    abi_dir = './assets/'
-    for filename in os.listdir(abi_dir):
-        with open(os.path.join(abi_dir, filename), 'r') as f:
-            try:
-                contracts.append(w3.eth.contract(abi=json.load(f)))
-            except json.JSONDecodeError:
-                pass
+    selectors = get_function_selectors()
 
     def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
-        try:
-            # Works only with HTTP and Websocket Provider
-            domain = urlparse(getattr(w3.provider, "endpoint_uri")).netloc
-        except:
-            domain = 'unavailable'
-
-        call_method = ''
-        call_to = ''
-        if method == 'eth_call':
-            args = params[0]
-            call_to = args['to']
-            for contract in contracts:
-                try:
-                    call_method = contract.get_function_by_selector(args['data']).fn_name
-                except ValueError:
-                    pass
-                if call_method:
-                    break
-        if method == 'eth_getBalance':
-            call_to = params[0]
+        domain = get_provider_domain(w3)
+        call_method, call_to = get_call_labels(selectors, method, params, get_contract_names(w3))
 
         with EL_REQUESTS_DURATION.time() as t:
             try:
@@ -79,20 +55,132 @@ def metrics_collector(
                 )
                 raise
 
-            # https://www.jsonrpc.org/specification#error_object
-            error = response.get("error")
-            code: int = 0
-            if isinstance(error, dict):
-                code = error.get("code") or code
-
             t.labels(
                 endpoint=method,
                 call_method=call_method,
                 call_to=call_to,
-                code=code,
+                code=get_response_code(response),
                 domain=domain,
             )
 
             return response
 
     return middleware
+
+
+@functools.cache
+def get_function_selectors(abi_path: str = ABI_PATH) -> dict[str, dict[str, str]]:
+    """
+    4-byte selectors of all functions of known contracts with names of the contracts and the functions.
+    Used to find the called contract and function.
+    """
+    selectors: dict[str, dict[str, str]] = {}
+
+    for abi_name in get_abi_names(abi_path):
+        try:
+            abi = load_abi(abi_name, abi_path)
+        except json.JSONDecodeError:
+            continue
+
+        for fn_abi in abi:
+            if fn_abi.get('type') == 'function':
+                selector = encode_hex(function_abi_to_4byte_selector(fn_abi))
+                selectors.setdefault(selector, {})[abi_name] = fn_abi['name']
+
+    return selectors
+
+
+def get_contract_names(w3: Web3) -> Mapping[str, str]:
+    """Names of the loaded contracts by lowercase address, empty until contracts are loaded"""
+    contract_names = getattr(getattr(w3, 'catalist_contracts', None), 'contract_names', None)
+    return contract_names if isinstance(contract_names, dict) else {}
+
+
+def get_provider_domain(w3: Web3) -> str:
+    try:
+        # Works only with HTTP and Websocket Provider
+        return urlparse(getattr(w3.provider, "endpoint_uri")).netloc
+    except:
+        return 'unavailable'
+
+
+def get_call_labels(
+    selectors: dict[str, dict[str, str]],
+    method: RPCEndpoint,
+    params: Any,
+    contract_names: Optional[Mapping[str, str]] = None,
+) -> tuple[str, str]:
+    """Returns name of the called function and name of the called contract (or its address if contract is unknown)"""
+    contract_names = contract_names or {}
+
+    if method == 'eth_call':
+        args = params[0]
+        address = args['to']
+        functions = selectors.get(args.get('data', '')[:10].lower(), {})
+
+        contract = contract_names.get(address.lower())
+        if contract is None and len(functions) == 1:
+            # Function is declared by a single known contract
+            contract = next(iter(functions))
+
+        # Same selector means the same signature, so the function name is the same in all contracts
+        return next(iter(functions.values()), ''), contract or address
+
+    if method == 'eth_getBalance':
+        address = params[0]
+        return '', contract_names.get(address.lower(), address)
+
+    return '', ''
+
+
+def get_response_code(response: RPCResponse) -> int:
+    # https://www.jsonrpc.org/specification#error_object
+    error = response.get("error")
+    code: int = 0
+    if isinstance(error, dict):
+        code = error.get("code") or code
+    return code
+
+
+# Requests that return the same response for the same block
+BLOCK_PINNED_METHODS = {'eth_call', 'eth_getBalance'}
+
+
+def construct_call_store_middleware(store: CallResultsStore):
+    """
+    Responses of eth_call and eth_getBalance requested by block hash are kept in the persistent store.
+    Requests by block number or tag are sent as usual.
+    """
+    def call_store_middleware(
+        make_request: Callable[[RPCEndpoint, Any], RPCResponse],
+        w3: Web3,  # pylint: disable=unused-argument
+    ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            key = store.get_key(method, params) if method in BLOCK_PINNED_METHODS else None
+            if key is None:
+                return make_request(method, params)
+
+            if (response := store.get(key)) is not None:
+                EL_CALL_STORE_REQUESTS.labels(method, 'hit').inc()
+                return response
+
+            EL_CALL_STORE_REQUESTS.labels(method, 'miss').inc()
+            response = make_request(method, params)
+            if 'result' in response and 'error' not in response:
+                store.put(key, response)
+
+            return response
+
+        return middleware
+
+    # Batched requests don't pass through the middlewares, so BatchRequest reads and fills the store itself
+    call_store_middleware.store = store  # type: ignore[attr-defined]
+    return call_store_middleware
+
+
+def get_call_store(w3: Web3) -> Optional[CallResultsStore]:
+    """Store of the call store middleware, None if the middleware isn't added"""
+    for middleware in w3.middleware_onion:
+        if isinstance(store := getattr(middleware, 'store', None), CallResultsStore):
+            return store
+    return None
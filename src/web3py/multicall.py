@@ -0,0 +1,153 @@
+import logging
+from typing import Any, Optional
+
+from web3 import Web3
+from web3.contract.base_contract import BaseContractFunction
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+from web3.types import BlockIdentifier
+
+from src import variables
+from src.metrics.prometheus.basic import MULTICALL_CALLS
+from src.web3py.contract_tweak import decode_contract_function_output
+
+
+logger = logging.getLogger(__name__)
+
+
+MULTICALL3_ABI = [
+    {
+        'inputs': [
+            {
+                'components': [
+                    {'internalType': 'address', 'name': 'target', 'type': 'address'},
+                    {'internalType': 'bool', 'name': 'allowFailure', 'type': 'bool'},
+                    {'internalType': 'bytes', 'name': 'callData', 'type': 'bytes'},
+                ],
+                'internalType': 'struct Multicall3.Call3[]',
+                'name': 'calls',
+                'type': 'tuple[]',
+            },
+        ],
+        'name': 'aggregate3',
+        'outputs': [
+            {
+                'components': [
+                    {'internalType': 'bool', 'name': 'success', 'type': 'bool'},
+                    {'internalType': 'bytes', 'name': 'returnData', 'type': 'bytes'},
+                ],
+                'internalType': 'struct Multicall3.Result[]',
+                'name': 'returnData',
+                'type': 'tuple[]',
+            },
+        ],
+        'stateMutability': 'payable',
+        'type': 'function',
+    },
+]
+
+
+class MulticallResult:
+    """
+    Result of the contract function added to the multicall.
+
+    If the value wasn't read by the multicall (multicall is disabled, the call failed or the value is accessed
+    before the multicall is executed), the function is called on its own when the value is accessed.
+    So the errors are the same as without multicall.
+    """
+    def __init__(self, function: BaseContractFunction, block_identifier: BlockIdentifier):
+        self.function = function
+        self.block_identifier = block_identifier
+        self.resolved = False
+        self._value: Any = None
+
+    @property
+    def value(self) -> Any:
+        if not self.resolved:
+            self.set(self.function.call(block_identifier=self.block_identifier))
+        return self._value
+
+    def set(self, value: Any) -> None:
+        self._value = value
+        self.resolved = True
+
+
+class Multicall:
+    """
+    Reads independent contract values at the same block with a single request to the Multicall3 contract.
+
+    with Multicall(w3, blockstamp.block_hash) as multicall:
+        first = multicall.add(contract.functions.first())
+        second = multicall.add(contract.functions.second())
+
+    return first.value, second.value
+    """
+    MAX_CALLS_PER_REQUEST = 100
+
+    def __init__(self, w3: Web3, block_identifier: BlockIdentifier = 'latest', address: Optional[str] = None):
+        self.w3 = w3
+        self.block_identifier = block_identifier
+        self.address = variables.MULTICALL_ADDRESS if address is None else address
+        self.results: list[MulticallResult] = []
+
+    def __enter__(self) -> 'Multicall':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def add(self, function: BaseContractFunction) -> MulticallResult:
+        result = MulticallResult(function, self.block_identifier)
+        self.results.append(result)
+        return result
+
+    def execute(self) -> None:
+        pending = [result for result in self.results if not result.resolved]
+
+        # Nothing to gain from a single call, it is sent on its own when the value is accessed
+        if not self.address or len(pending) < 2:
+            return
+
+        multicall = self.w3.eth.contract(address=self.w3.to_checksum_address(self.address), abi=MULTICALL3_ABI)
+
+        for start in range(0, len(pending), self.MAX_CALLS_PER_REQUEST):
+            batch = pending[start:start + self.MAX_CALLS_PER_REQUEST]
+
+            try:
+                responses = multicall.functions.aggregate3([
+                    (result.function.address, True, result.function._encode_transaction_data())  # pylint: disable=protected-access
+                    for result in batch
+                ]).call(block_identifier=self.block_identifier)
+            except (BadFunctionCallOutput, ContractLogicError, ValueError) as error:
+                logger.warning({'msg': 'Multicall failed. Contract values will be read one by one.', 'error': str(error)})
+                MULTICALL_CALLS.labels('fallback').inc(len(batch))
+                continue
+
+            for result, (success, return_data) in zip(batch, responses):
+                if success and self._decode(result, return_data):
+                    MULTICALL_CALLS.labels('batched').inc()
+                else:
+                    MULTICALL_CALLS.labels('fallback').inc()
+
+    @staticmethod
+    def _decode(result: MulticallResult, return_data: bytes) -> bool:
+        function = result.function
+
+        try:
+            value = decode_contract_function_output(
+                function.w3,
+                function.address,
+                function._return_data_normalizers or tuple(),  # pylint: disable=protected-access
+                function.function_identifier,
+                return_data,
+                function.contract_abi,
+                function.abi,
+                function.decode_tuples,
+                *function.args,
+                **function.kwargs,
+            )
+        except BadFunctionCallOutput:
+            return False
+
+        result.set(value)
+        return True
@@ -2,6 +2,7 @@ from eth_typing import BlockNumber, HexStr
 from web3.types import Timestamp
 
 from tests.factory.web3_factory import Web3Factory
+from src.providers.consensus.typings import BlockHeaderFullResponse
 from src.typings import BlockStamp, StateRoot, SlotNumber, BlockHash, ReferenceBlockStamp, EpochNumber
 
 
@@ -26,3 +27,24 @@ class ReferenceBlockStampFactory(Web3Factory):
 
     ref_slot: SlotNumber = SlotNumber(294271)
     ref_epoch: EpochNumber = EpochNumber(9195)
+
+
+def build_block_header(slot: int, finalized: bool = True, canonical: bool = True) -> BlockHeaderFullResponse:
+    return BlockHeaderFullResponse.from_response(
+        execution_optimistic=False,
+        finalized=finalized,
+        data={
+            'root': '0x' + f'{slot:064x}',
+            'canonical': canonical,
+            'header': {
+                'message': {
+                    'slot': str(slot),
+                    'proposer_index': '1',
+                    'parent_root': '0x' + f'{slot - 1:064x}',
+                    'state_root': '0x' + 'aa' * 32,
+                    'body_root': '0x' + 'bb' * 32,
+                },
+                'signature': '0x',
+            },
+        },
+    )
@@ -4,7 +4,8 @@ from itertools import count
 from faker import Faker
 from pydantic_factories import Use
 
-from src.providers.consensus.typings import Validator, ValidatorState
+from src.constants import FAR_FUTURE_EPOCH, MAX_EFFECTIVE_BALANCE
+from src.providers.consensus.typings import Validator, ValidatorState, ValidatorStatus
 from src.providers.keys.typings import CatalistKey
 from tests.factory.web3_factory import Web3Factory
 from src.web3py.extensions.catalist_validators import StakingModule, CatalistValidator, NodeOperator
@@ -49,3 +50,34 @@ class NodeOperatorFactory(Web3Factory):
     __model__ = NodeOperator
 
     id: int = Use(lambda x: next(x), count(1))
+
+
+def build_validator(
+    index: int = 0,
+    balance: int = MAX_EFFECTIVE_BALANCE,
+    status: ValidatorStatus = ValidatorStatus.ACTIVE_ONGOING,
+    pubkey: str | None = None,
+    withdrawal_credentials: str = '0x01' + '00' * 31,
+    effective_balance: int = MAX_EFFECTIVE_BALANCE,
+    slashed: bool = False,
+    activation_eligibility_epoch: int = 0,
+    activation_epoch: int = 0,
+    exit_epoch: int = FAR_FUTURE_EPOCH,
+    withdrawable_epoch: int = FAR_FUTURE_EPOCH,
+) -> Validator:
+    """Validator with well-formed fields, that could be stored in ValidatorTable"""
+    return Validator(
+        index=str(index),
+        balance=str(balance),
+        status=status,
+        validator=ValidatorState(
+            pubkey=pubkey or '0x' + index.to_bytes(48, 'big').hex(),
+            withdrawal_credentials=withdrawal_credentials,
+            effective_balance=str(effective_balance),
+            slashed=slashed,
+            activation_eligibility_epoch=str(activation_eligibility_epoch),
+            activation_epoch=str(activation_epoch),
+            exit_epoch=str(exit_epoch),
+            withdrawable_epoch=str(withdrawable_epoch),
+        ),
+    )
@@ -4,13 +4,14 @@ from unittest.mock import Mock
 import pytest
 
 from src.modules.accounting.typings import CatalistReportRebase
+from src.providers.consensus.validator_table import ValidatorTable
 from src.services.bunker import BunkerService
 from src.typings import ReferenceBlockStamp
 from src.web3py.extensions.catalist_validators import CatalistValidator
 from tests.factory.blockstamp import ReferenceBlockStampFactory
 from tests.factory.configs import BunkerConfigFactory, ChainConfigFactory, FrameConfigFactory
 from tests.factory.contract_responses import CatalistReportRebaseFactory
-from tests.factory.no_registry import CatalistValidatorFactory
+from tests.factory.no_registry import CatalistKeyFactory, build_validator
 from tests.modules.accounting.bunker.conftest import simple_ref_blockstamp
 
 
@@ -158,8 +159,12 @@ class TestIsBunkerMode:
 
     @pytest.fixture
     def mock_validators(self, bunker: BunkerService) -> Sequence[CatalistValidator]:
-        validators = CatalistValidatorFactory.batch(5)
+        validators = [
+            CatalistValidator.from_validator(validator, CatalistKeyFactory.build(key=validator.validator.pubkey))
+            for validator in map(build_validator, range(5))
+        ]
         bunker.w3.cc.get_validators = Mock(return_value=validators)
+        bunker.w3.cc.get_validators_table = Mock(return_value=ValidatorTable.from_validators(validators))
         bunker.w3.catalist_validators.get_catalist_validators = Mock(return_value=validators[:2])
         return validators
 
@@ -3,7 +3,8 @@ import pytest
 from src.modules.submodules.consensus import FrameConfig
 from src.modules.submodules.typings import ChainConfig
 from src.providers.consensus.typings import Validator, ValidatorStatus, ValidatorState
-from src.services.bunker_cases.midterm_slashing_penalty import MidtermSlashingPenalty
+from src.providers.consensus.validator_table import ValidatorTable
+from src.services.bunker_cases.midterm_slashing_penalty import MidtermSlashingPenalty, SlashedEpochsIndex
 from src.typings import EpochNumber, ReferenceBlockStamp
 
 
@@ -28,11 +29,11 @@ def simple_validators(
             balance=effective_balance,
             status=ValidatorStatus.ACTIVE_ONGOING,
             validator=ValidatorState(
-                pubkey=f"0x{index}",
-                withdrawal_credentials='',
+                pubkey='0x' + index.to_bytes(48, 'big').hex(),
+                withdrawal_credentials='0x01' + '00' * 31,
                 effective_balance=str(32 * 10**9),
                 slashed=slashed,
-                activation_eligibility_epoch='',
+                activation_eligibility_epoch='0',
                 activation_epoch='0',
                 exit_epoch=exit_epoch,
                 withdrawable_epoch=withdrawable_epoch,
@@ -122,7 +123,13 @@ def test_is_high_midterm_slashing_penalty(
     )
 
     result = MidtermSlashingPenalty.is_high_midterm_slashing_penalty(
-        blockstamp, frame_config, chain_config, all_validators, catalist_validators, report_cl_rebase, 0
+        blockstamp,
+        frame_config,
+        chain_config,
+        ValidatorTable.from_validators(all_validators),
+        catalist_validators,
+        report_cl_rebase,
+        0,
     )
     assert result == expected_result
 
@@ -385,7 +392,47 @@ def test_get_bound_with_midterm_epoch_slashed_validators(
 
 @pytest.mark.unit
 @pytest.mark.parametrize(
-    ("catalist_validators", "ref_epoch", "expected_len"),
+    ("from_epoch", "to_epoch", "expected_count"),
+    [
+        (0, 100, 3),
+        (0, 9, 2),
+        (10, 10, 3),
+        (11, 19, 2),
+        (21, 29, 1),
+        (31, 100, 0),
+        (20, 10, 0),
+    ],
+)
+def test_slashed_epochs_index_count_in_range(from_epoch, to_epoch, expected_count):
+    # The last range is empty and never counted
+    index = SlashedEpochsIndex([(0, 30), (10, 10), (5, 20), (15, 14)])
+
+    assert index.count_in_range(from_epoch, to_epoch) == expected_count
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("midterm_penalty_epoch", [0, 4096, 8192, 8200, 12288, 16383, 16384, 20000])
+def test_slashed_epochs_index_same_as_bound_validators(midterm_penalty_epoch):
+    ref_epoch = EpochNumber(16000)
+    slashed_validators = [
+        *simple_validators(0, 4, slashed=True, exit_epoch="16000", withdrawable_epoch="16300"),
+        *simple_validators(5, 9, slashed=True, exit_epoch="16380", withdrawable_epoch="16384"),
+        *simple_validators(10, 14, slashed=True, exit_epoch="8000", withdrawable_epoch="8417"),
+        *simple_validators(15, 19, slashed=True, exit_epoch="24000", withdrawable_epoch="24256"),
+    ]
+
+    index = MidtermSlashingPenalty.get_slashed_epochs_index(ref_epoch, slashed_validators)
+    bound_validators = MidtermSlashingPenalty.get_bound_with_midterm_epoch_slashed_validators(
+        ref_epoch, slashed_validators, EpochNumber(midterm_penalty_epoch)
+    )
+
+    bound_validators_count = index.count_in_range(max(0, midterm_penalty_epoch - 8192), midterm_penalty_epoch)
+    assert bound_validators_count == len(bound_validators)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("all_validators", "ref_epoch", "expected_len"),
     [
         (
             # no one slashed
@@ -407,9 +454,11 @@ def test_get_bound_with_midterm_epoch_slashed_validators(
         ),
     ],
 )
-def test_get_slashed_validators_with_impact_to_midterm_penalties(catalist_validators, ref_epoch, expected_len):
-    result = MidtermSlashingPenalty.get_slashed_validators_with_impact_on_midterm_penalties(catalist_validators, ref_epoch)
-    assert len(result) == expected_len
+def test_get_slashed_validators_with_impact_to_midterm_penalties(all_validators, ref_epoch, expected_len):
+    result = MidtermSlashingPenalty.get_slashed_validators_with_impact_on_midterm_penalties(
+        ValidatorTable.from_validators(all_validators), ref_epoch
+    )
+    assert result == all_validators[:expected_len]
 
 
 @pytest.mark.unit
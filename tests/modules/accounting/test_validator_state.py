@@ -129,7 +129,7 @@ def catalist_validators(web3):
 @pytest.fixture
 def validator_state(web3, contracts, consensus_client, catalist_validators):
     service = CatalistValidatorStateService(web3)
-    requested_indexes = [3, 8]
+    requested_indexes = [[3, 8]]
     service._get_last_requested_validator_indices = Mock(return_value=requested_indexes)
     return service
 
@@ -1,4 +1,4 @@
-from typing import Iterable, cast
+from typing import cast
 from unittest.mock import Mock
 
 import pytest
@@ -9,13 +9,14 @@ from src.modules.ejector.ejector import Ejector, EjectorProcessingState
 from src.modules.ejector.ejector import logger as ejector_logger
 from src.modules.submodules.oracle_module import ModuleExecuteDelay
 from src.modules.submodules.typings import ChainConfig
+from src.providers.consensus.validator_table import ValidatorTable
 from src.typings import BlockStamp, ReferenceBlockStamp
 from src.web3py.extensions.contracts import CatalistContracts
 from src.web3py.extensions.catalist_validators import NodeOperatorId, StakingModuleId
 from src.web3py.typings import Web3
 from tests.factory.blockstamp import BlockStampFactory, ReferenceBlockStampFactory
 from tests.factory.configs import ChainConfigFactory
-from tests.factory.no_registry import CatalistValidatorFactory
+from tests.factory.no_registry import CatalistValidatorFactory, build_validator
 from tests.modules.accounting.test_safe_border_unit import FAR_FUTURE_EPOCH
 
 
@@ -155,6 +156,49 @@ class TestGetValidatorsToEject:
             result = ejector.get_validators_to_eject(ref_blockstamp)
             assert result == [validators[0]], "Unexpected validators to eject"
 
+    @pytest.mark.unit
+    @pytest.mark.usefixtures("consensus_client")
+    def test_epoch_dependent_balance_evaluated_on_epoch_change(
+        self,
+        ejector: Ejector,
+        ref_blockstamp: ReferenceBlockStamp,
+        chain_config: ChainConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        ejector.get_chain_config = Mock(return_value=chain_config)
+        ejector.get_total_unfinalized_withdrawal_requests_amount = Mock(return_value=1000)
+        ejector.prediction_service.get_rewards_per_epoch = Mock(return_value=1)
+        ejector._get_sweep_delay_in_epochs = Mock(return_value=0)
+        ejector._get_total_el_balance = Mock(return_value=100)
+        ejector.validators_state_service.get_recently_requested_but_not_exited_validators = Mock(return_value=[])
+
+        # Two validators exit per epoch
+        ejector._get_predicted_withdrawable_epoch = Mock(
+            side_effect=lambda blockstamp, count: ref_blockstamp.ref_epoch + (count + 1) // 2
+        )
+        ejector._get_withdrawable_catalist_validators_balance = Mock(
+            side_effect=lambda blockstamp, epoch: (epoch - ref_blockstamp.ref_epoch) * 100
+        )
+        ejector._get_predicted_withdrawable_balance = Mock(return_value=50)
+
+        validators = [
+            ((StakingModuleId(0), NodeOperatorId(i)), CatalistValidatorFactory.build()) for i in range(10)
+        ]
+
+        with monkeypatch.context() as m:
+            m.setattr(
+                ejector_module.ExitOrderIterator,
+                "__iter__",
+                Mock(return_value=iter(validators)),
+            )
+            result = ejector.get_validators_to_eject(ref_blockstamp)
+
+        # 100 el balance + 50 per ejected validator + 101 per epoch for withdrawals and rewards
+        # reaches 1000 with 8 ejected validators at the 5th epoch
+        assert result == validators[:8], "Unexpected validators to eject"
+        epochs = [call.args[1] for call in ejector._get_withdrawable_catalist_validators_balance.call_args_list]
+        assert epochs == [ref_blockstamp.ref_epoch + epoch for epoch in range(1, 6)]
+
 
 @pytest.mark.unit
 @pytest.mark.usefixtures("contracts")
@@ -208,14 +252,17 @@ def test_get_withdrawable_catalist_validators(
     ref_blockstamp: ReferenceBlockStamp,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    ejector.w3.catalist_validators.get_catalist_validators = Mock(
-        return_value=[
-            CatalistValidatorFactory.build(balance="0"),
-            CatalistValidatorFactory.build(balance="0"),
-            CatalistValidatorFactory.build(balance="31"),
-            CatalistValidatorFactory.build(balance="42"),
-        ]
-    )
+    validators = [
+        CatalistValidatorFactory.build(balance="0"),
+        CatalistValidatorFactory.build(balance="0"),
+        CatalistValidatorFactory.build(balance="31"),
+        CatalistValidatorFactory.build(balance="42"),
+        CatalistValidatorFactory.build(balance="50"),
+    ]
+    for validator, withdrawable_epoch in zip(validators, [0, 0, 0, 42, 43]):
+        validator.validator.withdrawable_epoch = str(withdrawable_epoch)
+
+    ejector.w3.catalist_validators.get_catalist_validators = Mock(return_value=validators)
 
     with monkeypatch.context() as m:
         m.setattr(
@@ -224,10 +271,15 @@ def test_get_withdrawable_catalist_validators(
             Mock(side_effect=lambda v, _: int(v.balance) > 32),
         )
 
+        result = ejector._get_withdrawable_catalist_validators_balance(ref_blockstamp, 41)
+        assert result == 0, "Unexpected withdrawable amount"
+
         result = ejector._get_withdrawable_catalist_validators_balance(ref_blockstamp, 42)
         assert result == 42 * 10**9, "Unexpected withdrawable amount"
 
-        ejector._get_withdrawable_catalist_validators_balance(ref_blockstamp, 42)
+        result = ejector._get_withdrawable_catalist_validators_balance(ref_blockstamp, 100)
+        assert result == 92 * 10**9, "Unexpected withdrawable amount"
+
         ejector.w3.catalist_validators.get_catalist_validators.assert_called_once()
 
 
@@ -252,42 +304,25 @@ def test_get_sweep_delay_in_epochs(
     ejector: Ejector,
     ref_blockstamp: ReferenceBlockStamp,
     chain_config: ChainConfig,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    ejector.w3.cc.get_validators = Mock(return_value=CatalistValidatorFactory.batch(1024))
     ejector.get_chain_config = Mock(return_value=chain_config)
 
-    with monkeypatch.context() as m:
-        m.setattr(
-            ejector_module,
-            "is_partially_withdrawable_validator",
-            Mock(return_value=False),
-        )
-        m.setattr(
-            ejector_module,
-            "is_fully_withdrawable_validator",
-            Mock(return_value=False),
-        )
-
-        # no validators at all
-        result = ejector._get_sweep_delay_in_epochs(ref_blockstamp)
-        assert result == 0, "Unexpected sweep delay in epochs"
-
-    with monkeypatch.context() as m:
-        m.setattr(
-            ejector_module,
-            "is_partially_withdrawable_validator",
-            Mock(return_value=False),
-        )
-        m.setattr(
-            ejector_module,
-            "is_fully_withdrawable_validator",
-            Mock(return_value=True),
+    # no withdrawable validators at all
+    ejector.w3.cc.get_validators_table = Mock(
+        return_value=ValidatorTable.from_validators([build_validator(index=i) for i in range(1024)])
+    )
+    result = ejector._get_sweep_delay_in_epochs(ref_blockstamp)
+    assert result == 0, "Unexpected sweep delay in epochs"
+
+    # all 1024 validators, validators set stats are cached by blockstamp
+    ref_blockstamp = ReferenceBlockStampFactory.build(ref_epoch=ref_blockstamp.ref_epoch + 1)
+    ejector.w3.cc.get_validators_table = Mock(
+        return_value=ValidatorTable.from_validators(
+            [build_validator(index=i, withdrawable_epoch=0) for i in range(1024)]
         )
-
-        # all 1024 validators
-        result = ejector._get_sweep_delay_in_epochs(ref_blockstamp)
-        assert result == 1, "Unexpected sweep delay in epochs"
+    )
+    result = ejector._get_sweep_delay_in_epochs(ref_blockstamp)
+    assert result == 1, "Unexpected sweep delay in epochs"
 
 
 @pytest.mark.unit
@@ -311,26 +346,23 @@ def test_get_total_balance(ejector: Ejector, blockstamp: BlockStamp) -> None:
     ejector._get_buffer_ether.assert_called_once_with(blockstamp)
 
 
+def build_validators_table(is_active: list[bool]) -> ValidatorTable:
+    return ValidatorTable.from_validators([
+        build_validator(index=i, exit_epoch=FAR_FUTURE_EPOCH if active else 0)
+        for i, active in enumerate(is_active)
+    ])
+
+
 class TestChurnLimit:
     """_get_churn_limit tests"""
 
-    @pytest.fixture(autouse=True)
-    def mock_is_active_validator(self, monkeypatch: pytest.MonkeyPatch) -> Iterable:
-        with monkeypatch.context() as m:
-            m.setattr(
-                ejector_module,
-                "is_active_validator",
-                Mock(side_effect=lambda v, _: bool(v)),
-            )
-            yield
-
     @pytest.mark.unit
     @pytest.mark.usefixtures("consensus_client")
     def test_get_churn_limit_no_validators(self, ejector: Ejector, ref_blockstamp: ReferenceBlockStamp) -> None:
-        ejector.w3.cc.get_validators = Mock(return_value=[])
+        ejector.w3.cc.get_validators_table = Mock(return_value=build_validators_table([]))
         result = ejector._get_churn_limit(ref_blockstamp)
         assert result == ejector_module.MIN_PER_EPOCH_CHURN_LIMIT, "Unexpected churn limit"
-        ejector.w3.cc.get_validators.assert_called_once_with(ref_blockstamp)
+        ejector.w3.cc.get_validators_table.assert_called_once_with(ref_blockstamp)
 
     @pytest.mark.unit
     @pytest.mark.usefixtures("consensus_client")
@@ -341,12 +373,12 @@ class TestChurnLimit:
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         with monkeypatch.context() as m:
-            ejector.w3.cc.get_validators = Mock(return_value=[1, 1, 0])
+            ejector.w3.cc.get_validators_table = Mock(return_value=build_validators_table([True, True, False]))
             m.setattr(ejector_module, "MIN_PER_EPOCH_CHURN_LIMIT", 4)
             m.setattr(ejector_module, "CHURN_LIMIT_QUOTIENT", 1)
             result = ejector._get_churn_limit(ref_blockstamp)
             assert result == 4, "Unexpected churn limit"
-            ejector.w3.cc.get_validators.assert_called_once_with(ref_blockstamp)
+            ejector.w3.cc.get_validators_table.assert_called_once_with(ref_blockstamp)
 
     @pytest.mark.unit
     @pytest.mark.usefixtures("consensus_client")
@@ -357,13 +389,13 @@ class TestChurnLimit:
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         with monkeypatch.context() as m:
-            ejector.w3.cc.get_validators = Mock(return_value=[1] * 99)
+            ejector.w3.cc.get_validators_table = Mock(return_value=build_validators_table([True] * 99))
             m.setattr(ejector_module, "MIN_PER_EPOCH_CHURN_LIMIT", 0)
             m.setattr(ejector_module, "CHURN_LIMIT_QUOTIENT", 2)
             result = ejector._get_churn_limit(ref_blockstamp)
             assert result == 49, "Unexpected churn limit"
             ejector._get_churn_limit(ref_blockstamp)
-            ejector.w3.cc.get_validators.assert_called_once_with(ref_blockstamp)
+            ejector.w3.cc.get_validators_table.assert_called_once_with(ref_blockstamp)
 
 
 @pytest.mark.unit
@@ -374,19 +406,19 @@ def test_get_processing_state(ejector: Ejector, blockstamp: BlockStamp) -> None:
 
 @pytest.mark.unit
 @pytest.mark.usefixtures("consensus_client")
-def test_get_latest_exit_epoch(ejector: Ejector, blockstamp: BlockStamp) -> None:
-    ejector.w3.cc.get_validators = Mock(
-        return_value=[
-            Mock(validator=Mock(exit_epoch=FAR_FUTURE_EPOCH)),
-            Mock(validator=Mock(exit_epoch=42)),
-            Mock(validator=Mock(exit_epoch=42)),
-            Mock(validator=Mock(exit_epoch=1)),
-        ]
+def test_get_latest_exit_epoch(ejector: Ejector, ref_blockstamp: ReferenceBlockStamp) -> None:
+    ejector.w3.cc.get_validators_table = Mock(
+        return_value=ValidatorTable.from_validators([
+            build_validator(index=0, exit_epoch=FAR_FUTURE_EPOCH),
+            build_validator(index=1, exit_epoch=42),
+            build_validator(index=2, exit_epoch=42),
+            build_validator(index=3, exit_epoch=1),
+        ])
     )
 
-    (max_epoch, count) = ejector._get_latest_exit_epoch(blockstamp)
+    (max_epoch, count) = ejector._get_latest_exit_epoch(ref_blockstamp)
     assert count == 2, "Unexpected count of exiting validators"
     assert max_epoch == 42, "Unexpected max epoch"
 
-    ejector._get_latest_exit_epoch(blockstamp)
-    ejector.w3.cc.get_validators.assert_called_once_with(blockstamp)
+    ejector._get_latest_exit_epoch(ref_blockstamp)
+    ejector.w3.cc.get_validators_table.assert_called_once_with(ref_blockstamp)
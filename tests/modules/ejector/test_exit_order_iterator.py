@@ -4,7 +4,12 @@ from src.providers.consensus.typings import ValidatorState
 from src.providers.keys.typings import CatalistKey
 from src.services.exit_order_iterator import ExitOrderIterator
 from src.services.exit_order_iterator_state import NodeOperatorPredictableState, ExitOrderIteratorStateService
-from src.web3py.extensions.catalist_validators import CatalistValidator, StakingModuleId, NodeOperatorId
+from src.web3py.extensions.catalist_validators import (
+    CatalistValidator,
+    CatalistValidatorIndex,
+    NodeOperatorId,
+    StakingModuleId,
+)
 from tests.factory.blockstamp import ReferenceBlockStampFactory
 from tests.factory.configs import ChainConfigFactory
 from tests.factory.no_registry import CatalistValidatorFactory
@@ -132,6 +137,62 @@ def test_decrease_node_operator_stats():
     )
 
 
+@pytest.mark.unit
+def test_exit_order_is_the_same_as_sorted_queue():
+    def v(module_address, operator, index, activation_epoch) -> CatalistValidator:
+        validator = object.__new__(CatalistValidator)
+        validator.catalist_id = object.__new__(CatalistKey)
+        validator.validator = object.__new__(ValidatorState)
+        validator.catalist_id.moduleAddress = module_address
+        validator.catalist_id.operatorIndex = operator
+        validator.index = index
+        validator.validator.activation_epoch = activation_epoch
+        return validator
+
+    def build_iterator() -> ExitOrderIterator:
+        validators = [
+            v(f'0x{module}', operator, str(index), str(index * 7 % 100))
+            for index, (module, operator) in enumerate(
+                [(0, 1)] * 12 + [(0, 2)] * 5 + [(1, 1)] * 3 + [(1, 2)] * 2 + [(1, 3)] * 8 + [(0, 1)] * 4
+            )
+        ]
+        iterator = object.__new__(ExitOrderIterator)
+        iterator.blockstamp = ReferenceBlockStampFactory.build(ref_epoch=100)
+        iterator.left_queue_count = 0
+        iterator.max_validators_to_exit = 100
+        # Small operators cross the threshold when the total decreases
+        iterator.operator_network_penetration_threshold = 0.15
+        iterator.staking_module_id = {'0x0': StakingModuleId(0), '0x1': StakingModuleId(1)}
+        iterator.exitable_catalist_validators = validators
+        iterator.catalist_node_operator_stats = {
+            (StakingModuleId(0), NodeOperatorId(1)): NodeOperatorPredictableState(800, 16, False, 0, 0),
+            (StakingModuleId(0), NodeOperatorId(2)): NodeOperatorPredictableState(300, 5, True, 2, 0),
+            (StakingModuleId(1), NodeOperatorId(1)): NodeOperatorPredictableState(150, 3, False, 0, 0),
+            (StakingModuleId(1), NodeOperatorId(2)): NodeOperatorPredictableState(120, 2, False, 0, 1),
+            (StakingModuleId(1), NodeOperatorId(3)): NodeOperatorPredictableState(400, 8, False, 0, 0),
+        }
+        iterator.total_predictable_validators_count = 40
+        return iterator
+
+    expected = []
+    sorted_queue = build_iterator()
+    while sorted_queue.exitable_catalist_validators:
+        sorted_queue.exitable_catalist_validators.sort(key=sorted_queue._predicates)
+        validator = sorted_queue.exitable_catalist_validators.pop(0)
+        expected.append((sorted_queue._decrease_node_operator_stats(validator), validator.index))
+
+    iterator = build_iterator()
+    result = []
+    while True:
+        try:
+            global_index, validator = iterator.__next__()
+        except StopIteration:
+            break
+        result.append((global_index, validator.index))
+
+    assert result == expected
+
+
 @pytest.fixture
 def mock_exit_order_iterator_state_service(monkeypatch):
     class MockedExitOrderIteratorStateService(ExitOrderIteratorStateService):
@@ -156,6 +217,7 @@ def test_exit_order_iterator_iter(web3, catalist_validators, contracts, mock_exi
     iterator = ExitOrderIterator(web3, ReferenceBlockStampFactory.build(), ChainConfigFactory.build())
     web3.catalist_validators.get_catalist_node_operators = lambda _: []
     web3.catalist_validators.get_catalist_validators_by_node_operators = lambda _: []
+    web3.catalist_validators.get_catalist_validators_index = lambda _: CatalistValidatorIndex([], [])
 
     iterator.__iter__()
 
@@ -173,6 +235,7 @@ def test_exit_order_iterator_next(web3, catalist_validators, contracts, mock_exi
     iterator = ExitOrderIterator(web3, ReferenceBlockStampFactory.build(), ChainConfigFactory.build())
     web3.catalist_validators.get_catalist_node_operators = lambda _: []
     web3.catalist_validators.get_catalist_validators_by_node_operators = lambda _: []
+    web3.catalist_validators.get_catalist_validators_index = lambda _: CatalistValidatorIndex([], [])
 
     iterator.__iter__()
 
@@ -4,6 +4,7 @@ import pytest
 
 from src.modules.submodules.typings import ChainConfig
 from src.providers.consensus.typings import ValidatorState, Validator, ValidatorStatus
+from src.providers.consensus.validator_table import ValidatorTable
 from src.services.exit_order_iterator import NodeOperatorPredictableState
 from src.services.exit_order_iterator_state import ExitOrderIteratorStateService
 from src.web3py.extensions.catalist_validators import (
@@ -27,11 +28,11 @@ def simple_validators(
             balance=str(32 * 10**9),
             status=ValidatorStatus.ACTIVE_ONGOING,
             validator=ValidatorState(
-                pubkey=f"0x{index}",
-                withdrawal_credentials='',
+                pubkey='0x' + index.to_bytes(48, 'big').hex(),
+                withdrawal_credentials='0x01' + '00' * 31,
                 effective_balance=str(32 * 10**9),
                 slashed=slashed,
-                activation_eligibility_epoch='',
+                activation_eligibility_epoch='0',
                 activation_epoch=str(activation_epoch),
                 exit_epoch=exit_epoch,
                 withdrawable_epoch=exit_epoch,
@@ -79,7 +80,9 @@ def mock_get_validators(exit_order_state):
 
         return responses[blockstamp.slot_number]
 
-    exit_order_state.w3.cc.get_validators = Mock(side_effect=_get_validators)
+    exit_order_state.w3.cc.get_validators_table = Mock(
+        side_effect=lambda blockstamp: ValidatorTable.from_validators(_get_validators(blockstamp))
+    )
 
 
 @pytest.fixture
@@ -94,7 +97,12 @@ def mock_get_catalist_validators(exit_order_state):
         }
         return responses[blockstamp.slot_number]
 
-    exit_order_state.w3.catalist_validators.get_catalist_validators = Mock(side_effect=_get_catalist_validators)
+    def _get_catalist_validators_index(blockstamp):
+        return Mock(by_pubkey={v.validator.pubkey: v for v in _get_catalist_validators(blockstamp)})
+
+    exit_order_state.w3.catalist_validators.get_catalist_validators_index = Mock(
+        side_effect=_get_catalist_validators_index
+    )
 
 
 @pytest.fixture
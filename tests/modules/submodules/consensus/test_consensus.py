@@ -230,7 +230,7 @@ def test_no_report_contract(web3, impl: type[ConsensusModule]):
 
 def test_check_contract_config(consensus: ConsensusModule, monkeypatch: pytest.MonkeyPatch):
     consensus.w3.cc.get_block_root = Mock(return_value=Mock(root=""))
-    consensus.w3.cc.get_block_details = Mock()
+    consensus.w3.cc.get_blockstamp_details = Mock()
     bs = ReferenceBlockStampFactory.build()
     with monkeypatch.context() as m:
         m.setattr(consensus_module, "build_blockstamp", Mock(return_value=bs))
@@ -2,7 +2,7 @@ import json
 import os
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional, Sequence, Callable
+from typing import Any, Iterator, Optional, Sequence, Callable
 
 from web3 import Web3
 from web3.module import Module
@@ -129,6 +129,17 @@ class ResponseFromFileHTTPProvider(HTTPProvider, Module, FromFile):
                 return response["response"]
         raise NoMockException('There is no mock for response')
 
+    def _get_stream(
+        self,
+        endpoint: str,
+        path_params: Optional[Sequence[str | int]] = None,
+        query_params: Optional[dict] = None,
+        force_raise: Callable[..., Exception | None] = lambda _: None,
+        stream_key: str = 'data',
+    ) -> Iterator[Any]:
+        data, _ = self._get(endpoint, path_params, query_params, force_raise)
+        return iter(data)
+
     def get_all_hosts(self) -> list:
         return []
 
@@ -165,6 +176,17 @@ class UpdateResponsesHTTPProvider(HTTPProvider, Module, UpdateResponses):
         self.responses.append({"url": url, "params": query_params, "response": response})
         return response
 
+    def _get_stream(
+        self,
+        endpoint: str,
+        path_params: Optional[Sequence[str | int]] = None,
+        query_params: Optional[dict] = None,
+        force_raise: Callable[..., Exception | None] = lambda _: None,
+        stream_key: str = 'data',
+    ) -> Iterator[Any]:
+        data, _ = self._get(endpoint, path_params, query_params, force_raise)
+        return iter(data)
+
     @contextmanager
     def use_mock(self, mock_path: Path):
         with self.from_file.use_mock(mock_path), super().use_mock(mock_path):
@@ -1,5 +1,5 @@
 """Simple tests for the consensus client responses validity."""
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
@@ -46,6 +46,13 @@ def test_get_validators(consensus_client: ConsensusClient):
 @pytest.mark.unit
 def test_get_returns_nor_dict_nor_list(consensus_client: ConsensusClient):
     consensus_client._get_without_fallbacks = Mock(return_value=(1, None))
+
+    def get_response(*_, **__):
+        response = MagicMock()
+        response.iter_content.return_value = [b'{"data": 1}']
+        return response
+
+    consensus_client._get_response_without_fallbacks = Mock(side_effect=get_response)
     bs = BlockStampFactory.build()
 
     raises = pytest.raises(ValueError, match='Expected (mapping|list) response')
@@ -69,7 +76,7 @@ def test_get_returns_nor_dict_nor_list(consensus_client: ConsensusClient):
         consensus_client.get_validators_no_cache(bs)
 
     with raises:
-        consensus_client._get_validators_with_prysm(bs)
+        list(consensus_client._get_validators_with_prysm(bs))
 
     with raises:
         consensus_client._get_chain_id_with_provider(0)
@@ -0,0 +1,238 @@
+import struct
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from src.constants import FAR_FUTURE_EPOCH
+from src.providers.consensus.client import ConsensusClient
+from src.providers.consensus.ssz import (
+    BLOCK_BODY_EXECUTION_PAYLOAD_OFFSET_POSITION,
+    PAYLOAD_BLOCK_HASH_POSITION,
+    PAYLOAD_BLOCK_NUMBER_POSITION,
+    PAYLOAD_TIMESTAMP_POSITION,
+    SSZ_CONTENT_TYPE,
+    STATE_BALANCES_END_OFFSET_POSITION,
+    STATE_SLOT_POSITION,
+    STATE_VALIDATORS_OFFSET_POSITION,
+    VALIDATOR_STRUCT,
+    SSZDecodeError,
+    decode_signed_block,
+    decode_state_validators,
+)
+from src.providers.consensus.typings import ValidatorStatus
+from src.providers.http_provider import NotOkResponse
+from tests.factory.blockstamp import BlockStampFactory
+
+pytestmark = pytest.mark.unit
+
+SLOTS_PER_EPOCH = 32
+STATE_EPOCH = 100
+
+# pubkey, withdrawal_credentials, effective_balance, slashed,
+# activation_eligibility_epoch, activation_epoch, exit_epoch, withdrawable_epoch
+VALIDATORS = [
+    (b'\x01' * 48, b'\x01' + b'\x00' * 31, 32 * 10**9, False, 0, 0, FAR_FUTURE_EPOCH, FAR_FUTURE_EPOCH),
+    (b'\x02' * 48, b'\x00' * 32, 32 * 10**9, True, 0, 0, 150, 200),
+    (b'\x03' * 48, b'\x00' * 32, 32 * 10**9, False, 0, 0, 50, 90),
+    (b'\x04' * 48, b'\x00' * 32, 32 * 10**9, False, 0, 0, 50, 90),
+    (b'\x05' * 48, b'\x00' * 32, 32 * 10**9, False, 90, FAR_FUTURE_EPOCH, FAR_FUTURE_EPOCH, FAR_FUTURE_EPOCH),
+]
+BALANCES = [32 * 10**9 + 1, 31 * 10**9, 32 * 10**9, 0, 32 * 10**9]
+STATUSES = [
+    ValidatorStatus.ACTIVE_ONGOING,
+    ValidatorStatus.ACTIVE_SLASHED,
+    ValidatorStatus.WITHDRAWAL_POSSIBLE,
+    ValidatorStatus.WITHDRAWAL_DONE,
+    ValidatorStatus.PENDING_QUEUED,
+]
+
+
+def encode_state(validators, balances) -> bytes:
+    """BeaconState with filled slot, validators and balances. Other fields are filled with junk."""
+    fixed_part = bytearray(b'\xff' * (STATE_BALANCES_END_OFFSET_POSITION + 4 + 100))
+    historical_roots = b'\xee' * 64
+    encoded_validators = b''.join(VALIDATOR_STRUCT.pack(*validator) for validator in validators)
+    encoded_balances = struct.pack(f'<{len(balances)}Q', *balances)
+
+    validators_offset = len(fixed_part) + len(historical_roots)
+    balances_offset = validators_offset + len(encoded_validators)
+
+    struct.pack_into('<Q', fixed_part, STATE_SLOT_POSITION, STATE_EPOCH * SLOTS_PER_EPOCH + 5)
+    struct.pack_into('<II', fixed_part, STATE_VALIDATORS_OFFSET_POSITION, validators_offset, balances_offset)
+    struct.pack_into('<I', fixed_part, STATE_BALANCES_END_OFFSET_POSITION, balances_offset + len(encoded_balances))
+
+    return bytes(fixed_part) + historical_roots + encoded_validators + encoded_balances + b'\xdd' * 50
+
+
+def encode_block(slot: int, block_number: int, timestamp: int, block_hash: bytes) -> bytes:
+    payload = bytearray(600)
+    struct.pack_into('<Q', payload, PAYLOAD_BLOCK_NUMBER_POSITION, block_number)
+    struct.pack_into('<Q', payload, PAYLOAD_TIMESTAMP_POSITION, timestamp)
+    payload[PAYLOAD_BLOCK_HASH_POSITION:PAYLOAD_BLOCK_HASH_POSITION + 32] = block_hash
+
+    body = bytearray(500)
+    struct.pack_into('<I', body, BLOCK_BODY_EXECUTION_PAYLOAD_OFFSET_POSITION, len(body))
+
+    message = struct.pack('<QQ32s32sI', slot, 7, b'\xaa' * 32, b'\xbb' * 32, 84) + bytes(body) + bytes(payload)
+    return struct.pack('<I96s', 100, b'\xcc' * 96) + message
+
+
+def chunked(data: bytes, size: int = 1000) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_decode_state_validators():
+    table = decode_state_validators(chunked(encode_state(VALIDATORS, BALANCES)), SLOTS_PER_EPOCH)
+
+    assert len(table) == len(VALIDATORS)
+    assert list(table.index) == list(range(len(VALIDATORS)))
+    assert list(table.balance) == BALANCES
+    assert list(table.exit_epoch) == [v[6] for v in VALIDATORS]
+    assert [table.get_status(row) for row in range(len(table))] == STATUSES
+    assert table.get_pubkey(1) == '0x' + '02' * 48
+    assert table.slashed[1] == 1
+
+
+def test_decode_state_validators_empty():
+    assert len(decode_state_validators(chunked(encode_state([], [])), SLOTS_PER_EPOCH)) == 0
+
+
+def test_decode_state_validators_truncated():
+    with pytest.raises(SSZDecodeError):
+        decode_state_validators(chunked(encode_state(VALIDATORS, BALANCES)[:-100]), SLOTS_PER_EPOCH)
+
+
+def test_decode_signed_block():
+    block = decode_signed_block(encode_block(123, 456, 789, b'\x11' * 32), 'capella')
+
+    assert block['message']['slot'] == '123'
+    assert block['message']['parent_root'] == '0x' + 'aa' * 32
+    assert block['message']['state_root'] == '0x' + 'bb' * 32
+    assert block['message']['body']['execution_payload'] == {
+        'block_number': '456',
+        'block_hash': '0x' + '11' * 32,
+        'timestamp': '789',
+    }
+
+    assert decode_signed_block(encode_block(123, 456, 789, b'\x11' * 32), 'altair')['message']['body'] == {}
+
+
+def ssz_response(content: bytes, content_type: str = SSZ_CONTENT_TYPE, fork: str = 'capella'):
+    response = MagicMock()
+    response.headers = {'Content-Type': content_type, 'Eth-Consensus-Version': fork}
+    response.content = content
+    response.iter_content.side_effect = lambda chunk_size: chunked(content, chunk_size)
+    return response
+
+
+@pytest.fixture()
+def consensus_client():
+    client = ConsensusClient(['http://localhost:1', 'http://localhost:2'], 5 * 60, 5, 5)
+    client.use_ssz = True
+    client._get_slots_per_epoch = Mock(return_value=SLOTS_PER_EPOCH)
+    return client
+
+
+def test_get_validators_table_ssz(consensus_client):
+    consensus_client._get_response_without_fallbacks = Mock(return_value=ssz_response(encode_state(VALIDATORS, BALANCES)))
+
+    table = consensus_client.get_validators_table(BlockStampFactory.build())
+    assert list(table.balance) == BALANCES
+
+    validators = consensus_client.get_validators(BlockStampFactory.build())
+    assert [v.status for v in validators] == STATUSES
+
+
+def test_ssz_not_supported_host_fallbacks_to_json(consensus_client):
+    def get_response(host, endpoint, path_params=None, query_params=None, stream=False, headers=None):
+        if host == 'http://localhost:1':
+            raise NotOkResponse('Not acceptable', status=406, text='Not acceptable')
+        return ssz_response(b'{"data": {}}', content_type='application/json')
+
+    consensus_client._get_response_without_fallbacks = Mock(side_effect=get_response)
+    consensus_client.iter_validators = Mock(return_value=iter([]))
+
+    table = consensus_client.get_validators_table(BlockStampFactory.build())
+
+    assert len(table) == 0
+    consensus_client.iter_validators.assert_called_once()
+    assert not consensus_client._get_ssz_hosts()
+
+
+def test_get_block_details_ssz_with_json_fallback(consensus_client):
+    consensus_client._ssz_unsupported_hosts = frozenset({'http://localhost:1'})
+    consensus_client._get_without_fallbacks = Mock(side_effect=ConnectionError)
+    consensus_client._get_response_without_fallbacks = Mock(
+        return_value=ssz_response(encode_block(123, 456, 789, b'\x11' * 32))
+    )
+
+    block = consensus_client.get_block_details('0x' + 'ab' * 32)
+
+    assert block.message.slot == '123'
+    assert block.message.body['execution_payload']['block_number'] == '456'
+    consensus_client._get_without_fallbacks.assert_called_once()
+
+
+BLINDED_BLOCK = {
+    'message': {
+        'slot': '123',
+        'proposer_index': '7',
+        'parent_root': '0x' + 'aa' * 32,
+        'state_root': '0x' + 'bb' * 32,
+        'body': {
+            'attestations': [],
+            'execution_payload_header': {
+                'block_number': '456',
+                'block_hash': '0x' + '11' * 32,
+                'timestamp': '789',
+                'transactions_root': '0x' + '22' * 32,
+            },
+        },
+    },
+    'signature': '0x' + 'cc' * 96,
+}
+
+
+def json_response(data: dict):
+    response = MagicMock()
+    response.content = b'x' * 100
+    response.json.return_value = {'data': data}
+    return response
+
+
+def test_get_blockstamp_details_from_blinded_block_cached_by_root(consensus_client):
+    consensus_client.use_ssz = False
+    consensus_client._get_response_without_fallbacks = Mock(return_value=json_response(BLINDED_BLOCK))
+
+    block = consensus_client.get_blockstamp_details('0x' + 'AB' * 32)
+    assert consensus_client.get_blockstamp_details('0x' + 'ab' * 32) is block
+
+    assert block.message.slot == '123'
+    assert block.message.body == {
+        'execution_payload': {'block_number': '456', 'block_hash': '0x' + '11' * 32, 'timestamp': '789'},
+    }
+    consensus_client._get_response_without_fallbacks.assert_called_once()
+    assert consensus_client._get_response_without_fallbacks.call_args.args[1] == ConsensusClient.API_GET_BLINDED_BLOCK
+
+
+def test_get_blockstamp_details_from_ssz_blinded_block(consensus_client):
+    consensus_client._get_response_without_fallbacks = Mock(
+        return_value=ssz_response(encode_block(123, 456, 789, b'\x11' * 32))
+    )
+
+    block = consensus_client.get_blockstamp_details('0x' + 'ab' * 32)
+
+    assert block.message.body['execution_payload']['block_number'] == '456'
+
+
+def test_get_blockstamp_details_fallbacks_to_full_block(consensus_client):
+    consensus_client.use_ssz = False
+    consensus_client._get_response_without_fallbacks = Mock(
+        side_effect=NotOkResponse('Not found', status=404, text='Not found'),
+    )
+    consensus_client.get_block_details = Mock()
+
+    block = consensus_client.get_blockstamp_details('0x' + 'ab' * 32)
+
+    assert block is consensus_client.get_block_details.return_value
+    consensus_client.get_block_details.assert_called_once_with('0x' + 'ab' * 32)
@@ -0,0 +1,39 @@
+import pytest
+
+from src.providers.consensus.headers_cache import FinalizedHeadersCache
+from tests.factory.blockstamp import build_block_header
+
+pytestmark = pytest.mark.unit
+
+
+def test_get_by_slot_and_root():
+    cache = FinalizedHeadersCache(10)
+    header = build_block_header(100)
+    cache.put(header)
+
+    assert cache.get(100) is header
+    assert cache.get('100') is header
+    assert cache.get(header.data.root.upper().replace('0X', '0x')) is header
+    assert cache.get(101) is None
+    assert cache.get('finalized') is None
+
+
+def test_not_finalized_headers_are_not_cached():
+    cache = FinalizedHeadersCache(10)
+    cache.put(build_block_header(100, finalized=False))
+    cache.put(build_block_header(101, canonical=False))
+
+    assert cache.get(100) is None
+    assert cache.get(101) is None
+
+
+def test_least_recently_used_header_removed():
+    cache = FinalizedHeadersCache(2)
+    cache.put(build_block_header(1))
+    cache.put(build_block_header(2))
+    cache.get(1)
+    cache.put(build_block_header(3))
+
+    assert cache.get(1) is not None
+    assert cache.get(2) is None
+    assert cache.get(3) is not None
@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.providers.host_health import CircuitState, HostsHealth
+
+pytestmark = pytest.mark.unit
+
+HOSTS = ['http://localhost:1', 'http://localhost:2', 'http://localhost:3']
+
+
+@pytest.fixture()
+def hosts_health():
+    return HostsHealth('TestProvider', HOSTS)
+
+
+def test_hosts_without_observations_keep_order(hosts_health):
+    assert hosts_health.sort_hosts(HOSTS) == HOSTS
+
+
+def test_fastest_host_goes_first(hosts_health):
+    hosts_health.record_success(HOSTS[0], 2)
+    hosts_health.record_success(HOSTS[1], 3)
+    hosts_health.record_success(HOSTS[2], 1)
+
+    assert hosts_health.sort_hosts(HOSTS) == [HOSTS[2], HOSTS[0], HOSTS[1]]
+
+
+def test_failing_host_is_penalized(hosts_health):
+    for host in HOSTS:
+        hosts_health.record_success(host, 1)
+    hosts_health.record_failure(HOSTS[0])
+
+    assert hosts_health.sort_hosts(HOSTS)[-1] == HOSTS[0]
+    assert hosts_health.get_state(HOSTS[0]) == CircuitState.CLOSED
+
+
+def test_circuit_breaker(hosts_health):
+    with patch('src.providers.host_health.time.monotonic', return_value=1000):
+        for _ in range(HostsHealth.FAILURE_THRESHOLD):
+            hosts_health.record_failure(HOSTS[0])
+
+        assert hosts_health.get_state(HOSTS[0]) == CircuitState.OPEN
+        # Open host is still requested, but the last
+        assert hosts_health.sort_hosts(HOSTS) == [HOSTS[1], HOSTS[2], HOSTS[0]]
+
+    with patch('src.providers.host_health.time.monotonic', return_value=1000 + HostsHealth.COOLDOWN):
+        assert hosts_health.get_state(HOSTS[0]) == CircuitState.HALF_OPEN
+
+        # Failed probe opens the circuit again
+        hosts_health.record_failure(HOSTS[0])
+        assert hosts_health.get_state(HOSTS[0]) == CircuitState.OPEN
+
+    with patch('src.providers.host_health.time.monotonic', return_value=1000 + 2 * HostsHealth.COOLDOWN):
+        assert hosts_health.get_state(HOSTS[0]) == CircuitState.HALF_OPEN
+
+        # Successful probe closes the circuit
+        hosts_health.record_success(HOSTS[0], 1)
+        assert hosts_health.get_state(HOSTS[0]) == CircuitState.CLOSED
@@ -1,9 +1,13 @@
 # pylint: disable=protected-access
-from unittest.mock import Mock
+import asyncio
+import time
+from threading import BoundedSemaphore, Event, Lock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from src.providers.http_provider import HTTPProvider, NoHostsProvided
+from src.providers.http_provider import EndpointLatencies, HTTPProvider, NoHostsProvided, NotOkResponse
+from src.utils.concurrency import gather
 
 
 def test_urljoin():
@@ -61,3 +65,265 @@ def test_force_raise():
     with pytest.raises(CustomError):
         provider._get('test', force_raise=lambda _: CustomError())
     provider._get_without_fallbacks.assert_called_once_with('http://localhost:1', 'test', None, None)
+
+
+def hedged_provider() -> HTTPProvider:
+    provider = HTTPProvider(
+        ['http://localhost:1', 'http://localhost:2'], 5 * 60, 1, 1, hedging_percentile=90, max_concurrent_requests=2,
+    )
+    for _ in range(EndpointLatencies.MIN_SAMPLES_COUNT):
+        provider._latencies.add('test', 0.01)
+    return provider
+
+
+def test_endpoint_latencies_percentile():
+    latencies = EndpointLatencies()
+    for latency in range(1, EndpointLatencies.MIN_SAMPLES_COUNT):
+        latencies.add('test', latency)
+    assert latencies.get_percentile('test', 90) is None
+
+    latencies.add('test', EndpointLatencies.MIN_SAMPLES_COUNT)
+    assert latencies.get_percentile('test', 50) == 6
+    assert latencies.get_percentile('test', 100) == 10
+    assert latencies.get_percentile('other', 50) is None
+
+
+def test_hedged_request_to_slow_host():
+    slow_host_released = Event()
+
+    def _simple_get(host, endpoint, *_):
+        if host == 'http://localhost:1':
+            slow_host_released.wait(5)
+        return host, endpoint
+
+    provider = hedged_provider()
+    provider._get_without_fallbacks = _simple_get
+    try:
+        assert provider._get('test') == ('http://localhost:2', 'test')
+    finally:
+        slow_host_released.set()
+
+
+def test_hedged_latency_is_measured_per_host():
+    slow_host_released = Event()
+
+    def _simple_get(host, endpoint, *_):
+        if host == 'http://localhost:1':
+            slow_host_released.wait(5)
+        return host, endpoint
+
+    provider = hedged_provider()
+    provider._get_without_fallbacks = _simple_get
+    try:
+        provider._get('test')
+    finally:
+        slow_host_released.set()
+
+    # Second host responded immediately, hedging delay is not included
+    assert provider._latencies._samples['test'][-1] < 0.01
+
+
+def test_hedged_discards_late_results():
+    slow_host_released = Event()
+    discarded = Event()
+
+    def _simple_get(host, endpoint, *_):
+        if host == 'http://localhost:1':
+            slow_host_released.wait(5)
+        return host
+
+    provider = hedged_provider()
+    result = provider._with_fallbacks(
+        lambda host: _simple_get(host, 'test'),
+        endpoint='test',
+        discard=lambda late: discarded.set(),
+    )
+    assert result == 'http://localhost:2'
+
+    slow_host_released.set()
+    assert discarded.wait(5)
+
+
+def test_hedged_requests_hold_permit_per_host():
+    slow_host_released = Event()
+    requested_hosts = []
+
+    def _simple_get(host, endpoint, *_):
+        requested_hosts.append(host)
+        slow_host_released.wait(0.2)
+        return host, endpoint
+
+    provider = hedged_provider()
+    provider._requests_semaphore = BoundedSemaphore(1)
+    provider._get_without_fallbacks = _simple_get
+
+    # Hedged request waits for the permit held by the slow host and is not sent after the slow host responds
+    assert provider._get('test') == ('http://localhost:1', 'test')
+    provider._executor.shutdown(wait=True)
+    assert requested_hosts == ['http://localhost:1']
+
+
+def test_hedged_first_fallback_bad():
+    def _simple_get(host, endpoint, *_):
+        if host == 'http://localhost:1':
+            raise Exception('Bad host')  # pylint: disable=broad-exception-raised
+        return host, endpoint
+
+    provider = hedged_provider()
+    provider._get_without_fallbacks = _simple_get
+    assert provider._get('test') == ('http://localhost:2', 'test')
+
+
+def test_hedged_all_fallbacks_bad():
+    provider = hedged_provider()
+    provider._get_without_fallbacks = Mock(side_effect=[Exception('first'), Exception('second')])
+    with pytest.raises(Exception, match='second'):
+        provider._get('test')
+
+
+def test_hedged_force_raise():
+    class CustomError(Exception):
+        pass
+
+    provider = hedged_provider()
+    provider._get_without_fallbacks = Mock(side_effect=Exception('Bad host'))
+    with pytest.raises(CustomError):
+        provider._get('test', force_raise=lambda _: CustomError())
+    provider._get_without_fallbacks.assert_called_once_with('http://localhost:1', 'test', None, None)
+
+
+def test_failed_host_is_requested_last():
+    provider = HTTPProvider(['http://localhost:1', 'http://localhost:2'], 5 * 60, 1, 1)
+    provider._get_without_fallbacks = Mock(side_effect=[Exception('Bad host'), ('ok', {}), ('ok', {})])
+
+    provider._get('test')
+    provider._get('test')
+
+    assert provider._get_without_fallbacks.call_args.args[0] == 'http://localhost:2'
+
+
+def test_not_found_is_not_host_failure():
+    provider = HTTPProvider(['http://localhost:1', 'http://localhost:2'], 5 * 60, 1, 1)
+    provider._get_without_fallbacks = Mock(side_effect=NotOkResponse('Not found', status=404, text='Not found'))
+
+    with pytest.raises(NotOkResponse):
+        provider._get('test')
+
+    for host in provider.hosts:
+        assert provider.hosts_health._get_health(host).error_rate == 0
+
+
+def test_get_async():
+    provider = HTTPProvider(['http://localhost:1'], 5 * 60, 1, 1, max_concurrent_requests=2)
+    provider._get_without_fallbacks = lambda host, endpoint, path_params, query_params: (endpoint, {})
+
+    async def get_all():
+        return await asyncio.gather(provider._get_async('first'), provider._get_async('second'))
+
+    assert asyncio.run(get_all()) == [('first', {}), ('second', {})]
+
+
+def test_max_concurrent_requests():
+    provider = HTTPProvider(['http://localhost:1'], 5 * 60, 1, 1, max_concurrent_requests=2)
+    active, max_active = 0, 0
+    lock = Lock()
+
+    def _simple_get(host, endpoint, *_):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return host, endpoint
+
+    provider._get_without_fallbacks = _simple_get
+    gather(*(lambda: provider._get('test') for _ in range(4)))
+
+    assert max_active == 2
+
+
+class StreamedResponse:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        return iter(self.chunks)
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def test_stream_holds_permit_until_body_is_read():
+    provider = HTTPProvider(['http://localhost:1'], 5 * 60, 1, 1, max_concurrent_requests=1)
+    response = StreamedResponse([b'{"data": [1, ', b'2]}'])
+    provider._get_response_without_fallbacks = Mock(return_value=response)
+
+    items = provider._get_stream('test')
+    assert not provider._requests_semaphore.acquire(blocking=False), "Permit should be held while body is not read"
+
+    assert list(items) == [1, 2]
+    assert response.closed
+    assert provider._requests_semaphore.acquire(blocking=False), "Permit should be released with the response"
+
+
+def test_stream_permit_released_on_close():
+    provider = HTTPProvider(['http://localhost:1'], 5 * 60, 1, 1, max_concurrent_requests=1)
+    response = StreamedResponse([b'{"data": [1, ', b'2]}'])
+    provider._get_response_without_fallbacks = Mock(return_value=response)
+
+    items = provider._get_stream('test')
+    assert next(items) == 1
+    items.close()
+
+    assert response.closed
+    assert provider._requests_semaphore.acquire(blocking=False), "Permit should be released with the response"
+
+
+def test_stream_permit_released_on_close_before_read():
+    provider = HTTPProvider(['http://localhost:1'], 5 * 60, 1, 1, max_concurrent_requests=1)
+    response = StreamedResponse([b'{"data": [1, ', b'2]}'])
+    provider._get_response_without_fallbacks = Mock(return_value=response)
+
+    provider._get_stream('test').close()
+
+    assert response.closed
+    assert provider._requests_semaphore.acquire(blocking=False), "Permit should be released with the response"
+
+
+def test_stream_stages_are_measured():
+    provider = HTTPProvider(['http://localhost:1'], 5 * 60, 1, 1)
+    response = MagicMock()
+    response.iter_content.return_value = [b'{"data": [1, ', b'2]}']
+    provider._get_response_without_fallbacks = Mock(return_value=response)
+
+    with patch('src.providers.http_provider.HTTP_REQUEST_STAGE_DURATION') as stages, \
+            patch('src.providers.http_provider.HTTP_RESPONSE_SIZE') as sizes:
+        assert list(provider._get_stream('test')) == [1, 2]
+
+    assert {c.args[2] for c in stages.labels.call_args_list} == {'transfer', 'decode'}
+    sizes.labels.return_value.observe.assert_called_once_with(16)
+
+
+def test_request_stages_are_measured():
+    provider = HTTPProvider(['http://localhost:1'], 5 * 60, 1, 1)
+    response = MagicMock(status_code=200, content=b'{"data": 1}')
+    response.elapsed.total_seconds.return_value = 0.1
+    response.json.return_value = {'data': 1}
+    provider.session = Mock(get=Mock(return_value=response))
+    provider.PROMETHEUS_HISTOGRAM = MagicMock()
+
+    with patch('src.providers.http_provider.HTTP_REQUEST_STAGE_DURATION') as stages, \
+            patch('src.providers.http_provider.HTTP_RESPONSE_SIZE') as sizes:
+        assert provider._get('test') == (1, {})
+
+    assert [c.args[2] for c in stages.labels.call_args_list] == ['ttfb', 'transfer', 'decode']
+    sizes.labels.return_value.observe.assert_called_once_with(11)
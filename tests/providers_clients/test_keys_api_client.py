@@ -6,6 +6,7 @@ import pytest
 import src.providers.keys.client as keys_api_client_module
 from src import variables
 from src.providers.keys.client import KeysAPIClient, KeysOutdatedException
+from src.providers.keys.store import KeysStore
 from src.variables import KEYS_API_URI
 from tests.factory.blockstamp import ReferenceBlockStampFactory
 
@@ -49,3 +50,113 @@ def test_get_with_blockstamp_retries_exhausted(keys_api_client, monkeypatch):
 
     assert sleep_mock.call_count == variables.HTTP_REQUEST_RETRY_COUNT_KEYS_API - 1
     sleep_mock.assert_called_with(variables.HTTP_REQUEST_SLEEP_BEFORE_RETRY_IN_SECONDS_KEYS_API)
+
+
+def module_response(module_id: int, nonce: int) -> dict:
+    return {'id': module_id, 'nonce': nonce, 'stakingModuleAddress': f'0x{module_id:040x}'}
+
+
+def keys_response(module_id: int, count: int) -> dict:
+    return {
+        'keys': [
+            {
+                'key': f'0x{module_id:02x}{i:094x}',
+                'depositSignature': '0x',
+                'operatorIndex': 0,
+                'used': True,
+                'moduleAddress': f'0x{module_id:040x}',
+            }
+            for i in range(count)
+        ],
+    }
+
+
+class KeysAPIMock:
+    def __init__(self, modules: list[dict], keys: dict[int, dict], block_number: int = 10):
+        self.modules = modules
+        self.keys = keys
+        self.block_number = block_number
+        self.requested_modules: list[int] = []
+
+    def get(self, endpoint, path_params=None, query_params=None):
+        snapshot = {'elBlockSnapshot': {'blockNumber': self.block_number, 'blockHash': '0x'}}
+        if endpoint == KeysAPIClient.MODULES:
+            return self.modules, snapshot
+
+        module_id = path_params[0]
+        self.requested_modules.append(module_id)
+        return self.keys[module_id], {'meta': snapshot}
+
+
+@pytest.fixture()
+def keys_store_client(keys_api_client, tmp_path):
+    keys_api_client.keys_store = KeysStore(tmp_path / 'keys.json')
+    return keys_api_client
+
+
+@pytest.mark.unit
+def test_keys_fetched_only_for_changed_modules(keys_store_client):
+    api = KeysAPIMock([module_response(1, 1), module_response(2, 1)], {1: keys_response(1, 2), 2: keys_response(2, 3)})
+    keys_store_client._get = Mock(side_effect=api.get)
+
+    keys = keys_store_client.get_used_catalist_keys(empty_blockstamp)
+    assert len(keys) == 5
+    assert sorted(api.requested_modules) == [1, 2]
+
+    api.modules = [module_response(1, 1), module_response(2, 2)]
+    api.keys[2] = keys_response(2, 4)
+    api.requested_modules = []
+
+    keys = keys_store_client.get_used_catalist_keys(ReferenceBlockStampFactory.build(block_number=1))
+    assert len(keys) == 6
+    assert api.requested_modules == [2]
+
+
+@pytest.mark.unit
+def test_keys_store_reused_after_restart(keys_store_client, tmp_path):
+    api = KeysAPIMock([module_response(1, 1)], {1: keys_response(1, 2)})
+    keys_store_client._get = Mock(side_effect=api.get)
+    keys = keys_store_client.get_used_catalist_keys(empty_blockstamp)
+
+    restarted_client = KeysAPIClient(KEYS_API_URI, 5 * 60, 5, 5)
+    restarted_client.keys_store = KeysStore(tmp_path / 'keys.json')
+    restarted_client._get = Mock(side_effect=api.get)
+    api.requested_modules = []
+
+    assert restarted_client.get_used_catalist_keys(ReferenceBlockStampFactory.build(block_number=1)) == keys
+    assert not api.requested_modules
+
+
+@pytest.mark.unit
+def test_keys_store_full_resync(keys_store_client):
+    api = KeysAPIMock([module_response(1, 1)], {1: keys_response(1, 2)})
+    keys_store_client._get = Mock(side_effect=api.get)
+    keys_store_client.get_used_catalist_keys(empty_blockstamp)
+
+    api.keys[1] = keys_response(1, 3)
+    api.requested_modules = []
+
+    assert len(keys_store_client.get_used_catalist_keys(empty_blockstamp, full_resync=True)) == 3
+    assert api.requested_modules == [1]
+
+
+@pytest.mark.unit
+def test_keys_downloaded_once_after_status_is_fresh(keys_api_client, monkeypatch):
+    blockstamp = ReferenceBlockStampFactory.build(block_number=10)
+    status_block_numbers = iter([8, 9, 10])
+
+    def get(endpoint, path_params=None, query_params=None):
+        if endpoint == KeysAPIClient.STATUS:
+            snapshot = {'blockNumber': next(status_block_numbers), 'blockHash': '0x'}
+            return {'appVersion': '1', 'chainId': 1, 'elBlockSnapshot': snapshot}, {}
+        return [], {'meta': {'elBlockSnapshot': {'blockNumber': 10}}}
+
+    keys_api_client.poll_status = True
+    keys_api_client._get = Mock(side_effect=get)
+
+    with monkeypatch.context() as m:
+        m.setattr(keys_api_client_module, 'sleep', Mock())
+        keys_api_client.get_used_catalist_keys(blockstamp)
+
+    requested = [call.args[0] for call in keys_api_client._get.call_args_list]
+    assert requested == [KeysAPIClient.STATUS] * 3 + [KeysAPIClient.USED_KEYS]
@@ -0,0 +1,33 @@
+import pytest
+
+from src.providers.consensus.client import ConsensusClient
+from src.providers.consensus.slashings_memo import SlashingsMemo
+
+pytestmark = pytest.mark.unit
+
+
+def test_slashings_memo():
+    memo = SlashingsMemo()
+    assert memo.is_slashed('pubkey', 100) is None
+
+    memo.update('pubkey', 100, False)
+    memo.update('pubkey', 200, True)
+
+    assert memo.is_slashed('pubkey', 50) is False
+    assert memo.is_slashed('pubkey', 100) is False
+    assert memo.is_slashed('pubkey', 150) is None
+    assert memo.is_slashed('pubkey', 200) is True
+    assert memo.is_slashed('pubkey', 300) is True
+
+    memo.update('pubkey', 150, True)
+    memo.update('pubkey', 50, False)
+    assert memo.is_slashed('pubkey', 150) is True
+    assert memo.is_slashed('pubkey', 100) is False
+
+
+def test_slashings_memo_is_kept_by_consensus_client():
+    client = ConsensusClient(['http://localhost'], 5 * 60, 5, 5)
+    other_client = ConsensusClient(['http://localhost'], 5 * 60, 5, 5)
+
+    assert client.get_slashings_memo() is client.get_slashings_memo()
+    assert client.get_slashings_memo() is not other_client.get_slashings_memo()
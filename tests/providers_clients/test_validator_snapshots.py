@@ -0,0 +1,90 @@
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from src.providers.consensus.client import ConsensusClient
+from src.providers.consensus.validator_snapshots import ValidatorSnapshotStore
+from src.providers.consensus.validator_table import ValidatorTable
+from tests.factory.blockstamp import BlockStampFactory
+from tests.factory.no_registry import build_validator
+
+pytestmark = pytest.mark.unit
+
+
+def state_root(i: int) -> str:
+    return '0x' + f'{i:064x}'
+
+
+@pytest.fixture()
+def table() -> ValidatorTable:
+    return ValidatorTable.from_validators([build_validator(index=i, exit_epoch=i) for i in range(10)])
+
+
+def test_snapshot_round_trip(tmp_path, table):
+    store = ValidatorSnapshotStore(tmp_path, 10 * 2**20)
+
+    assert store.load(state_root(1)) is None
+
+    store.save(state_root(1), table)
+    loaded = store.load(state_root(1))
+
+    assert loaded.to_validators() == table.to_validators()
+    assert store.load(state_root(1).upper().replace('0X', '0x')) is not None
+
+
+def test_snapshot_invalid_state_root(tmp_path, table):
+    store = ValidatorSnapshotStore(tmp_path, 10 * 2**20)
+    store.save('../../etc/passwd', table)
+
+    assert store.load('../../etc/passwd') is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_snapshot_corrupted_file(tmp_path, table):
+    store = ValidatorSnapshotStore(tmp_path, 10 * 2**20)
+    store.save(state_root(1), table)
+
+    path = next(tmp_path.iterdir())
+    path.write_bytes(path.read_bytes()[:-1])
+
+    assert store.load(state_root(1)) is None
+    assert not path.exists()
+
+
+def test_snapshot_lru_eviction(tmp_path, table):
+    store = ValidatorSnapshotStore(tmp_path, 10 * 2**20)
+    store.save(state_root(1), table)
+    snapshot_size = next(tmp_path.iterdir()).stat().st_size
+
+    store.max_size_bytes = 2 * snapshot_size
+    store.save(state_root(2), table)
+    os.utime(tmp_path / f'{state_root(1)}.validators', (0, 0))
+    os.utime(tmp_path / f'{state_root(2)}.validators', (1, 1))
+
+    # Snapshot 1 is used, so snapshot 2 is the least recently used one
+    assert store.load(state_root(1)) is not None
+    store.save(state_root(3), table)
+
+    assert store.load(state_root(1)) is not None
+    assert store.load(state_root(2)) is None
+    assert store.load(state_root(3)) is not None
+
+
+def test_consensus_client_uses_snapshots(tmp_path, table):
+    client = ConsensusClient(['http://localhost:1'], 5 * 60, 5, 5)
+    client.validators_snapshots = ValidatorSnapshotStore(tmp_path, 10 * 2**20)
+    client.iter_validators = Mock(return_value=iter(table.to_validators()))
+    blockstamp = BlockStampFactory.build(state_root=state_root(1))
+
+    assert client.get_validators_no_cache(blockstamp) == table.to_validators()
+    client.iter_validators.assert_called_once()
+
+    # Served from disk
+    assert list(client.get_validators(blockstamp)) == table.to_validators()
+    assert len(client.get_validators_table(blockstamp)) == len(table)
+
+    pubkey = table.get_pubkey(3)
+    selected = client.get_validators_no_cache(blockstamp, pub_keys=(pubkey, '5'))
+    assert [v.index for v in selected] == ['3', '5']
+    client.iter_validators.assert_called_once()
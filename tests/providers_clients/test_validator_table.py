@@ -0,0 +1,69 @@
+import io
+
+import pytest
+
+from src.constants import FAR_FUTURE_EPOCH
+from src.providers.consensus.typings import ValidatorStatus
+from src.providers.consensus.validator_table import ValidatorTable
+from tests.factory.no_registry import build_validator
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture()
+def validators():
+    return [
+        build_validator(index=0),
+        build_validator(
+            index=1,
+            balance=0,
+            status=ValidatorStatus.WITHDRAWAL_DONE,
+            withdrawal_credentials='0x00' + 'ab' * 31,
+            effective_balance=0,
+            slashed=True,
+            activation_eligibility_epoch=1,
+            activation_epoch=2,
+            exit_epoch=3,
+            withdrawable_epoch=4,
+        ),
+        build_validator(index=2, exit_epoch=FAR_FUTURE_EPOCH),
+    ]
+
+
+def test_validator_table_round_trip(validators):
+    table = ValidatorTable.from_validators(validators)
+
+    assert len(table) == 3
+    assert table.to_validators() == validators
+    assert table.exit_epoch[2] == FAR_FUTURE_EPOCH
+    assert table.slashed[1] == 1
+    assert table.get_status(1) == ValidatorStatus.WITHDRAWAL_DONE
+    assert table.get_withdrawal_credentials_prefix(0) == 1
+    assert table.get_withdrawal_credentials_prefix(1) == 0
+
+
+def test_validator_table_find_row(validators):
+    table = ValidatorTable.from_validators(validators)
+
+    assert table.find_row(validators[1].validator.pubkey) == 1
+    assert table.find_row(validators[2].validator.pubkey.upper().replace('0X', '0x')) == 2
+    assert table.find_row('0x' + 'ff' * 48) is None
+
+
+def test_validator_table_invalid_pubkey():
+    with pytest.raises(ValueError):
+        ValidatorTable.from_validators([build_validator(pubkey='0x01')])
+
+
+def test_validator_table_dump_load(validators):
+    file = io.BytesIO()
+    ValidatorTable.from_validators(validators).dump(file)
+
+    file.seek(0)
+    assert ValidatorTable.load(file).to_validators() == validators
+
+    with pytest.raises(ValueError):
+        ValidatorTable.load(io.BytesIO(file.getvalue()[:-1]))
+
+    with pytest.raises(ValueError):
+        ValidatorTable.load(io.BytesIO(file.getvalue() + b'\x00'))
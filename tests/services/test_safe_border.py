@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import MagicMock
+from src.providers.consensus.slashings_memo import SlashingsMemo
 from src.services.safe_border import SafeBorder
 from tests.factory.no_registry import ValidatorFactory
 
@@ -115,6 +116,7 @@ def blockstamp():
     ],
 )
 def test_find_earliest_slashed_epoch_rounded_to_frame(
+    monkeypatch,
     validators,
     frame_config,
     chain_config,
@@ -123,13 +125,15 @@ def test_find_earliest_slashed_epoch_rounded_to_frame(
     last_finalized_withdrawal_request_slot,
     expected,
 ):
-    SafeBorder._retrieve_constants = MagicMock()
-    SafeBorder._get_negative_rebase_border_epoch = MagicMock()
-    SafeBorder._get_associated_slashings_border_epoch = MagicMock()
-    SafeBorder._get_last_finalized_withdrawal_request_slot = MagicMock(
-        return_value=last_finalized_withdrawal_request_slot
+    monkeypatch.setattr(SafeBorder, '_retrieve_constants', MagicMock())
+    monkeypatch.setattr(SafeBorder, '_get_negative_rebase_border_epoch', MagicMock())
+    monkeypatch.setattr(SafeBorder, '_get_associated_slashings_border_epoch', MagicMock())
+    monkeypatch.setattr(
+        SafeBorder,
+        '_get_last_finalized_withdrawal_request_slot',
+        MagicMock(return_value=last_finalized_withdrawal_request_slot),
     )
-    SafeBorder._slashings_in_frame = MagicMock(return_value=slashings_in_frame)
+    monkeypatch.setattr(SafeBorder, '_slashings_in_frame', MagicMock(return_value=slashings_in_frame))
 
     web3Mock = MagicMock()
     web3Mock.catalist_contracts = MagicMock()
@@ -139,3 +143,56 @@ def test_find_earliest_slashed_epoch_rounded_to_frame(
     actual = sb._find_earliest_slashed_epoch_rounded_to_frame(validators)
 
     assert expected == actual
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("probes", [1, 2, 3, 4, 7])
+@pytest.mark.parametrize("first_slashed_frame", [20, 21, 22, 23, 30, 40, 45, 46])
+def test_find_earliest_slashed_epoch_probes(
+    monkeypatch, validators, frame_config, chain_config, blockstamp, probes, first_slashed_frame
+):
+    monkeypatch.setattr(SafeBorder, '_retrieve_constants', MagicMock())
+
+    sb = SafeBorder(w3=MagicMock(), blockstamp=blockstamp, chain_config=chain_config, frame_config=frame_config)
+    sb.SLASHINGS_SEARCH_PROBES = probes
+    sb._get_last_finalized_withdrawal_request_slot = MagicMock(return_value=144)
+    sb._slashings_in_frame = MagicMock(side_effect=lambda frame, pubkeys: frame >= first_slashed_frame)
+
+    # Search is in frames [20, 24], the last frame is returned if no slashings found before it
+    expected_frame = min(first_slashed_frame, 24)
+    assert sb._find_earliest_slashed_epoch_rounded_to_frame(validators) == 50 + expected_frame * 2
+
+    frames = [call.args[0] for call in sb._slashings_in_frame.call_args_list]
+    assert len(frames) == len(set(frames))
+
+
+@pytest.mark.unit
+def test_slashings_in_frame_requests_unknown_pubkeys(monkeypatch, validators, frame_config, chain_config, blockstamp):
+    monkeypatch.setattr(SafeBorder, '_retrieve_constants', MagicMock())
+
+    web3Mock = MagicMock()
+    web3Mock.cc.get_slashings_memo = MagicMock(return_value=SlashingsMemo())
+    web3Mock.cc.get_validators_no_cache = MagicMock(return_value=validators)
+    pubkeys = {v.validator.pubkey for v in validators}
+
+    sb = SafeBorder(w3=web3Mock, blockstamp=blockstamp, chain_config=chain_config, frame_config=frame_config)
+    sb._get_blockstamp = MagicMock()
+
+    assert sb._slashings_in_frame(10, pubkeys)
+    web3Mock.cc.get_validators_no_cache.assert_called_once_with(
+        sb._get_blockstamp.return_value, ("pubkey_validator_1", "pubkey_validator_2")
+    )
+
+    # Slashed at the earlier frame means slashed at all the later ones
+    assert sb._slashings_in_frame(12, pubkeys)
+    assert web3Mock.cc.get_validators_no_cache.call_count == 1
+
+    web3Mock.cc.get_validators_no_cache = MagicMock(return_value=[validators[1]])
+    assert not sb._slashings_in_frame(5, pubkeys)
+    web3Mock.cc.get_validators_no_cache.assert_called_once_with(
+        sb._get_blockstamp.return_value, ("pubkey_validator_1",)
+    )
+
+    # Not slashed at the later frame means not slashed at all the earlier ones
+    assert not sb._slashings_in_frame(4, pubkeys)
+    web3Mock.cc.get_validators_no_cache.assert_called_once()
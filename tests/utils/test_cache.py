@@ -1,4 +1,11 @@
-from src.utils.cache import clear_global_cache, global_lru_cache
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from src.utils import cache
+from src.utils.cache import clear_global_cache, estimate_size, global_lru_cache, start_cache_cycle
 
 
 class Calc:
@@ -15,3 +22,125 @@ def test_clear_global_cache():
     clear_global_cache()
 
     assert calc.get.cache_info().currsize == 0
+
+
+class Fetcher:
+    def __init__(self):
+        self.calls = 0
+
+    @global_lru_cache()
+    def get(self, blockstamp):
+        self.calls += 1
+        return [blockstamp] * 10
+
+
+def test_multiple_entries():
+    fetcher = Fetcher()
+    fetcher.get(1)
+    fetcher.get(2)
+    fetcher.get(1)
+    fetcher.get(2)
+
+    assert fetcher.calls == 2
+    assert fetcher.get.cache_info().currsize == 2
+
+
+def test_unused_entries_removed_on_new_cycle():
+    fetcher = Fetcher()
+    fetcher.get(1)
+    fetcher.get(2)
+
+    start_cache_cycle()
+    fetcher.get(2)
+    start_cache_cycle()
+
+    assert fetcher.get.cache_info().currsize == 1
+    fetcher.get(2)
+    assert fetcher.calls == 2
+
+
+def test_least_recently_used_entries_removed_by_size(monkeypatch):
+    clear_global_cache()
+    fetcher = Fetcher()
+    monkeypatch.setattr(cache._registry, 'max_size_bytes', 2 * estimate_size([1] * 10))
+
+    fetcher.get(1)
+    fetcher.get(2)
+    fetcher.get(1)
+    fetcher.get(3)
+
+    assert fetcher.get.cache_info().currsize == 2
+    fetcher.get(1)
+    assert fetcher.calls == 3
+
+    fetcher.get(2)
+    assert fetcher.calls == 4
+
+
+def test_errors_are_not_cached():
+    class Failing:
+        calls = 0
+
+        @global_lru_cache()
+        def get(self):
+            self.calls += 1
+            raise ValueError('Failed')
+
+    failing = Failing()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            failing.get()
+
+    assert failing.calls == 2
+
+
+def test_concurrent_calls_fetch_once():
+    started = Event()
+    release = Event()
+
+    class Slow:
+        calls = 0
+
+        @global_lru_cache()
+        def get(self, blockstamp):
+            self.calls += 1
+            started.set()
+            release.wait(5)
+            return blockstamp
+
+    slow = Slow()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(slow.get, 1)
+        started.wait(5)
+        second = executor.submit(slow.get, 1)
+        release.set()
+
+        assert first.result() == second.result() == 1
+
+    assert slow.calls == 1
+
+
+class Slotted:
+    __slots__ = ('items',)
+
+    def __init__(self, items):
+        self.items = items
+
+
+class Plain:
+    def __init__(self, items):
+        self.items = items
+
+
+class SelfMeasured(Plain):
+    def __sizeof__(self):
+        return 1_000_000
+
+
+def test_estimate_size_walks_instance_attributes():
+    items = ['x' * 1000] * 10
+    payload = estimate_size(items)
+
+    assert estimate_size(Slotted(items)) > payload
+    assert estimate_size(Plain(items)) > payload
+    assert estimate_size(SelfMeasured(items)) == sys.getsizeof(SelfMeasured(items))
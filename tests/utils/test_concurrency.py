@@ -0,0 +1,44 @@
+import time
+from threading import Barrier
+
+import pytest
+
+from src.utils.concurrency import gather
+
+pytestmark = pytest.mark.unit
+
+
+def test_gather_keeps_order():
+    assert gather(lambda: 1, lambda: 2, lambda: 3) == [1, 2, 3]
+    assert gather(lambda: 1) == [1]
+    assert not gather()
+
+
+def test_gather_runs_concurrently():
+    # Deadlocks if calls are executed one by one
+    barrier = Barrier(2, timeout=5)
+    assert gather(barrier.wait, barrier.wait) is not None
+
+
+def test_gather_raises_error():
+    def fail():
+        raise ValueError('Bad call')
+
+    def slow():
+        time.sleep(0.01)
+        return 1
+
+    with pytest.raises(ValueError, match='Bad call'):
+        gather(slow, fail)
+
+
+def test_gather_returns_exceptions():
+    def fail():
+        raise ValueError('Bad call')
+
+    first, second = gather(lambda: 1, fail, return_exceptions=True)
+    assert first == 1
+    assert isinstance(second, ValueError)
+
+    [single] = gather(fail, return_exceptions=True)
+    assert isinstance(single, ValueError)
@@ -162,3 +162,18 @@ def test_dataclass_nested_with_extra_fields():
     )
     hooman = Hooman.from_response(**hooman_response)
     assert hooman == Hooman(favourite_pet=Pet(name="Bob", age=5), pets=[Pet(name="Bob", age=5)])
+
+
+@dataclass(slots=True)
+class SlottedHooman(Nested, FromResponse):
+    favourite_pet: Pet
+    pets: list[Pet]
+
+
+def test_slotted_dataclass_nested_with_extra_fields():
+    hooman = SlottedHooman.from_response(
+        favourite_pet={"name": "Bob", "age": 5}, pets=[{"name": "Bob", "age": 5, "extra": "field"}], extra="field"
+    )
+
+    assert hooman == SlottedHooman(favourite_pet=Pet(name="Bob", age=5), pets=[Pet(name="Bob", age=5)])
+    assert not hasattr(hooman, '__dict__')
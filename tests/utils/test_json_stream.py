@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from src.utils.json_stream import JSONStreamDecodeError, iter_json_array_items
+
+pytestmark = pytest.mark.unit
+
+
+def chunked(body: bytes, size: int) -> list[bytes]:
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+RESPONSE = {
+    'execution_optimistic': False,
+    'finalized': True,
+    'data': [
+        {'index': '1', 'balance': '32000000000', 'status': 'active_ongoing', 'validator': {'pubkey': '0xäbc'}},
+        {'index': '22', 'balance': '0', 'status': 'withdrawal_done', 'validator': {'pubkey': '0x12'}},
+        12345,
+        [1, [2, 3]],
+        'string with "quotes" and , [ ] { }',
+        None,
+    ],
+}
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 10**6])
+def test_iter_json_array_items_chunked(chunk_size):
+    body = json.dumps(RESPONSE, ensure_ascii=False).encode('utf-8')
+    items = list(iter_json_array_items(chunked(body, chunk_size), 'data'))
+    assert items == RESPONSE['data']
+
+
+def test_iter_json_array_items_pretty_printed():
+    body = json.dumps(RESPONSE, indent=4).encode('utf-8')
+    assert list(iter_json_array_items(chunked(body, 5), 'data')) == RESPONSE['data']
+
+
+def test_iter_json_array_items_number_split_between_chunks():
+    assert list(iter_json_array_items([b'{"data": [12', b'34', b']}'], 'data')) == [1234]
+
+
+def test_iter_json_array_items_empty_list():
+    assert list(iter_json_array_items([b'{"data": []}'], 'data')) == []
+
+
+def test_iter_json_array_items_is_lazy():
+    def chunks():
+        yield b'{"data": [1, 2, '
+        raise AssertionError('Stream should not be read further')
+
+    items = iter_json_array_items(chunks(), 'data')
+    assert next(items) == 1
+    assert next(items) == 2
+
+
+@pytest.mark.parametrize(
+    'body',
+    [
+        b'{"data": 1}',
+        b'{"data": {"index": "1"}}',
+        b'{"meta": []}',
+        b'{}',
+        b'[1, 2]',
+        b'{"data": [1, 2',
+        b'{"data": [1 2]}',
+    ],
+)
+def test_iter_json_array_items_invalid(body):
+    with pytest.raises(ValueError):
+        list(iter_json_array_items([body], 'data'))
+
+
+def test_iter_json_array_items_not_a_list():
+    with pytest.raises(JSONStreamDecodeError, match='Expected list response'):
+        list(iter_json_array_items([b'{"data": "string"}'], 'data'))
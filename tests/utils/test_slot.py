@@ -5,8 +5,10 @@ from unittest.mock import Mock
 import pytest
 
 from src.providers.http_provider import NotOkResponse
+from src.typings import SlotNumber
 from src.utils.slot import NoSlotsAvailable, get_first_non_missed_slot
 from tests.conftest import get_blockstamp_by_state
+from tests.factory.blockstamp import build_block_header
 
 
 @pytest.mark.unit
@@ -56,3 +58,62 @@ def test_all_slots_are_missed(web3, consensus_client):
             slot=finalized_blockstamp.ref_slot,
             last_finalized_slot_number=finalized_blockstamp.ref_slot + 50,
         )
+
+
+@pytest.mark.unit
+def test_missed_slots_are_requested_by_windows():
+    existing_slots = {95, 106}
+    requested_slots = []
+
+    def get_block_header(state_id):
+        if isinstance(state_id, str):
+            # Parent root of the 106 slot
+            return build_block_header(95)
+        requested_slots.append(state_id)
+        if state_id in existing_slots:
+            return build_block_header(state_id)
+        raise NotOkResponse("No slots", status=HTTPStatus.NOT_FOUND, text="text")
+
+    cc = Mock(max_concurrent_requests=4)
+    cc.get_block_header = Mock(side_effect=get_block_header)
+
+    get_first_non_missed_slot(cc, slot=SlotNumber(100), last_finalized_slot_number=SlotNumber(120))
+
+    # 100, then [101, 104], [105, 108]
+    assert sorted(requested_slots) == list(range(100, 109))
+    cc.get_blockstamp_details.assert_called_once_with(build_block_header(95).data.root)
+
+
+@pytest.mark.unit
+def test_error_after_existing_slot_in_window_is_ignored():
+    def get_block_header(state_id):
+        if isinstance(state_id, str):
+            # Parent root of the 102 slot
+            return build_block_header(99)
+        if state_id == 102:
+            return build_block_header(102)
+        if state_id == 104:
+            raise NotOkResponse("Internal error", status=HTTPStatus.INTERNAL_SERVER_ERROR, text="text")
+        raise NotOkResponse("No slots", status=HTTPStatus.NOT_FOUND, text="text")
+
+    cc = Mock(max_concurrent_requests=4)
+    cc.get_block_header = Mock(side_effect=get_block_header)
+
+    get_first_non_missed_slot(cc, slot=SlotNumber(100), last_finalized_slot_number=SlotNumber(120))
+    cc.get_blockstamp_details.assert_called_once_with(build_block_header(99).data.root)
+
+
+@pytest.mark.unit
+def test_error_before_existing_slot_in_window_is_raised():
+    def get_block_header(state_id):
+        if state_id == 103:
+            return build_block_header(103)
+        if state_id == 102:
+            raise NotOkResponse("Internal error", status=HTTPStatus.INTERNAL_SERVER_ERROR, text="text")
+        raise NotOkResponse("No slots", status=HTTPStatus.NOT_FOUND, text="text")
+
+    cc = Mock(max_concurrent_requests=4)
+    cc.get_block_header = Mock(side_effect=get_block_header)
+
+    with pytest.raises(NotOkResponse, match="Internal error"):
+        get_first_non_missed_slot(cc, slot=SlotNumber(100), last_finalized_slot_number=SlotNumber(120))
@@ -1,8 +1,9 @@
 from pydantic.class_validators import validator
 import pytest
 
-from src.constants import FAR_FUTURE_EPOCH, EFFECTIVE_BALANCE_INCREMENT
+from src.constants import FAR_FUTURE_EPOCH, EFFECTIVE_BALANCE_INCREMENT, MAX_EFFECTIVE_BALANCE
 from src.providers.consensus.typings import Validator, ValidatorStatus, ValidatorState
+from src.providers.consensus.validator_table import ValidatorTable
 from src.typings import EpochNumber, Gwei
 from src.utils.validator_state import (
     calculate_total_active_effective_balance,
@@ -15,8 +16,12 @@ from src.utils.validator_state import (
     has_eth1_withdrawal_credential,
     is_exited_validator,
     is_active_validator,
+    calculate_table_active_effective_balance_sum,
+    calculate_table_total_active_effective_balance,
+    ValidatorSetStats,
+    WithdrawableBalances,
 )
-from tests.factory.no_registry import ValidatorFactory
+from tests.factory.no_registry import ValidatorFactory, build_validator
 from tests.modules.accounting.bunker.test_bunker_abnormal_cl_rebase import simple_validators
 
 
@@ -289,3 +294,78 @@ class TestCalculateTotalEffectiveBalance:
 
         actual = calculate_total_active_effective_balance(validators, EpochNumber(170256))
         assert actual == Gwei(2000000000)
+
+
+@pytest.fixture()
+def validators_for_table() -> list[Validator]:
+    return [
+        build_validator(index=0, activation_epoch=10),
+        build_validator(index=1, activation_epoch=20, exit_epoch=30),
+        build_validator(index=2, activation_epoch=20, exit_epoch=30, withdrawable_epoch=40),
+        build_validator(index=3, activation_epoch=5, exit_epoch=25, withdrawable_epoch=35, balance=0),
+        build_validator(index=4, balance=MAX_EFFECTIVE_BALANCE + 1),
+        build_validator(index=5, balance=MAX_EFFECTIVE_BALANCE + 1, withdrawal_credentials='0x00' + '00' * 31),
+        build_validator(index=6, activation_epoch=FAR_FUTURE_EPOCH, effective_balance=31 * 10**9),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('epoch', [0, 5, 10, 20, 25, 30, 35, 40, 50])
+def test_validator_table_counterparts(validators_for_table: list[Validator], epoch: EpochNumber):
+    table = ValidatorTable.from_validators(validators_for_table)
+
+    assert calculate_table_active_effective_balance_sum(table, epoch) == calculate_active_effective_balance_sum(
+        validators_for_table, epoch
+    )
+    assert calculate_table_total_active_effective_balance(table, epoch) == calculate_total_active_effective_balance(
+        validators_for_table, epoch
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ('epoch', 'active_validators_count', 'withdrawable_validators_count'),
+    [(0, 2, 1), (5, 3, 1), (10, 4, 1), (20, 6, 1), (25, 5, 1), (30, 3, 1), (35, 3, 1), (40, 3, 2), (50, 3, 2)],
+)
+def test_validator_set_stats(
+    validators_for_table: list[Validator],
+    epoch: EpochNumber,
+    active_validators_count: int,
+    withdrawable_validators_count: int,
+):
+    stats = ValidatorSetStats.from_table(ValidatorTable.from_validators(validators_for_table), epoch)
+
+    assert stats == ValidatorSetStats(
+        max_exit_epoch=EpochNumber(30),
+        max_exit_epoch_validators_count=2,
+        active_validators_count=active_validators_count,
+        withdrawable_validators_count=withdrawable_validators_count,
+    )
+    assert stats.active_validators_count == len([v for v in validators_for_table if is_active_validator(v, epoch)])
+    assert stats.withdrawable_validators_count == len([
+        v for v in validators_for_table
+        if is_partially_withdrawable_validator(v) or is_fully_withdrawable_validator(v, epoch)
+    ])
+
+
+@pytest.mark.unit
+def test_validator_set_stats_without_exiting_validators(validators_for_table: list[Validator]):
+    stats = ValidatorSetStats.from_table(ValidatorTable.from_validators(validators_for_table[:1]), EpochNumber(10))
+    assert (stats.max_exit_epoch, stats.max_exit_epoch_validators_count) == (0, 0)
+
+
+@pytest.mark.unit
+def test_validator_set_stats_empty_table():
+    assert ValidatorSetStats.from_table(ValidatorTable(), EpochNumber(10)) == ValidatorSetStats(EpochNumber(0), 0, 0, 0)
+
+
+@pytest.mark.unit
+def test_withdrawable_balances():
+    balances = WithdrawableBalances.from_balances([(EpochNumber(20), 5), (EpochNumber(10), 1), (EpochNumber(20), 3)])
+
+    assert balances.get_balance(EpochNumber(0)) == 0
+    assert balances.get_balance(EpochNumber(10)) == 1
+    assert balances.get_balance(EpochNumber(19)) == 1
+    assert balances.get_balance(EpochNumber(20)) == 9
+    assert balances.get_balance(EpochNumber(FAR_FUTURE_EPOCH)) == 9
+    assert WithdrawableBalances.from_balances([]).get_balance(EpochNumber(10)) == 0
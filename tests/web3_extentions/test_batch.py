@@ -0,0 +1,143 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+from web3_multi_provider import NoActiveProviderError
+
+from src.web3py.batch import BatchRequest
+from src.web3py.call_store import CallResultsStore
+from src.web3py.extensions import fallback
+from src.web3py.extensions.fallback import FallbackProviderModule
+from src.web3py.middleware import construct_call_store_middleware
+
+pytestmark = pytest.mark.unit
+
+
+BLOCK_HASH = '0x' + 'ab' * 32
+ADDRESSES = ['0x' + '11' * 20, '0x' + '22' * 20]
+
+
+def response(request_id: int, result: str):
+    return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+
+def to_int(value: str) -> int:
+    return int(value, 16)
+
+
+@pytest.fixture()
+def w3():
+    w3 = Mock()
+    w3.middleware_onion = []
+    w3.manager.request_blocking.side_effect = lambda method, params: {ADDRESSES[0]: '0x1', ADDRESSES[1]: '0x2'}[params[0]]
+    return w3
+
+
+def test_requests_sent_in_single_batch(w3):
+    w3.provider.make_batch_request.return_value = [response(0, '0x1'), response(1, '0x2')]
+
+    with BatchRequest(w3) as batch:
+        results = [batch.add('eth_getBalance', [address, BLOCK_HASH], to_int) for address in ADDRESSES]
+
+    assert [result.value for result in results] == [1, 2]
+    w3.provider.make_batch_request.assert_called_once_with([
+        ('eth_getBalance', [ADDRESSES[0], BLOCK_HASH]),
+        ('eth_getBalance', [ADDRESSES[1], BLOCK_HASH]),
+    ])
+    w3.manager.request_blocking.assert_not_called()
+
+
+def test_failed_request_is_sent_on_its_own(w3):
+    w3.provider.make_batch_request.return_value = [
+        response(0, '0x1'),
+        {'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32000, 'message': 'header not found'}},
+    ]
+
+    with BatchRequest(w3) as batch:
+        results = [batch.add('eth_getBalance', [address, BLOCK_HASH], to_int) for address in ADDRESSES]
+
+    assert [result.value for result in results] == [1, 2]
+    w3.manager.request_blocking.assert_called_once_with('eth_getBalance', [ADDRESSES[1], BLOCK_HASH])
+
+
+def test_failed_batch_falls_back_to_single_requests(w3):
+    w3.provider.make_batch_request.side_effect = ValueError('batch requests are not supported')
+
+    with BatchRequest(w3) as batch:
+        results = [batch.add('eth_getBalance', [address, BLOCK_HASH], to_int) for address in ADDRESSES]
+
+    assert [result.value for result in results] == [1, 2]
+    assert w3.manager.request_blocking.call_count == 2
+
+
+def test_stored_responses_are_not_batched(w3, tmp_path):
+    store = CallResultsStore(tmp_path / 'calls.sqlite', 2**20)
+    store.put(store.get_key('eth_getBalance', [ADDRESSES[0], BLOCK_HASH]), response(0, '0x1'))
+    w3.middleware_onion = [construct_call_store_middleware(store)]
+    w3.provider.make_batch_request.return_value = [response(0, '0x2'), response(1, '0x3')]
+    third_address = '0x' + '33' * 20
+    addresses = ADDRESSES + [third_address]
+
+    with BatchRequest(w3) as batch:
+        results = [batch.add('eth_getBalance', [address, BLOCK_HASH], to_int) for address in addresses]
+
+    assert [result.value for result in results] == [1, 2, 3]
+    w3.provider.make_batch_request.assert_called_once_with([
+        ('eth_getBalance', [ADDRESSES[1], BLOCK_HASH]),
+        ('eth_getBalance', [third_address, BLOCK_HASH]),
+    ])
+    assert store.get(store.get_key('eth_getBalance', [third_address, BLOCK_HASH])) == response(1, '0x3')
+
+
+def test_cached_methods_are_not_batched(w3):
+    w3.manager.request_blocking.side_effect = None
+    w3.manager.request_blocking.return_value = '0x1'
+
+    with BatchRequest(w3) as batch:
+        results = [batch.add('eth_chainId', []) for _ in range(2)]
+
+    w3.provider.make_batch_request.assert_not_called()
+    assert [result.value for result in results] == ['0x1', '0x1']
+
+
+def test_provider_without_batches(w3):
+    w3.provider = Mock(spec=['make_request'])
+
+    with BatchRequest(w3) as batch:
+        results = [batch.add('eth_getBalance', [address, BLOCK_HASH]) for address in ADDRESSES]
+
+    w3.manager.request_blocking.assert_not_called()
+    assert [result.value for result in results] == ['0x1', '0x2']
+
+
+def test_provider_responses_ordered_by_request(monkeypatch):
+    provider = Mock(endpoint_uri='http://localhost:8545', decode_rpc_response=json.loads)
+    provider.get_request_kwargs.return_value = {}
+    # Node may respond in any order and skip responses
+    monkeypatch.setattr(fallback, 'make_post_request', Mock(return_value=json.dumps([response(2, '0x3'), response(0, '0x1')])))
+
+    responses = FallbackProviderModule._make_batch_request_with_provider(
+        provider,
+        [('eth_getBalance', [address, BLOCK_HASH]) for address in ADDRESSES + ['0x' + '33' * 20]],
+    )
+
+    assert responses[0] == response(0, '0x1')
+    assert 'error' in responses[1]
+    assert responses[2] == response(2, '0x3')
+
+    payload = json.loads(fallback.make_post_request.call_args.args[1])
+    assert [request['id'] for request in payload] == [0, 1, 2]
+    assert payload[1] == {'jsonrpc': '2.0', 'method': 'eth_getBalance', 'params': [ADDRESSES[1], BLOCK_HASH], 'id': 1}
+
+
+def test_batch_sent_to_next_provider():
+    providers = [Mock(), Mock()]
+    module = Mock(get_all_providers=Mock(return_value=providers))
+    module._make_batch_request_with_provider.side_effect = [ConnectionError(), [response(0, '0x1')]]
+
+    assert FallbackProviderModule.make_batch_request(module, [('eth_chainId', [])]) == [response(0, '0x1')]
+    assert module._make_batch_request_with_provider.call_args.args[0] is providers[1]
+
+    module._make_batch_request_with_provider.side_effect = ConnectionError()
+    with pytest.raises(NoActiveProviderError):
+        FallbackProviderModule.make_batch_request(module, [('eth_chainId', [])])
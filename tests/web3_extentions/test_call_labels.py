@@ -0,0 +1,62 @@
+import pytest
+from web3 import Web3
+
+from src.utils.abi import get_abi_names, load_abi
+from src.web3py.middleware import get_call_labels, get_function_selectors
+
+pytestmark = pytest.mark.unit
+
+
+ADDRESS = '0x' + '11' * 20
+OTHER_ADDRESS = '0x' + '22' * 20
+
+
+def selector(signature: str) -> str:
+    return Web3.keccak(text=signature)[:4].hex()
+
+
+def test_selectors_of_all_contracts():
+    selectors = get_function_selectors()
+
+    assert selectors[selector('getLastProcessingRefSlot()')] == {
+        'AccountingOracle': 'getLastProcessingRefSlot',
+        'ValidatorsExitBusOracle': 'getLastProcessingRefSlot',
+    }
+    assert selectors[selector('getStakingModules()')] == {'StakingRouter': 'getStakingModules'}
+
+    functions = {
+        (abi_name, fn_abi['name'])
+        for abi_name in get_abi_names()
+        for fn_abi in load_abi(abi_name)
+        if fn_abi.get('type') == 'function'
+    }
+    assert {(contract, function) for names in selectors.values() for contract, function in names.items()} == functions
+
+
+def test_call_labels():
+    selectors = get_function_selectors()
+    version = selector('getContractVersion()') + '00' * 32
+    staking_modules = selector('getStakingModules()')
+    contract_names = {ADDRESS: 'AccountingOracle'}
+
+    assert get_call_labels(selectors, 'eth_call', [{'to': ADDRESS, 'data': version}, 'latest'], contract_names) == (
+        'getContractVersion',
+        'AccountingOracle',
+    )
+    # Function of several contracts called by unknown address
+    assert get_call_labels(selectors, 'eth_call', [{'to': OTHER_ADDRESS, 'data': version}, 'latest']) == (
+        'getContractVersion',
+        OTHER_ADDRESS,
+    )
+    # Function of a single contract
+    assert get_call_labels(selectors, 'eth_call', [{'to': OTHER_ADDRESS, 'data': staking_modules}, 'latest']) == (
+        'getStakingModules',
+        'StakingRouter',
+    )
+    assert get_call_labels(selectors, 'eth_call', [{'to': ADDRESS, 'data': '0x12345678'}, 'latest']) == ('', ADDRESS)
+    assert get_call_labels(selectors, 'eth_getBalance', [ADDRESS, 'latest']) == ('', ADDRESS)
+    assert get_call_labels(selectors, 'eth_getBalance', [ADDRESS.upper(), 'latest'], contract_names) == (
+        '',
+        'AccountingOracle',
+    )
+    assert get_call_labels(selectors, 'eth_blockNumber', []) == ('', '')
@@ -0,0 +1,102 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.web3py.call_store import CallResultsStore
+from src.web3py.middleware import construct_call_store_middleware
+
+pytestmark = pytest.mark.unit
+
+
+BLOCK_HASH = '0x' + 'ab' * 32
+
+
+def call_params(data: str, block_identifier=BLOCK_HASH):
+    return [{'to': '0x' + '11' * 20, 'data': data}, block_identifier]
+
+
+def response(result: str):
+    return {'jsonrpc': '2.0', 'id': 1, 'result': result}
+
+
+@pytest.fixture()
+def store(tmp_path):
+    return CallResultsStore(tmp_path / 'calls.sqlite', 2**20)
+
+
+def test_key_requires_block_hash():
+    assert CallResultsStore.get_key('eth_call', call_params('0x01')) is not None
+    assert CallResultsStore.get_key('eth_call', call_params('0x01', {'blockHash': BLOCK_HASH})) is not None
+    assert CallResultsStore.get_key('eth_call', call_params('0x01', 'latest')) is None
+    assert CallResultsStore.get_key('eth_call', call_params('0x01', '0x10')) is None
+    assert CallResultsStore.get_key('eth_call', [call_params('0x01')[0]]) is None
+
+
+def test_key_depends_on_request():
+    keys = {
+        CallResultsStore.get_key('eth_call', call_params('0x01')),
+        CallResultsStore.get_key('eth_call', call_params('0x02')),
+        CallResultsStore.get_key('eth_call', call_params('0x01', '0x' + 'cd' * 32)),
+        CallResultsStore.get_key('eth_getBalance', ['0x' + '11' * 20, BLOCK_HASH]),
+    }
+
+    assert len(keys) == 4
+    assert CallResultsStore.get_key('eth_call', call_params('0x01')) == CallResultsStore.get_key(
+        'eth_call', call_params('0x01', BLOCK_HASH.upper().replace('0X', '0x'))
+    )
+
+
+def test_responses_reused_after_restart(tmp_path, store):
+    key = store.get_key('eth_call', call_params('0x01'))
+    store.put(key, response('0x02'))
+
+    restarted = CallResultsStore(tmp_path / 'calls.sqlite', 2**20)
+
+    assert restarted.get(key) == response('0x02')
+    assert restarted.get(store.get_key('eth_call', call_params('0x03'))) is None
+
+
+def test_least_recently_used_responses_removed(tmp_path):
+    keys = [CallResultsStore.get_key('eth_call', call_params(f'0x0{i}')) for i in range(3)]
+    size = len('{"jsonrpc": "2.0", "id": 1, "result": "0x00"}')
+    store = CallResultsStore(tmp_path / 'calls.sqlite', 2 * size)
+
+    store.put(keys[0], response('0x00'))
+    store.put(keys[1], response('0x01'))
+    store.get(keys[0])
+    store.put(keys[2], response('0x02'))
+
+    assert store.get(keys[0]) is not None
+    assert store.get(keys[1]) is None
+    assert store.get(keys[2]) is not None
+
+
+def test_middleware_sends_request_once(store):
+    make_request = Mock(return_value=response('0x02'))
+    middleware = construct_call_store_middleware(store)(make_request, Mock())
+
+    assert middleware('eth_call', call_params('0x01')) == response('0x02')
+    assert middleware('eth_call', call_params('0x01')) == response('0x02')
+    make_request.assert_called_once()
+
+
+def test_middleware_skips_not_pinned_requests(store):
+    make_request = Mock(return_value=response('0x02'))
+    middleware = construct_call_store_middleware(store)(make_request, Mock())
+
+    middleware('eth_call', call_params('0x01', 'latest'))
+    middleware('eth_call', call_params('0x01', 'latest'))
+    middleware('eth_getCode', ['0x' + '11' * 20, BLOCK_HASH])
+    middleware('eth_getCode', ['0x' + '11' * 20, BLOCK_HASH])
+
+    assert make_request.call_count == 4
+
+
+def test_middleware_does_not_store_errors(store):
+    make_request = Mock(return_value={'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32000, 'message': 'missing trie node'}})
+    middleware = construct_call_store_middleware(store)(make_request, Mock())
+
+    middleware('eth_call', call_params('0x01'))
+    middleware('eth_call', call_params('0x01'))
+
+    assert make_request.call_count == 2
@@ -2,7 +2,12 @@ from unittest.mock import Mock
 
 import pytest
 
-from src.web3py.extensions.catalist_validators import CountOfKeysDiffersException, CatalistValidatorsProvider
+from src.web3py.extensions.catalist_validators import (
+    CatalistValidator,
+    CatalistValidatorIndex,
+    CatalistValidatorsProvider,
+    CountOfKeysDiffersException,
+)
 from tests.factory.blockstamp import ReferenceBlockStampFactory
 from tests.factory.no_registry import (
     CatalistKeyFactory,
@@ -10,6 +15,7 @@ from tests.factory.no_registry import (
     NodeOperatorFactory,
     StakingModuleFactory,
     ValidatorFactory,
+    build_validator,
 )
 
 blockstamp = ReferenceBlockStampFactory.build()
@@ -34,6 +40,25 @@ def test_get_catalist_validators(web3, catalist_validators, contracts):
         assert v.catalist_id.key == v.validator.pubkey
 
 
+@pytest.mark.unit
+def test_merge_validators_with_keys_shares_validator_fields():
+    validators = ValidatorFactory.batch(3)
+    catalist_keys = CatalistKeyFactory.generate_for_validators(validators[1:])
+
+    catalist_validators = CatalistValidatorsProvider.merge_validators_with_keys(catalist_keys, validators)
+
+    assert len(catalist_validators) == 2
+    for validator, key, catalist_validator in zip(validators[1:], catalist_keys, catalist_validators):
+        assert isinstance(catalist_validator, CatalistValidator)
+        assert catalist_validator.catalist_id is key
+        assert catalist_validator.validator is validator.validator
+        assert (catalist_validator.index, catalist_validator.balance, catalist_validator.status) == (
+            validator.index,
+            validator.balance,
+            validator.status,
+        )
+
+
 @pytest.mark.unit
 def test_kapi_has_lesser_keys_than_deposited_validators_count(web3, catalist_validators, contracts):
     validators = ValidatorFactory.batch(10)
@@ -45,6 +70,20 @@ def test_kapi_has_lesser_keys_than_deposited_validators_count(web3, catalist_val
     with pytest.raises(CountOfKeysDiffersException):
         web3.catalist_validators.get_catalist_validators(blockstamp)
 
+    web3.kac.get_used_catalist_keys.assert_called_with(blockstamp, full_resync=True)
+
+
+@pytest.mark.unit
+def test_kapi_keys_are_not_resynced_without_keys_store(web3, catalist_validators, contracts):
+    web3.cc.get_validators = Mock(return_value=ValidatorFactory.batch(10))
+    web3.kac.get_used_catalist_keys = Mock(return_value=[])
+    web3.kac.keys_store = None
+
+    with pytest.raises(CountOfKeysDiffersException):
+        web3.catalist_validators.get_catalist_validators(blockstamp)
+
+    web3.kac.get_used_catalist_keys.assert_called_once_with(blockstamp)
+
 
 @pytest.mark.unit
 def test_get_node_operators(web3, catalist_validators, contracts):
@@ -87,3 +126,30 @@ def test_get_catalist_validators_by_node_operator_inconsistent(web3, caplog):
 
     web3.catalist_validators.get_catalist_validators_by_node_operators(blockstamp)
     assert "not exist in staking router" in caplog.text
+
+
+@pytest.mark.unit
+def test_catalist_validators_index():
+    staking_module = StakingModuleFactory.build(id=1)
+    operators = [NodeOperatorFactory.build(id=i, staking_module=staking_module) for i in range(2)]
+    validators = [
+        CatalistValidator.from_validator(
+            build_validator(index=i),
+            CatalistKeyFactory.build(
+                key='0x' + i.to_bytes(48, 'big').hex(),
+                moduleAddress=staking_module.staking_module_address,
+                operatorIndex=i % 3,
+            ),
+        )
+        for i in range(6)
+    ]
+
+    index = CatalistValidatorIndex(validators, operators)
+
+    assert index.staking_module_ids == {staking_module.staking_module_address: 1}
+    assert index.by_node_operator[(1, 0)] == validators[0::3]
+    assert index.by_node_operator[(1, 1)] == validators[1::3]
+    assert [validator for _, validator in index.unknown_operator_validators] == validators[2::3]
+
+    for validator in validators:
+        assert index.by_pubkey[validator.validator.pubkey] is validator
@@ -0,0 +1,117 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.web3py import multicall as multicall_module
+from src.web3py.multicall import Multicall
+
+pytestmark = pytest.mark.unit
+
+
+BLOCK_HASH = '0x' + 'ab' * 32
+MULTICALL_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+
+
+def contract_function(value):
+    function = Mock()
+    function.address = '0x' + '11' * 20
+    function.args = ()
+    function.kwargs = {}
+    function.call.return_value = value
+    function._encode_transaction_data.return_value = f'0x{value:08x}'
+    return function
+
+
+@pytest.fixture()
+def w3():
+    w3 = Mock()
+    w3.to_checksum_address = lambda address: address
+    return w3
+
+
+@pytest.fixture(autouse=True)
+def decode(monkeypatch):
+    # Return data of the mocked calls is the value itself
+    monkeypatch.setattr(multicall_module, 'decode_contract_function_output', lambda *args: args[4])
+
+
+def aggregate(w3) -> Mock:
+    return w3.eth.contract.return_value.functions.aggregate3
+
+
+def test_disabled_multicall_calls_functions_on_access(w3):
+    functions = [contract_function(1), contract_function(2)]
+
+    with Multicall(w3, BLOCK_HASH, address='') as multicall:
+        results = [multicall.add(function) for function in functions]
+
+    w3.eth.contract.assert_not_called()
+    functions[0].call.assert_not_called()
+
+    assert [result.value for result in results] == [1, 2]
+    functions[0].call.assert_called_once_with(block_identifier=BLOCK_HASH)
+
+
+def test_values_read_in_single_request(w3):
+    functions = [contract_function(1), contract_function(2)]
+    aggregate(w3).return_value.call.return_value = [(True, 1), (True, 2)]
+
+    with Multicall(w3, BLOCK_HASH, address=MULTICALL_ADDRESS) as multicall:
+        results = [multicall.add(function) for function in functions]
+
+    assert [result.value for result in results] == [1, 2]
+    aggregate(w3).assert_called_once_with([
+        (functions[0].address, True, '0x00000001'),
+        (functions[1].address, True, '0x00000002'),
+    ])
+    aggregate(w3).return_value.call.assert_called_once_with(block_identifier=BLOCK_HASH)
+    for function in functions:
+        function.call.assert_not_called()
+
+
+def test_failed_call_is_sent_on_its_own(w3):
+    functions = [contract_function(1), contract_function(2)]
+    aggregate(w3).return_value.call.return_value = [(True, 1), (False, b'')]
+
+    with Multicall(w3, BLOCK_HASH, address=MULTICALL_ADDRESS) as multicall:
+        results = [multicall.add(function) for function in functions]
+
+    assert [result.value for result in results] == [1, 2]
+    functions[0].call.assert_not_called()
+    functions[1].call.assert_called_once_with(block_identifier=BLOCK_HASH)
+
+
+def test_failed_multicall_falls_back_to_single_calls(w3):
+    functions = [contract_function(1), contract_function(2)]
+    aggregate(w3).return_value.call.side_effect = ValueError('execution reverted')
+
+    with Multicall(w3, BLOCK_HASH, address=MULTICALL_ADDRESS) as multicall:
+        results = [multicall.add(function) for function in functions]
+
+    assert [result.value for result in results] == [1, 2]
+    for function in functions:
+        function.call.assert_called_once_with(block_identifier=BLOCK_HASH)
+
+
+def test_calls_split_into_several_requests(w3, monkeypatch):
+    monkeypatch.setattr(Multicall, 'MAX_CALLS_PER_REQUEST', 2)
+    functions = [contract_function(value) for value in range(3)]
+    aggregate(w3).return_value.call.side_effect = [[(True, 0), (True, 1)], [(True, 2)]]
+
+    with Multicall(w3, BLOCK_HASH, address=MULTICALL_ADDRESS) as multicall:
+        results = [multicall.add(function) for function in functions]
+
+    assert [result.value for result in results] == [0, 1, 2]
+    assert aggregate(w3).return_value.call.call_count == 2
+
+
+def test_multicall_not_sent_on_error(w3):
+    functions = [contract_function(1), contract_function(2)]
+
+    with pytest.raises(RuntimeError):
+        with Multicall(w3, BLOCK_HASH, address=MULTICALL_ADDRESS) as multicall:
+            for function in functions:
+                multicall.add(function)
+            raise RuntimeError
+
+    w3.eth.contract.assert_not_called()